@@ -44,6 +44,7 @@ class BasicConfig(metaclass=ConfigMeta):
         self._install_on_no_uninstall_permission = bool(kwargs["install_on_no_uninstall_permission"])
         self._unload_after_install = bool(kwargs["unload_after_install"])
         self._log_indent = int(kwargs.get("log_indent", 0))
+        self._log_async = bool(kwargs.get("log_async", False))
         self._run_imports = set(kwargs["run_imports"])
         self._debug_skip_events = set(kwargs["debug_skip_events"])
         self._run_imports2 = set(kwargs["run_imports2"])
@@ -54,12 +55,16 @@ class BasicConfig(metaclass=ConfigMeta):
         self._require_install_name_match = bool(kwargs.get("require_install_name_match", False))
         self._cmd_clean_file_prefix = str(kwargs["cmd_clean_file_prefix"])
         self._pip_shared_dirs = cast(List[str], kwargs.get("pip_shared_dirs", []))
+        self._pip_batch_install = bool(kwargs.get("pip_batch_install", False))
+        self._pip_wheelhouse = str(kwargs.get("pip_wheelhouse", ""))
+        self._zip_bytecode_cache = bool(kwargs.get("zip_bytecode_cache", False))
 
         # region tool.libre_pythonista.config
         self._cell_cp_prefix = str(kwargs["cell_cp_prefix"])
         self._cell_cp_codename = str(kwargs["cell_cp_codename"])
         self._general_code_name = str(kwargs["general_code_name"])
         self._calc_props_json_name = str(kwargs["calc_props_json_name"])
+        self._calc_cell_index_json_name = str(kwargs.get("calc_cell_index_json_name", "_cell_index.json"))
         self._lp_code_dir = str(kwargs["lp_code_dir"])
         self._lp_default_log_format = str(kwargs["lp_default_log_format"])
         self._macro_lp_sheet_ctl_click = str(kwargs["macro_lp_sheet_ctl_click"])
@@ -285,6 +290,15 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._log_indent
 
+    @property
+    def log_async(self) -> bool:
+        """
+        Gets if log records are written to the log handlers by a background thread.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.log_async)
+        """
+        return self._log_async
+
     @property
     def lo_pip_dir(self) -> str:
         """
@@ -360,6 +374,33 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._pip_shared_dirs
 
+    @property
+    def pip_batch_install(self) -> bool:
+        """
+        Gets if all the packages are installed with a single pip command.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.pip_batch_install)
+        """
+        return self._pip_batch_install
+
+    @property
+    def pip_wheelhouse(self) -> str:
+        """
+        Gets the directory of wheel files that packages are installed from without using the network.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.pip_wheelhouse)
+        """
+        return self._pip_wheelhouse
+
+    @property
+    def zip_bytecode_cache(self) -> bool:
+        """
+        Gets if the zipped python packages of the extension are extracted to a cache so their bytecode is cached.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.zip_bytecode_cache)
+        """
+        return self._zip_bytecode_cache
+
     @property
     def py_pkg_dir(self) -> str:
         """
@@ -516,6 +557,16 @@ class BasicConfig(metaclass=ConfigMeta):
         return self._zipped_preinstall_pure
 
     # region tool.libre_pythonista.config
+    @property
+    def calc_cell_index_json_name(self) -> str:
+        """
+        Gets the name of the file that stores the index of the code cells in the document.
+        This property value is typically prepended with ``general_code_name`` property.
+
+        The value for this property can be set in pyproject.toml (tool.libre_pythonista.config)
+        """
+        return self._calc_cell_index_json_name
+
     @property
     def calc_props_json_name(self) -> str:
         """
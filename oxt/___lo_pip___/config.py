@@ -594,6 +594,15 @@ class Config(metaclass=Singleton):
         """
         return self._basic_config.log_indent
 
+    @property
+    def log_async(self) -> bool:
+        """
+        Gets if log records are written to the log handlers by a background thread.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.log_async)
+        """
+        return self._basic_config.log_async
+
     @property
     def has_locals(self) -> bool:
         """
@@ -829,7 +838,52 @@ class Config(metaclass=Singleton):
         """
         return self._basic_config.pip_shared_dirs
 
+    @property
+    def pip_batch_install(self) -> bool:
+        """
+        Gets if all the packages are installed with a single pip command.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.pip_batch_install)
+        """
+        return self._basic_config.pip_batch_install
+
+    @property
+    def pip_wheelhouse(self) -> str:
+        """
+        Gets the directory of wheel files that packages are installed from without using the network.
+
+        An empty string when not set. ``~`` and environment variables are expanded.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.pip_wheelhouse)
+        """
+        wheelhouse = self._basic_config.pip_wheelhouse
+        if not wheelhouse:
+            return ""
+        return os.path.expandvars(os.path.expanduser(wheelhouse))
+
+    @property
+    def zip_bytecode_cache(self) -> bool:
+        """
+        Gets if the zipped python packages of the extension are extracted to a cache so their bytecode is cached.
+
+        Python can not write bytecode into zip files, when this is ``True`` the zip files are extracted once per
+        extension version to the user profile and the extracted directories are added to ``sys.path``.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.zip_bytecode_cache)
+        """
+        return self._basic_config.zip_bytecode_cache
+
     # region tool.libre_pythonista.config
+    @property
+    def calc_cell_index_json_name(self) -> str:
+        """
+        Gets the name of the file that stores the index of the code cells in the document.
+        This property value is typically prepended with ``general_code_name`` property.
+
+        The value for this property can be set in pyproject.toml (tool.libre_pythonista.config)
+        """
+        return self._basic_config.calc_cell_index_json_name
+
     @property
     def calc_props_json_name(self) -> str:
         """
@@ -4,7 +4,9 @@ import sys
 import shutil
 import subprocess
 import glob
+import contextlib
 import json
+import tempfile
 from pathlib import Path
 from typing import Any, cast, Dict, List, Tuple, Set, Union
 
@@ -20,6 +22,7 @@ from ...ver.rules.ver_rules import VerRules, VerProto
 from ..download import Download
 from ..progress import Progress
 from ..py_packages.packages import Packages
+from .pkg_record import PkgRecord
 from ...settings.install_settings import InstallSettings
 
 
@@ -129,31 +132,7 @@ class InstallPkg:
             self._logger.debug("_install_pkg() %s is in the no install list. Not Installing and continuing.", pkg)
             return True
 
-        auto_target = False
-        if self.config.auto_install_in_site_packages:
-            if self.config.site_packages:
-                auto_target = True
-            else:
-                self._logger.debug(
-                    "auto_install_in_site_packages is set to True; However, No site-packages directory set in configuration. site_packages value should be set in lo_pip.config.py"
-                )
-                self._logger.debug(
-                    "Ignoring auto_install_in_site_packages and continuing to install in user directory via pip --user"
-                )
-        cmd = ["install"]
-        if force:
-            cmd.append("--force-reinstall")
-        elif self.flag_upgrade:
-            cmd.append("--upgrade")
-
-        if not auto_target and self.config.is_win and len(self.config.isolate_windows) > 0:
-            auto_target = True
-
-        if auto_target:
-            cmd.append(f"--target={self._target_path.get_package_target(pkg)}")
-        elif self.config.is_user_installed:
-            cmd.append("--user")
-
+        cmd = self._get_install_args(pkg, force)
         pkg_cmd = f"{pkg}{ver}" if ver else pkg
         cmd = self._cmd_pip(*[*cmd, pkg_cmd])
         self._logger.debug(f"Running command {cmd}")
@@ -177,27 +156,8 @@ class InstallPkg:
             before_files = self._get_file_names(site_packages_dir)
             before_shared = self._get_pip_shared_files(pkg)
 
-        progress: Union[Progress, None] = None
-        if self._config.show_progress and self.show_progress:
-            # display a terminal window to show progress
-            self._logger.debug("Starting Progress Window")
-            msg = self.resource_resolver.resolve_string("msg08")
-            title = self.resource_resolver.resolve_string("title01") or self.config.lo_implementation_name
-            progress = Progress(start_msg=f"{msg}: {pkg}", title=title)
-            progress.start()
-        else:
-            self._logger.debug("Progress Window is disabled")
-
-        process = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            encoding="utf-8",
-            errors="replace",
-            text=True,
-            env=self._get_env(),
-            startupinfo=STARTUP_INFO,
-        )
+        progress = self._start_progress(pkg)
+        process = self._run_pip(cmd)
 
         result = False
         if process.returncode == 0:
@@ -230,6 +190,187 @@ class InstallPkg:
 
         return result
 
+    def _install_pkgs(self, pkgs: List[Tuple[str, str]], force: bool) -> bool:
+        """
+        Installs packages with a single pip command for each install target.
+
+        Pip resolves the requirements of all the packages together. The files each package owns are read from the
+        ``RECORD`` files of the installed distributions instead of comparing the directory before and after.
+
+        Args:
+            pkgs (List[Tuple[str, str]]): Package names and versions, such as ``("numpy", ">=1.26")``.
+            force (bool): Force install even if packages are already installed.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        groups: Dict[Tuple[str, ...], List[Tuple[str, str]]] = {}
+        for pkg, ver in pkgs:
+            if pkg in self.no_pip_install:
+                self._logger.debug("_install_pkgs() %s is in the no install list. Not Installing and continuing.", pkg)
+                continue
+            groups.setdefault(tuple(self._get_install_args(pkg, force)), []).append((pkg, ver))
+
+        result = True
+        for args, items in groups.items():
+            if not args:
+                result = False
+                continue
+            result = self._install_pkg_group(list(args), items) and result
+        return result
+
+    def _install_pkg_group(self, args: List[str], pkgs: List[Tuple[str, str]]) -> bool:
+        """
+        Installs packages that have the same pip install options with a single pip command.
+
+        Args:
+            args (List[str]): Pip install options, see ``_get_install_args()``.
+            pkgs (List[Tuple[str, str]]): Package names and versions.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        pkg_cmds = [f"{pkg}{ver}" if ver else pkg for pkg, ver in pkgs]
+        names = ", ".join(pkg for pkg, _ in pkgs)
+        site_packages_dir = self._get_site_packages_dir(pkgs[0][0])
+
+        report_path = ""
+        if PkgRecord.is_report_supported(self.get_package_version("pip")):
+            fd, report_path = tempfile.mkstemp(prefix="lo_pip_report_", suffix=".json")
+            os.close(fd)
+            args = [*args, f"--report={report_path}"]
+
+        cmd = self._cmd_pip(*[*args, *pkg_cmds])
+        self._logger.debug(f"Running command {cmd}")
+        self._logger.info(f"Installing packages {names}")
+
+        # entries that already exist are never removed when a package is uninstalled.
+        existing = PkgRecord.get_snapshot(Path(site_packages_dir), self.config.pip_shared_dirs)
+        progress = self._start_progress(names)
+        try:
+            process = self._run_pip(cmd)
+            result = process.returncode == 0
+            if result:
+                self._save_records(site_packages_dir, pkgs, self._read_report(report_path), existing)
+                self._logger.info(f"Pip Install success for: {' '.join(pkg_cmds)}")
+            else:
+                self._logger.error(f"Pip Install failed for: {' '.join(pkg_cmds)}")
+                try:
+                    self._logger.error(process.stderr)
+                except Exception as err:
+                    self._logger.error("Error decoding stderr: %s", err)
+        finally:
+            if progress:
+                self._logger.debug("Ending Progress Window")
+                progress.kill()
+            if report_path:
+                with contextlib.suppress(OSError):
+                    os.remove(report_path)
+        return result
+
+    def _read_report(self, report_path: str) -> Dict[str, Any]:
+        """Reads a report written by ``pip install --report``, empty if there is no report."""
+        if not report_path:
+            return {}
+        try:
+            with open(report_path, "r", encoding="utf-8") as f:
+                return cast(Dict[str, Any], json.load(f))
+        except Exception as e:
+            self._logger.warning("Unable to read pip report %s: %s", report_path, e)
+            return {}
+
+    def _save_records(self, pth: str, pkgs: List[Tuple[str, str]], report: Dict[str, Any], existing: Set[str]) -> None:
+        """
+        Saves the tracking json files of installed packages from the ``RECORD`` files of the distributions.
+
+        Without a pip report each package only owns its own distribution.
+        ``existing`` are the entries of ``pth`` before the install, see ``PkgRecord.get_snapshot()``.
+        """
+        requested = [pkg for pkg, _ in pkgs if pkg not in self.no_pip_remove]
+        if report:
+            owners = PkgRecord.get_owners(report, requested, exclude=self.no_pip_remove)
+        else:
+            owners = {pkg: [pkg] for pkg in requested}
+        record = PkgRecord(Path(pth), self.config.pip_shared_dirs, existing)
+        for owner, dists in owners.items():
+            try:
+                self._delete_json_file(pth, owner)
+                self._save_tracking(pkg=owner, pth=pth, data=record.get_data(dists))
+            except Exception as e:
+                self._logger.exception("Error saving package records for %s: %s", owner, e)
+
+    def _get_install_args(self, pkg: str, force: bool) -> List[str]:
+        """
+        Gets the pip install command and options for a package, without the package.
+
+        Args:
+            pkg (str): The name of the package to install.
+            force (bool): Force install even if package is already installed.
+
+        Returns:
+            List[str]: Command and options such as ``["install", "--upgrade", "--user"]``.
+            Empty if the package cannot be installed.
+        """
+        auto_target = False
+        if self.config.auto_install_in_site_packages:
+            if self.config.site_packages:
+                auto_target = True
+            else:
+                self._logger.debug(
+                    "auto_install_in_site_packages is set to True; However, No site-packages directory set in configuration. site_packages value should be set in lo_pip.config.py"
+                )
+                self._logger.debug(
+                    "Ignoring auto_install_in_site_packages and continuing to install in user directory via pip --user"
+                )
+        cmd = ["install"]
+        if force:
+            cmd.append("--force-reinstall")
+        elif self.flag_upgrade:
+            cmd.append("--upgrade")
+
+        if not auto_target and self.config.is_win and len(self.config.isolate_windows) > 0:
+            auto_target = True
+
+        if auto_target:
+            cmd.append(f"--target={self._target_path.get_package_target(pkg)}")
+        elif self.config.is_user_installed:
+            cmd.append("--user")
+        cmd.extend(self._get_index_args())
+        return cmd
+
+    def _get_index_args(self) -> List[str]:
+        """Gets the pip options that install from the wheelhouse directory when it is set."""
+        wheelhouse = self.wheelhouse
+        if not wheelhouse:
+            return []
+        return ["--no-index", f"--find-links={wheelhouse}"]
+
+    def _start_progress(self, names: str) -> Union[Progress, None]:
+        """Starts the progress window if it is enabled."""
+        if not (self._config.show_progress and self.show_progress):
+            self._logger.debug("Progress Window is disabled")
+            return None
+        # display a terminal window to show progress
+        self._logger.debug("Starting Progress Window")
+        msg = self.resource_resolver.resolve_string("msg08")
+        title = self.resource_resolver.resolve_string("title01") or self.config.lo_implementation_name
+        progress = Progress(start_msg=f"{msg}: {names}", title=title)
+        progress.start()
+        return progress
+
+    def _run_pip(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """Runs a pip command without a console window."""
+        return subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="utf-8",
+            errors="replace",
+            text=True,
+            env=self._get_env(),
+            startupinfo=STARTUP_INFO,
+        )
+
     def uninstall_pkg(self, pkg: str, target: str = "", remove_tracking_file: bool = False) -> bool:
         """
         Uninstall a package by manually removing its directory and dist-info folder from the target location.
@@ -457,6 +598,8 @@ class InstallPkg:
             return False
 
         result = True
+        # packages that are installed together by _install_pkgs() when pip_batch_install is set.
+        pending: List[Tuple[str, str]] = []
         for name, ver in req.items():
             valid, rules = self._is_valid_version(name, ver, force)
             if force:
@@ -464,7 +607,7 @@ class InstallPkg:
             if valid == 1:
                 continue
 
-            if not self.is_internet:
+            if not self.wheelhouse and not self.is_internet:
                 self._logger.error("No internet connection!")
                 break
 
@@ -498,7 +641,12 @@ class InstallPkg:
                                 e,
                             )
                             return False
+            if self.config.pip_batch_install:
+                pending.append((name, ",".join(ver_lst)))
+                continue
             result = result and self._install_pkg(name, ",".join(ver_lst), force)
+        if pending:
+            result = self._install_pkgs(pending, force) and result
         self._logger.info("Installing packages Done!")
         if is_ext_install:
             self.on_extension_install()
@@ -662,8 +810,8 @@ class InstallPkg:
     def _save_changed(self, pkg: str, pth: str, changes: dict) -> None:
         """Save the new directory names to a JSON file."""
 
-        def _create_json() -> str:
-            """Create a JSON file with the file names."""
+        def _create_data() -> Dict[str, List[str]]:
+            """Create the data with the new file names."""
             after_dirs: List[str] = changes.get("after_dirs", [])
             before_dirs: List[str] = changes.get("before_dirs", [])
 
@@ -676,12 +824,6 @@ class InstallPkg:
             new_dirs = list(set(after_dirs) - set(before_dirs))
             new_files = list(set(after_files) - set(before_files))
 
-            try:
-                pkg_version = self.get_package_version(pkg)
-            except Exception as e:
-                self._logger.error("Error getting package version for '%s': %s", pkg, e)
-                pkg_version = ""
-
             data = {"new_dirs": new_dirs, "new_files": new_files}
 
             for key in before_shared:
@@ -689,6 +831,29 @@ class InstallPkg:
                 after = after_shared[key]
                 new_shared_files = list(after - before)
                 data[f"new_{key}_files"] = new_shared_files
+            return data
+
+        try:
+            self._save_tracking(pkg=pkg, pth=pth, data=_create_data())
+        except Exception as e:
+            self._logger.exception("Error saving new directories and files: %s", e)
+
+    def _save_tracking(self, pkg: str, pth: str, data: Dict[str, List[str]]) -> None:
+        """
+        Saves the tracking JSON file of a package.
+
+        Args:
+            pkg (str): The name of the package.
+            pth (str): The directory the package is installed in.
+            data (Dict[str, List[str]]): The directories and files the package owns.
+        """
+
+        def _create_json() -> str:
+            try:
+                pkg_version = self.get_package_version(pkg)
+            except Exception as e:
+                self._logger.error("Error getting package version for '%s': %s", pkg, e)
+                pkg_version = ""
 
             json_data = {
                 "id": f"{self._config.oxt_name}_pip_pkg",
@@ -815,6 +980,23 @@ class InstallPkg:
             self._is_internet = Download().is_internet
             return self._is_internet
 
+    @property
+    def wheelhouse(self) -> str:
+        """
+        Gets the directory of wheel files that packages are installed from without the network.
+
+        Empty if ``Config.pip_wheelhouse`` is not set or the directory does not exist.
+        """
+        try:
+            return self._wheelhouse
+        except AttributeError:
+            wheelhouse = self._config.pip_wheelhouse
+            if wheelhouse and not os.path.isdir(wheelhouse):
+                self._logger.warning("Wheelhouse directory does not exist: %s. Using the package index.", wheelhouse)
+                wheelhouse = ""
+            self._wheelhouse = wheelhouse
+            return self._wheelhouse
+
     @property
     def python_path(self) -> Path:
         return self._path_python
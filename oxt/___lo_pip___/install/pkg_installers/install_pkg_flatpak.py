@@ -1,6 +1,6 @@
 from __future__ import annotations
 import subprocess
-from typing import Union
+from typing import List, Union
 
 # import pkg_resources
 from ...oxt_logger import OxtLogger
@@ -15,27 +15,24 @@ class InstallPkgFlatpak(InstallPkg):
     def _get_logger(self) -> OxtLogger:
         return OxtLogger(log_name=__name__)
 
-    def _install_pkg(self, pkg: str, ver: str, force: bool) -> bool:
+    def _get_install_args(self, pkg: str, force: bool) -> List[str]:
         """
-        Install a package.
+        Gets the pip install command and options for a package, without the package.
+
+        Packages are always installed in the ``site-packages`` directory of the configuration.
 
         Args:
             pkg (str): The name of the package to install.
-            ver (str): The version of the package to install.
             force (bool): Force install even if package is already installed.
 
         Returns:
-            bool: True if successful, False otherwise.
+            List[str]: Command and options. Empty if there is no ``site-packages`` directory in the configuration.
         """
-        if pkg in self.no_pip_install:
-            self._logger.debug("_install_pkg() %s is in the no install list. Not Installing and continuing.", pkg)
-            return True
-
         if not self.config.site_packages:
             self._logger.error(
                 "No site-packages directory set in configuration. site_packages value should be set in lo_pip.config.py"
             )
-            return False
+            return []
         cmd = ["install"]
         if force:
             cmd.append("--force-reinstall")
@@ -43,6 +40,28 @@ class InstallPkgFlatpak(InstallPkg):
             cmd.append("--upgrade")
 
         cmd.append(f"--target={self.config.site_packages}")
+        cmd.extend(self._get_index_args())
+        return cmd
+
+    def _install_pkg(self, pkg: str, ver: str, force: bool) -> bool:
+        """
+        Install a package.
+
+        Args:
+            pkg (str): The name of the package to install.
+            ver (str): The version of the package to install.
+            force (bool): Force install even if package is already installed.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        if pkg in self.no_pip_install:
+            self._logger.debug("_install_pkg() %s is in the no install list. Not Installing and continuing.", pkg)
+            return True
+
+        cmd = self._get_install_args(pkg, force)
+        if not cmd:
+            return False
 
         pkg_cmd = f"{pkg}{ver}" if ver else pkg
         cmd = self._cmd_pip(*[*cmd, pkg_cmd])
@@ -0,0 +1,300 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+import csv
+import os
+import posixpath
+import re
+
+_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+class PkgRecord:
+    """
+    Gets the files installed by packages from the ``RECORD`` file of their ``dist-info`` directory.
+
+    The result has the same keys as the package tracking json files that are written by ``InstallPkg``,
+    ``new_dirs``, ``new_files`` and ``new_<shared dir>_files`` for each of the pip shared directories.
+
+    ``InstallPkg`` removes every directory of ``new_dirs``, so a top level directory is only recorded when it did not
+    exist before the install and no other distribution owns files in it. The files of other directories, such as
+    namespace directories like ``google``, are recorded one by one in ``new_files``.
+    """
+
+    def __init__(self, target: Path, shared_dirs: Iterable[str], existing: Iterable[str] = ()) -> None:
+        """
+        Constructor
+
+        Args:
+            target (Path): Directory the packages are installed in, such as ``site-packages``.
+            shared_dirs (Iterable[str]): Pip shared directories, such as ``bin``.
+            existing (Iterable[str], optional): Entries of the target directory before the install,
+                see :py:meth:`get_snapshot`. Defaults to ``()``.
+        """
+        self._target = target
+        self._shared_dirs = list(shared_dirs)
+        self._existing = set(existing)
+        self._dist_infos: Optional[Dict[str, Path]] = None
+        self._top_dirs: Dict[str, Set[str]] = {}
+
+    # region Static Methods
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """
+        Normalizes a distribution name so ``Foo.Bar``, ``foo-bar`` and ``foo_bar`` are the same.
+
+        Args:
+            name (str): Distribution name.
+
+        Returns:
+            str: Normalized name.
+        """
+        return re.sub(r"[-_.]+", "_", name).lower()
+
+    @staticmethod
+    def get_requirement_name(requirement: str) -> str:
+        """
+        Gets the distribution name of a requirement such as ``numpy>=1.20; python_version >= "3.9"``.
+
+        Args:
+            requirement (str): Requirement.
+
+        Returns:
+            str: Distribution name or an empty string if the requirement only applies to an extra.
+        """
+        if "extra" in requirement.partition(";")[2]:
+            return ""
+        match = _NAME_RE.match(requirement)
+        return match.group(1) if match else ""
+
+    @staticmethod
+    def get_owners(
+        report: Dict[str, Any], requested: Iterable[str], exclude: Iterable[str] = ()
+    ) -> Dict[str, List[str]]:
+        """
+        Gets the distributions that each requested package owns from a pip installation report.
+
+        A requested package owns its own distribution and the dependencies that were installed only for it.
+        Dependencies that were installed for more than one requested package own themselves so uninstalling one
+        package does not remove the files of another. Installed distributions that no requested package reaches
+        also own themselves so their files are always tracked.
+
+        Args:
+            report (Dict[str, Any]): Report written by ``pip install --report``.
+            requested (Iterable[str]): Names of the requested packages.
+            exclude (Iterable[str], optional): Distributions that are never owned, such as ``pip``.
+
+        Returns:
+            Dict[str, List[str]]: Owner name to distribution names. The owner names of requested packages are the names
+            passed in ``requested``.
+        """
+        excluded = {PkgRecord.normalize_name(name) for name in exclude}
+        installed: Dict[str, List[str]] = {}
+        names: Dict[str, str] = {}
+        for item in report.get("install", []):
+            metadata = item.get("metadata", {})
+            name = str(metadata.get("name", ""))
+            key = PkgRecord.normalize_name(name)
+            if not name or key in excluded:
+                continue
+            names[key] = name
+            deps = [PkgRecord.get_requirement_name(req) for req in metadata.get("requires_dist", None) or []]
+            installed[key] = [PkgRecord.normalize_name(dep) for dep in deps if dep]
+
+        requested_keys = {PkgRecord.normalize_name(name): name for name in requested}
+        requested_keys = {key: name for key, name in requested_keys.items() if key not in excluded}
+
+        def reach(key: str) -> Set[str]:
+            found = {key}
+            stack = [key]
+            while stack:
+                for dep in installed.get(stack.pop(), []):
+                    if dep in installed and dep not in found and dep not in requested_keys:
+                        found.add(dep)
+                        stack.append(dep)
+            return found
+
+        reached = {key: reach(key) for key in requested_keys}
+        counts: Dict[str, int] = {}
+        for keys in reached.values():
+            for key in keys:
+                counts[key] = counts.get(key, 0) + 1
+
+        owners: Dict[str, List[str]] = {}
+        for key, name in requested_keys.items():
+            owned = [k for k in reached[key] if k == key or counts[k] == 1]
+            owners[name] = sorted(names.get(k, requested_keys.get(k, k)) for k in owned)
+        for key, count in counts.items():
+            if count > 1 and key not in requested_keys:
+                owners[names[key]] = [names[key]]
+        # installed for an extra, an unparsed requirement or a dependency that was already installed.
+        for key, name in names.items():
+            if key not in counts:
+                owners[name] = [name]
+        return owners
+
+    @staticmethod
+    def is_report_supported(pip_version: str) -> bool:
+        """
+        Gets if a pip version supports ``pip install --report``, pip ``22.2`` or later.
+
+        Args:
+            pip_version (str): Pip version such as ``24.3.1``.
+
+        Returns:
+            bool: ``True`` if supported.
+        """
+        parts = []
+        for part in pip_version.split(".")[:2]:
+            digits = re.match(r"\d+", part)
+            parts.append(int(digits.group(0)) if digits else 0)
+        while len(parts) < 2:
+            parts.append(0)
+        return (parts[0], parts[1]) >= (22, 2)
+
+    @staticmethod
+    def get_snapshot(target: Path, shared_dirs: Iterable[str]) -> Set[str]:
+        """
+        Gets the entries of a target directory, to be taken before packages are installed in it.
+
+        Args:
+            target (Path): Directory the packages are installed in, such as ``site-packages``.
+            shared_dirs (Iterable[str]): Pip shared directories, such as ``bin``.
+
+        Returns:
+            Set[str]: Names of the top level directories and files,
+            and ``<shared dir>/<name>`` for the files of the shared directories.
+        """
+        if not target.is_dir():
+            return set()
+        result = set(os.listdir(target))
+        for pip_dir in shared_dirs:
+            shared = target / pip_dir
+            if shared.is_dir():
+                result.update(f"{pip_dir}/{name}" for name in os.listdir(shared))
+        return result
+
+    # endregion Static Methods
+
+    def _get_parts(self, entry: str) -> List[str]:
+        """
+        Gets the parts of a ``RECORD`` path relative to the target directory.
+
+        Returns:
+            List[str]: Parts of the path. Starts with ``..`` when the path is outside of the target directory.
+        """
+        return posixpath.normpath(entry.replace("\\", "/")).split("/")
+
+    def _get_top_dirs(self, name: str) -> Set[str]:
+        """Gets the top level directories that a distribution has files in."""
+        key = PkgRecord.normalize_name(name)
+        if key not in self._top_dirs:
+            dirs = set()
+            for entry in self.read_record(name):
+                parts = self._get_parts(entry)
+                if len(parts) > 1 and parts[0] != "..":
+                    dirs.add(parts[0])
+            self._top_dirs[key] = dirs
+        return self._top_dirs[key]
+
+    def _get_other_dirs(self, names: Iterable[str]) -> Set[str]:
+        """Gets the top level directories that other distributions of the target directory have files in."""
+        keys = {PkgRecord.normalize_name(name) for name in names}
+        result: Set[str] = set()
+        for key in self._load_dist_infos():
+            if key not in keys:
+                result.update(self._get_top_dirs(key))
+        return result
+
+    def _load_dist_infos(self) -> Dict[str, Path]:
+        if self._dist_infos is None:
+            self._dist_infos = {}
+            if self._target.is_dir():
+                for pth in self._target.glob("*.dist-info"):
+                    name = pth.name[: -len(".dist-info")].rpartition("-")[0]
+                    self._dist_infos[PkgRecord.normalize_name(name)] = pth
+        return self._dist_infos
+
+    def find_dist_info(self, name: str) -> Optional[Path]:
+        """
+        Finds the ``dist-info`` directory of a distribution in the target directory.
+
+        Args:
+            name (str): Distribution name.
+
+        Returns:
+            Path, None: Path of the directory or ``None`` if the distribution is not installed in the target.
+        """
+        return self._load_dist_infos().get(PkgRecord.normalize_name(name))
+
+    def read_record(self, name: str) -> List[str]:
+        """
+        Reads the paths of the ``RECORD`` file of a distribution.
+
+        Args:
+            name (str): Distribution name.
+
+        Returns:
+            List[str]: Paths relative to the target directory, empty if the distribution has no ``RECORD``.
+        """
+        dist_info = self.find_dist_info(name)
+        if dist_info is None:
+            return []
+        record = dist_info / "RECORD"
+        if not record.is_file():
+            return []
+        with record.open(newline="", encoding="utf-8") as f:
+            return [row[0] for row in csv.reader(f) if row]
+
+    def get_data(self, names: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Gets the top level directories and files installed by distributions.
+
+        Paths outside of the target directory, such as ``../../bin/name``, are only recorded as files of a shared
+        directory when the file is in the shared directory of the target and did not exist before the install.
+
+        Args:
+            names (Iterable[str]): Distribution names.
+
+        Returns:
+            Dict[str, List[str]]: Tracking data with ``new_dirs``, ``new_files`` and ``new_<shared dir>_files`` keys.
+        """
+        names = list(names)
+        other_dirs = self._get_other_dirs(names)
+        dirs: Set[str] = set()
+        files: Set[str] = set()
+        shared: Dict[str, Set[str]] = {pip_dir: set() for pip_dir in self._shared_dirs}
+        for name in names:
+            for entry in self.read_record(name):
+                parts = self._get_parts(entry)
+                if parts[0] == "..":
+                    # scripts and data files of a --target install are moved to the shared directories of the target.
+                    pip_dir = parts[-2] if len(parts) > 2 else ""
+                    if pip_dir in shared and self._is_new_file(pip_dir, parts[-1]):
+                        shared[pip_dir].add(parts[-1])
+                    continue
+                top = parts[0]
+                if top in ("", ".", "__pycache__"):
+                    continue
+                if top in shared:
+                    if len(parts) == 2 and self._is_new_file(top, parts[1]):
+                        shared[top].add(parts[1])
+                elif len(parts) == 1:
+                    files.add(top)
+                elif top not in self._existing and top not in other_dirs:
+                    dirs.add(top)
+                else:
+                    # directory that is shared with other distributions, only its files belong to the distribution.
+                    files.add("/".join(parts))
+        data = {"new_dirs": sorted(dirs), "new_files": sorted(files)}
+        for pip_dir, shared_files in shared.items():
+            data[f"new_{pip_dir}_files"] = sorted(shared_files)
+        return data
+
+    def _is_new_file(self, pip_dir: str, name: str) -> bool:
+        return f"{pip_dir}/{name}" not in self._existing and (self._target / pip_dir / name).is_file()
+
+    @property
+    def target(self) -> Path:
+        """Gets the directory the packages are installed in."""
+        return self._target
@@ -6,6 +6,8 @@ No Internet needed.
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Optional
 import importlib.util
 from importlib.metadata import PackageNotFoundError, version
 
@@ -15,6 +17,7 @@ from ..oxt_logger import OxtLogger
 from ..meta.singleton import Singleton
 from .py_packages.packages import Packages
 from .py_packages.py_package import PyPackage
+from .requirements_manifest import RequirementsManifest
 from ..settings.install_settings import InstallSettings
 
 
@@ -71,10 +74,25 @@ class RequirementsCheck(metaclass=Singleton):
         self._log.debug("All runtime imports are ready.")
         return True
 
+    def _get_manifest(self) -> Optional[RequirementsManifest]:
+        if not self._config.site_packages:
+            return None
+        try:
+            manifest_file = (
+                Path(self._config.site_packages) / f"{self._config.lo_implementation_name}_requirements.json"
+            )
+            return RequirementsManifest(manifest_file)
+        except Exception as e:
+            self._log.debug("Requirements manifest not available: %s", e)
+        return None
+
     def check_requirements(self) -> bool:
         """
         Check requirements that have been set in file ``pyproject.toml`` in the ``tool.oxt.requirements`` section.
 
+        When the requirements are met a manifest of the installed packages is saved. On the next check the
+        manifest is validated with one ``stat`` call per package and the full check only runs if a package changed.
+
         Returns:
             bool: ``True`` if requirements are installed; Otherwise, ``False``.
         """
@@ -85,6 +103,21 @@ class RequirementsCheck(metaclass=Singleton):
                 self._log.debug("Package %s is in the no install list. Not checking and continuing.", pkg)
                 del config_req[pkg]
 
+        pkgs = Packages()
+        manifest = self._get_manifest()
+        manifest_key = ""
+        if manifest is not None:
+            manifest_key = RequirementsManifest.get_key(
+                {
+                    "requirements": config_req,
+                    "packages": pkgs.to_dict(),
+                    "no_install": sorted(install_settings.no_install_packages),
+                }
+            )
+            if manifest.is_valid(manifest_key):
+                self._log.info("Requirements are met. Validated by manifest.")
+                return True
+
         requirements_met = all(self._is_valid_version(name=name, ver=ver) == 0 for name, ver in config_req.items())
         if not requirements_met:
             self._log.error("Requirements not met. Tested config requirements.")
@@ -108,12 +141,19 @@ class RequirementsCheck(metaclass=Singleton):
                 self._log.error(e)
             return False
 
-        pkgs = Packages()
         requirements_met = all(check_installed_valid(pkg) for pkg in pkgs.packages)
         if not requirements_met:
             self._log.info("Requirements not met. Tested py_packages.")
             return False
         self._log.info("Requirements are met")
+        if manifest is not None:
+            names = list(config_req)
+            names.extend(
+                pkg.name
+                for pkg in pkgs.packages
+                if pkg.name not in install_settings.no_install_packages and pkg.name not in config_req
+            )
+            manifest.save(manifest_key, names)
         return True
 
     def _get_package_version(self, package_name: str) -> str:
@@ -0,0 +1,181 @@
+"""
+Manifest of the packages that met the requirements on the last full check.
+
+No Internet needed.
+"""
+
+from __future__ import annotations
+from importlib.metadata import PackageNotFoundError, distribution
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+import hashlib
+import json
+import os
+import sys
+
+from ..oxt_logger import OxtLogger
+
+
+class RequirementsManifest:
+    """
+    Manifest of the packages that met the requirements on the last full check.
+
+    For each package the manifest has the version, the ``dist-info`` directory and its modification time and the
+    site-packages directory the package was found in. The manifest is valid when it was saved for the same
+    requirements and every ``dist-info`` directory still has the same modification time, which only takes one ``stat``
+    call per package instead of a metadata scan of all of ``sys.path``.
+
+    Installing, upgrading or removing a package changes or removes its ``dist-info`` directory so the manifest is no
+    longer valid and the full check runs again.
+    """
+
+    VERSION = 1
+
+    def __init__(self, manifest_file: Path) -> None:
+        """
+        Constructor
+
+        Args:
+            manifest_file (Path): Path of the manifest json file.
+        """
+        self._log = OxtLogger(log_name=__name__)
+        self._manifest_file = manifest_file
+
+    # region Static Methods
+    @staticmethod
+    def get_key(data: Dict[str, Any]) -> str:
+        """
+        Gets the key of the requirements a manifest is saved for.
+
+        Args:
+            data (Dict[str, Any]): Requirements, such as package name to version constraint.
+
+        Returns:
+            str: Hex digest of the requirements and the python version.
+        """
+        key_data = {
+            "manifest": RequirementsManifest.VERSION,
+            "python": list(sys.version_info[:3]),
+            "data": data,
+        }
+        content = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_entry(name: str) -> Optional[Dict[str, Any]]:
+        """
+        Gets the manifest entry of an installed package.
+
+        Args:
+            name (str): The name of the package such as ``verr``.
+
+        Returns:
+            Dict[str, Any], None: Entry with ``version``, ``dist_info``, ``mtime`` and ``site`` keys or ``None`` if the
+            package is not installed or is not installed in a ``dist-info`` directory.
+        """
+        try:
+            dist = distribution(name)
+        except PackageNotFoundError:
+            return None
+        dist_info = getattr(dist, "_path", None)
+        if dist_info is None:
+            return None
+        dist_info = Path(dist_info)
+        if not dist_info.is_dir():
+            return None
+        return {
+            "version": dist.version,
+            "dist_info": str(dist_info),
+            "mtime": dist_info.stat().st_mtime_ns,
+            "site": str(dist_info.parent),
+        }
+
+    # endregion Static Methods
+
+    def _read(self) -> Dict[str, Any]:
+        if not self._manifest_file.is_file():
+            return {}
+        try:
+            with self._manifest_file.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as err:
+            self._log.warning("Unable to read manifest %s: %s", self._manifest_file, err)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def is_valid(self, key: str) -> bool:
+        """
+        Gets if the manifest is valid for requirements.
+
+        Args:
+            key (str): Key of the requirements, see :py:meth:`get_key`.
+
+        Returns:
+            bool: ``True`` if the packages of the manifest have not changed since it was saved; Otherwise, ``False``.
+        """
+        data = self._read()
+        if not data:
+            self._log.debug("No requirements manifest.")
+            return False
+        if data.get("key", "") != key:
+            self._log.debug("Requirements manifest is for other requirements.")
+            return False
+        sys_paths = {os.path.normcase(os.path.normpath(p)) for p in sys.path if p}
+        for name, entry in data.get("packages", {}).items():
+            try:
+                if os.path.normcase(os.path.normpath(entry["site"])) not in sys_paths:
+                    self._log.debug("Requirements manifest site for %s is not in sys.path.", name)
+                    return False
+                if os.stat(entry["dist_info"]).st_mtime_ns != entry["mtime"]:
+                    self._log.debug("Requirements manifest package %s has changed.", name)
+                    return False
+            except Exception:
+                self._log.debug("Requirements manifest package %s is not installed.", name)
+                return False
+        self._log.debug("Requirements manifest is valid.")
+        return True
+
+    def save(self, key: str, names: Iterable[str]) -> bool:
+        """
+        Saves the manifest for requirements.
+
+        Args:
+            key (str): Key of the requirements, see :py:meth:`get_key`.
+            names (Iterable[str]): Names of the packages that met the requirements.
+
+        Returns:
+            bool: ``True`` if saved; Otherwise, ``False``.
+        """
+        packages: Dict[str, Dict[str, Any]] = {}
+        for name in names:
+            entry = RequirementsManifest.get_entry(name)
+            if entry is None:
+                self._log.debug("Package %s has no dist-info. Requirements manifest not saved.", name)
+                self.remove()
+                return False
+            packages[name] = entry
+        try:
+            self._manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._manifest_file.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump({"key": key, "packages": packages}, f, indent=4)
+            os.replace(tmp, self._manifest_file)
+        except Exception as err:
+            self._log.warning("Unable to save manifest %s: %s", self._manifest_file, err)
+            return False
+        self._log.debug("Requirements manifest saved to %s", self._manifest_file)
+        return True
+
+    def remove(self) -> None:
+        """Removes the manifest file if it exists."""
+        try:
+            self._manifest_file.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as err:
+            self._log.warning("Unable to remove manifest %s: %s", self._manifest_file, err)
+
+    @property
+    def manifest_file(self) -> Path:
+        """Gets the path of the manifest json file."""
+        return self._manifest_file
@@ -0,0 +1,108 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Union
+import compileall
+import os
+import shutil
+import zipfile
+
+from ..oxt_logger import OxtLogger
+
+
+class ZipCache:
+    """
+    Extracts the zipped python packages of the extension once so python can cache their bytecode.
+
+    Python imports modules from a zip file on ``sys.path`` but can not write ``.pyc`` files back into it, every start
+    compiles every imported module again. A zip file is extracted to ``<cache_dir>/<version>/<zip name>`` and compiled
+    once, the extracted directory is added to ``sys.path`` instead of the zip file.
+
+    The extracted directory is reused while the version and the size and modification time of the zip file are the
+    same. Directories of other versions are removed.
+    """
+
+    MARKER = ".lo_pip_zip"
+
+    def __init__(self, cache_dir: Union[str, Path], version: str) -> None:
+        """
+        Constructor
+
+        Args:
+            cache_dir (str, Path): Root directory of the extracted zip files.
+            version (str): Extension version, each version has its own directory.
+        """
+        self._log = OxtLogger(log_name=__name__)
+        self._cache_dir = Path(cache_dir)
+        self._version = version or "0"
+        self._version_dir = self._cache_dir / self._version
+
+    @staticmethod
+    def _get_stamp(zip_file: Path) -> str:
+        st = zip_file.stat()
+        return f"{st.st_size}:{st.st_mtime_ns}"
+
+    def _is_valid(self, dest: Path, stamp: str) -> bool:
+        marker = dest / ZipCache.MARKER
+        try:
+            return marker.read_text(encoding="utf-8") == stamp
+        except OSError:
+            return False
+
+    def _extract(self, zip_file: Path, dest: Path, stamp: str) -> None:
+        tmp = dest.with_name(f"{dest.name}.{os.getpid()}.tmp")
+        if tmp.exists():
+            shutil.rmtree(tmp)
+        with zipfile.ZipFile(zip_file) as zf:
+            zf.extractall(tmp)
+        compileall.compile_dir(str(tmp), quiet=1, ddir=str(dest))
+        (tmp / ZipCache.MARKER).write_text(stamp, encoding="utf-8")
+        if dest.exists():
+            shutil.rmtree(dest)
+        os.replace(tmp, dest)
+
+    def get_path(self, zip_file: Union[str, Path]) -> Path:
+        """
+        Gets the path to add to ``sys.path`` for a zip file, the zip file is extracted if it is not already.
+
+        Args:
+            zip_file (str, Path): Zip file of python packages.
+
+        Returns:
+            Path: Extracted directory or ``zip_file`` if it can not be extracted.
+        """
+        zip_file = Path(zip_file)
+        try:
+            stamp = ZipCache._get_stamp(zip_file)
+            dest = self._version_dir / zip_file.stem
+            if self._is_valid(dest, stamp):
+                self._log.debug("Using extracted %s", dest)
+                return dest
+            self._version_dir.mkdir(parents=True, exist_ok=True)
+            self._extract(zip_file, dest, stamp)
+            self._log.debug("Extracted %s to %s", zip_file, dest)
+            return dest
+        except Exception as err:
+            self._log.warning("Unable to extract %s, using zip file: %s", zip_file, err)
+        return zip_file
+
+    def clean(self) -> None:
+        """Removes the directories of other versions."""
+        if not self._cache_dir.is_dir():
+            return
+        for pth in self._cache_dir.iterdir():
+            if pth.is_dir() and pth.name != self._version:
+                try:
+                    shutil.rmtree(pth)
+                    self._log.debug("Removed zip cache %s", pth)
+                except Exception as err:
+                    self._log.warning("Unable to remove zip cache %s: %s", pth, err)
+
+    @property
+    def cache_dir(self) -> Path:
+        """Gets the root directory of the extracted zip files."""
+        return self._cache_dir
+
+    @property
+    def version(self) -> str:
+        """Gets the extension version."""
+        return self._version
@@ -1,10 +1,16 @@
+from __future__ import annotations
+import atexit
+import copy
 import logging
+import queue
 import sys
 import os
 import platform
+import threading
 from logging import Logger
-from logging.handlers import TimedRotatingFileHandler
-from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from contextlib import contextmanager, suppress
+from typing import Callable, Dict, Hashable, List, Sequence, Tuple
 
 # from .. import config
 from .logger_config import LoggerConfig
@@ -15,6 +21,77 @@ from ..basic_config import BasicConfig
 
 _INDENT = 0
 
+# Formatters and handlers are shared by all loggers with the same settings.
+# Log settings do not change while the process is running.
+_LOCK = threading.RLock()
+_FORMATTERS: Dict[Tuple[str, bool], logging.Formatter] = {}
+_HANDLERS: Dict[Hashable, logging.Handler] = {}
+_QUEUE_HANDLERS: Dict[Tuple[int, ...], QueueHandler] = {}
+_LISTENERS: List[QueueListener] = []
+
+
+def _set_indent_str(record: logging.LogRecord) -> None:
+    # records that went through the queue already have the indent of the thread that logged them.
+    if hasattr(record, "indent_str"):
+        return
+    record.indent_str = " " * _INDENT if _INDENT > 0 else ""
+
+
+def _get_formatter(log_format: str, use_indent: bool) -> logging.Formatter:
+    key = (log_format, use_indent)
+    with _LOCK:
+        formatter = _FORMATTERS.get(key)
+        if formatter is None:
+            if use_indent:
+                # "%(asctime)s %(levelname)s: %(indent_str)s%(message)s"
+                formatter = CallbackFormatter(fmt=log_format, callback=_set_indent_str)
+            else:
+                formatter = logging.Formatter(log_format)
+            _FORMATTERS[key] = formatter
+        return formatter
+
+
+def _get_handler(key: Hashable, factory: Callable[[], logging.Handler]) -> logging.Handler:
+    with _LOCK:
+        handler = _HANDLERS.get(key)
+        if handler is None:
+            handler = factory()
+            _HANDLERS[key] = handler
+        return handler
+
+
+def _get_queue_handler(handlers: Sequence[logging.Handler]) -> QueueHandler:
+    """Gets a queue handler that passes records to ``handlers`` on a background thread."""
+    key = tuple(id(h) for h in handlers)
+    with _LOCK:
+        handler = _QUEUE_HANDLERS.get(key)
+        if handler is None:
+            log_queue: queue.Queue = queue.Queue(-1)
+            handler = _OxtQueueHandler(log_queue)
+            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            if not _LISTENERS:
+                atexit.register(stop_listeners)
+            _LISTENERS.append(listener)
+            _QUEUE_HANDLERS[key] = handler
+        return handler
+
+
+def stop_listeners() -> None:
+    """
+    Stops the background log threads.
+
+    Records that are queued are written before the threads stop.
+    Called automatically when the process exits.
+    """
+    with _LOCK:
+        listeners = list(_LISTENERS)
+        _LISTENERS.clear()
+        _QUEUE_HANDLERS.clear()
+    for listener in listeners:
+        with suppress(Exception):
+            listener.stop()
+
 
 class OxtLogger(Logger):
     """Custom Logger Class"""
@@ -40,23 +117,15 @@ class OxtLogger(Logger):
         Returns:
             None: None
         """
-        global _INDENT
         self._config = LoggerConfig()  # config.Config()
         basic_config = BasicConfig()
         self._indent_amt = basic_config.log_indent
-        self._fn_on_callback = self._on_callback
         # no indent for windows or MacOS
         if os.name == "nt" or platform.system().lower() == "darwin":
             # for unknown reasons, the indent is not working on windows. The log and the extension totally fails.
             self._indent_amt = 0
 
-        if self._indent_amt > 0:
-            # "%(asctime)s %(levelname)s: %(indent_str)s%(message)s"
-            self.formatter = CallbackFormatter(
-                fmt=self._config.log_format, callback=self._fn_on_callback
-            )
-        else:
-            self.formatter = logging.Formatter(self._config.log_format)
+        self.formatter = _get_formatter(self._config.log_format, self._indent_amt > 0)
         add_console_logger = kwargs.get("add_console_logger", False)
 
         if not log_file:
@@ -74,25 +143,28 @@ class OxtLogger(Logger):
         # Logger.__init__(self, name=log_name, level=cfg.log_level)
         super().__init__(name=log_name, level=self._config.log_level)
 
-        has_handler = False
+        handlers = []
         has_console_handler = False
 
         if self._log_file and self._config.log_level >= 10:  # DEBUG
-            self.addHandler(self._get_file_handler())
-            has_handler = True
+            handlers.append(self._get_file_handler())
 
         if self._config.log_add_console and self._config.log_level > 0:
-            self.addHandler(self._get_console_handler())
-            has_handler = True
+            handlers.append(self._get_console_handler())
             has_console_handler = True
 
         if not has_console_handler and add_console_logger:
-            self.addHandler(self._get_console_handler())
-            has_handler = True
+            handlers.append(self._get_console_handler())
             has_console_handler = True
 
-        if not has_handler:
+        if not handlers:
             self.addHandler(self._get_null_handler())
+        elif basic_config.log_async:
+            # formatting and writing is done by the background thread of the queue listener.
+            self.addHandler(_get_queue_handler(handlers))
+        else:
+            for handler in handlers:
+                self.addHandler(handler)
 
         # with this pattern, it's rarely necessary to propagate the| error up to parent
         self.propagate = False
@@ -101,24 +173,34 @@ class OxtLogger(Logger):
         if trigger:
             self._config.trigger_log_ready_event()
 
-    def _get_console_handler(self):
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(self.formatter)
-        console_handler.setLevel(self._config.log_level)
-        return console_handler
+    def _get_console_handler(self) -> logging.Handler:
+        def factory() -> logging.Handler:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(self.formatter)
+            console_handler.setLevel(self._config.log_level)
+            return console_handler
 
-    def _get_null_handler(self):
-        return logging.NullHandler()
+        key = ("console", self._config.log_level, id(self.formatter))
+        return _get_handler(key, factory)
 
-    def _get_file_handler(self):
+    def _get_null_handler(self) -> logging.Handler:
+        return _get_handler(("null",), logging.NullHandler)
+
+    def _get_file_handler(self) -> logging.Handler:
         log_file = self._log_file
-        file_handler = TimedRotatingFileHandler(
-            log_file, when="W0", interval=1, backupCount=3, encoding="utf8", delay=True
-        )
-        # file_handler = logging.FileHandler(log_file, mode="w", encoding="utf8", delay=True)
-        file_handler.setFormatter(self.formatter)
-        file_handler.setLevel(self._config.log_level)
-        return file_handler
+
+        def factory() -> logging.Handler:
+            file_handler = TimedRotatingFileHandler(
+                log_file, when="W0", interval=1, backupCount=3, encoding="utf8", delay=True
+            )
+            # file_handler = logging.FileHandler(log_file, mode="w", encoding="utf8", delay=True)
+            file_handler.setFormatter(self.formatter)
+            file_handler.setLevel(self._config.log_level)
+            return file_handler
+
+        # one handler per file, several handlers rotating the same file would clobber each other.
+        key = ("file", log_file)
+        return _get_handler(key, factory)
 
     def debugs(self, *messages: str) -> None:
         """
@@ -134,13 +216,6 @@ class OxtLogger(Logger):
         self.debug("\t".join(data))
         return
 
-    def _on_callback(self, record):
-        if self.current_indent > 0:
-            s = " " * self.current_indent
-        else:
-            s = ""
-        record.indent_str = s
-
     # region Indent
     def _core_indent(self, amount: int):
         """Core functionality for indentation."""
@@ -251,3 +326,28 @@ class CallbackFormatter(logging.Formatter):
 
     # def formatMessage(self, record):
     #     return super().formatMessage(record)
+
+
+class _OxtQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the handlers of the queue listener.
+
+    The message is merged with its args and the indent is captured on the calling thread,
+    everything else is done on the listener thread.
+    """
+
+    _exc_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        _set_indent_str(record)
+        msg = record.getMessage()
+        record = copy.copy(record)
+        record.message = msg
+        record.msg = msg
+        record.args = None
+        if record.exc_info:
+            # exc_info can not be safely used after the exception has been handled on the calling thread.
+            if not record.exc_text:
+                record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
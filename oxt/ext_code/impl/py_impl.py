@@ -35,6 +35,7 @@ if TYPE_CHECKING:
     from oxt.___lo_pip___.oxt_logger.oxt_logger import OxtLogger
     from oxt.___lo_pip___.debug.break_mgr import BreakMgr
     from oxt.pythonpath.libre_pythonista_lib.doc.doc_init import DocInit
+    from oxt.pythonpath.libre_pythonista_lib.doc.recalc_session import RecalcSession
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.cell_item_facade import CellItemFacade
     from oxt.pythonpath.libre_pythonista_lib.event.shared_event import SharedEvent
     from oxt.pythonpath.libre_pythonista_lib.const.event_const import (
@@ -53,6 +54,7 @@ else:
         from ooodev.utils.helper.dot_dict import DotDict
         from ___lo_pip___.debug.break_mgr import BreakMgr
         from libre_pythonista_lib.doc.doc_init import DocInit
+        from libre_pythonista_lib.doc.recalc_session import RecalcSession
         from libre_pythonista_lib.doc.calc.doc.sheet.cell.cell_item_facade import CellItemFacade
         from libre_pythonista_lib.event.shared_event import SharedEvent
         from libre_pythonista_lib.const.event_const import (
@@ -131,49 +133,72 @@ class PyImpl(unohelper.Base, XPy):
                 self._log.error("Error getting current document")
             return None
 
+        # Calc calls pyc once for each formula of a recalculation.
+        # The session groups those calls so per sheet work is done once per recalculation.
+        session = None
+        is_first_sheet_call = True
         try:
-            doc_init = DocInit(doc=doc)  # singleton
-            doc_init.ensure_doc_init()
-            doc_init.ensure_sheet_init(doc.get_sheet(sheet_num - 1))
+            session = RecalcSession(doc)  # singleton
+            session.enter(sheet_num - 1, cell_address)
+            is_first_sheet_call = session.enter_sheet(sheet_num - 1)
         except Exception as e:
-            self._log.exception("Error Init Doc: %s", e)
+            self._log.exception("Error getting recalculation session: %s", e)
 
         try:
-            sheet_idx = sheet_num - 1
-            sheet = doc.sheets[sheet_idx]
-            x_cell = sheet.component.getCellRangeByName(cell_address)
-            cell = sheet.get_cell(x_cell)
-            shared_event = SharedEvent(doc)
-
-            dd = DotDict(sheet=sheet, cell=cell, event_name=PYC_FORMULA_ENTER)
-            eargs = EventArgs(self)
-            eargs.event_data = dd
-            shared_event.trigger_event(PYC_FORMULA_ENTER, eargs)
-
-            ci = CellItemFacade(cell)
-
-            # calling the action method of the matched rule will return the data for the cell and
-
-            is_cells_moved = ci.qry_cells_moved()
-            if is_cells_moved:
-                self._log.debug("cells are moved")
-                return ((None,),)
-
-            if ci.is_source_cell():
-                self._log.debug("pyc - Cell is source cell")
-
-                value = self._do_source_cell(shared_event, ci, cell)
-            else:
-                self._log.debug("pyc - Not a source cell. Creating Default.")
-                value = ci.add_default_control()
-                self._log.debug("pyc - Cell had no code, Created Default with value type: %s", type(value).__name__)
-        except Exception as e:
-            self._log.exception("Error Init CellItem: %s", e)
-
-        self._log.debug("pyc - Doc UID: %s", doc.runtime_uid)
-        result = value
-        self._log.debug("pyc - Done")
-        return result
+            if is_first_sheet_call:
+                try:
+                    doc_init = DocInit(doc=doc)  # singleton
+                    doc_init.ensure_doc_init()
+                    doc_init.ensure_sheet_init(doc.get_sheet(sheet_num - 1))
+                except Exception as e:
+                    self._log.exception("Error Init Doc: %s", e)
+
+            try:
+                sheet_idx = sheet_num - 1
+                sheet = doc.sheets[sheet_idx]
+                x_cell = sheet.component.getCellRangeByName(cell_address)
+                cell = sheet.get_cell(x_cell)
+                shared_event = SharedEvent(doc)
+
+                if is_first_sheet_call:
+                    dd = DotDict(sheet=sheet, cell=cell, event_name=PYC_FORMULA_ENTER)
+                    eargs = EventArgs(self)
+                    eargs.event_data = dd
+                    shared_event.trigger_event(PYC_FORMULA_ENTER, eargs)
+
+                ci = CellItemFacade(cell)
+
+                # calling the action method of the matched rule will return the data for the cell and
+
+                is_cells_moved = ci.qry_cells_moved()
+                if is_cells_moved:
+                    self._log.debug("cells are moved")
+                    return ((None,),)
+
+                if ci.is_source_cell():
+                    self._log.debug("pyc - Cell is source cell")
+                    if session is not None:
+                        # executes the stale cells of the document in module order, once per recalculation.
+                        session.update_stale(ci.py_src_mgr)
+
+                    value = self._do_source_cell(shared_event, ci, cell)
+                else:
+                    self._log.debug("pyc - Not a source cell. Creating Default.")
+                    value = ci.add_default_control()
+                    self._log.debug(
+                        "pyc - Cell had no code, Created Default with value type: %s", type(value).__name__
+                    )
+            except Exception as e:
+                self._log.exception("Error Init CellItem: %s", e)
+
+            self._log.debug("pyc - Doc UID: %s", doc.runtime_uid)
+            result = value
+            self._log.debug("pyc - Done")
+            return result
+        finally:
+            if session is not None:
+                # a slow cell does not end the pass, the time without a call is counted from the end of this one.
+                session.leave()
 
     def _do_source_cell(
         self, shared_event: SharedEvent, ci: CellItemFacade, cell: CalcCell, auto_update: bool = True
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
     from oxt.___lo_pip___.events.lo_events import LoEvents
     from oxt.___lo_pip___.oxt_logger import OxtLogger
     from oxt.pythonpath.libre_pythonista_lib.const.event_const import DOCUMENT_SAVING
+    from oxt.pythonpath.libre_pythonista_lib.cq.cmd.calc.doc.cmd_lp_cell_index import CmdLpCellIndex
     from oxt.pythonpath.libre_pythonista_lib.cq.cmd.calc.doc.cmd_lp_doc_props import CmdLpDocProps
     from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_handler_factory import CmdHandlerFactory
     from oxt.pythonpath.libre_pythonista_lib.cq.cmd.doc.cmd_lp_version import CmdLpVersion
@@ -53,6 +54,7 @@ else:
         from ___lo_pip___.events.args.event_args import EventArgs
         from ___lo_pip___.events.lo_events import LoEvents
         from libre_pythonista_lib.const.event_const import DOCUMENT_SAVING
+        from libre_pythonista_lib.cq.cmd.calc.doc.cmd_lp_cell_index import CmdLpCellIndex
         from libre_pythonista_lib.cq.cmd.calc.doc.cmd_lp_doc_props import CmdLpDocProps
         from libre_pythonista_lib.cq.cmd.cmd_handler_factory import CmdHandlerFactory
         from libre_pythonista_lib.cq.cmd.doc.cmd_lp_version import CmdLpVersion
@@ -175,6 +177,14 @@ class SavingJob(XJob, unohelper.Base):
                     except Exception:
                         self._log.error("Error Updating Extension Location", exc_info=True)
 
+                    try:
+                        # written on save so opening the document does not mark it as modified.
+                        cmd_cell_index = CmdLpCellIndex(doc=doc)
+                        cmd_handler = CmdHandlerFactory.get_cmd_handler()
+                        cmd_handler.handle(cmd_cell_index)
+                    except Exception:
+                        self._log.error("Error Updating Cell Index", exc_info=True)
+
                     se = SharedEvent()
                     eargs = EventArgs(self)
                     eargs.event_data = DotDict(doc=doc)
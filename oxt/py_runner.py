@@ -43,6 +43,7 @@ if TYPE_CHECKING:
     from .___lo_pip___.config import Config
     from .___lo_pip___.install.install_pip import InstallPip
     from .___lo_pip___.lo_util.util import Util
+    from .___lo_pip___.lo_util.zip_cache import ZipCache
     from .___lo_pip___.adapter.top_window_listener import TopWindowListener
     from .___lo_pip___.events.lo_events import LoEvents
     from .___lo_pip___.events.args.event_args import EventArgs
@@ -54,6 +55,7 @@ else:
     from ___lo_pip___.config import Config
     from ___lo_pip___.install.install_pip import InstallPip
     from ___lo_pip___.lo_util.util import Util
+    from ___lo_pip___.lo_util.zip_cache import ZipCache
     from ___lo_pip___.adapter.top_window_listener import TopWindowListener
     from ___lo_pip___.events.lo_events import LoEvents
     from ___lo_pip___.events.args.event_args import EventArgs
@@ -92,6 +94,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
         self.ctx = ctx
         self._user_path = ""
         self._resource_resolver: Union[ResourceResolver, None] = None
+        self._zip_cache: Union[ZipCache, None] = None
         self._is_init = False
         with contextlib.suppress(Exception):
             user_path = self._get_user_profile_path(True, self.ctx)
@@ -185,17 +188,21 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
             return
         self._logger.debug(f"Job event name: {self._job_event_name}")
         try:
+            phase_time = time.time()
             self._add_py_pkgs_to_sys_path()
             self._add_py_req_pkgs_to_sys_path()
             self._add_pure_pkgs_to_sys_path()
+            self._log_ex_time(phase_time, "sys.path setup")
 
             if self._config.log_level < 20:  # Less than INFO
                 self._show_extra_debug_info()
                 # self._config.extension_info.log_extensions(self._logger)
 
+            phase_time = time.time()
             requirements_met = False
             if self._requirements_check.check_requirements() is True and not self._config.has_locals:
                 requirements_met = True
+            self._log_ex_time(phase_time, "requirements check")
 
             if requirements_met:
                 self._logger.debug("Requirements are met. Nothing more to do.")
@@ -207,14 +214,19 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
                 # add package zip file to the sys.path
                 pth = os.path.join(os.path.dirname(__file__), f"{self._config.py_pkg_dir}.zip")
 
-                if os.path.exists(pth) and os.path.isfile(pth) and os.path.getsize(pth) > 0 and pth not in sys.path:
-                    self._logger.debug(f"sys.path appended: {pth}")
-                    sys.path.append(pth)
+                if os.path.exists(pth) and os.path.isfile(pth) and os.path.getsize(pth) > 0:
+                    # same path as _add_py_pkgs_to_sys_path(), the extracted directory when the zip file is cached.
+                    pth = str(self._get_zip_sys_path(Path(pth)))
+                    if pth not in sys.path:
+                        self._logger.debug(f"sys.path appended: {pth}")
+                        sys.path.append(pth)
 
+            phase_time = time.time()
             if not self.has_internet_connection:
                 self._logger.error("No internet connection")
                 with contextlib.suppress(Exception):
                     self._error_msg = self.resource_resolver.resolve_string("msg07")
+            self._log_ex_time(phase_time, "internet check")
 
             if self._delay_start:
 
@@ -341,10 +353,26 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
 
     # region Register/Unregister sys paths
 
+    def _get_zip_sys_path(self, pth: Path) -> Path:
+        """
+        Gets the path to register for a zip file of python packages.
+
+        When ``zip_bytecode_cache`` is set the zip file is extracted once per extension version to the user profile
+        so python can write the bytecode of the modules, otherwise every start compiles the modules again.
+        """
+        if not self._config.zip_bytecode_cache or not self._user_path:
+            return pth
+        if self._zip_cache is None:
+            cache_dir = Path(self._user_path, f"{self._config.lo_implementation_name}_zip_cache")
+            self._zip_cache = ZipCache(cache_dir, self._config.extension_version)
+            self._zip_cache.clean()
+        return self._zip_cache.get_path(pth)
+
     def _add_py_pkgs_to_sys_path(self) -> None:
         pth = Path(os.path.dirname(__file__), f"{self._config.py_pkg_dir}.zip")
         if not pth.exists():
             return
+        pth = self._get_zip_sys_path(pth)
         result = self._session.register_path(pth, True)
         self._log_sys_path_register_result(pth, result)
 
@@ -353,6 +381,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
         if not pth.exists():
             self._logger.debug("pure.zip not found.")
             return
+        pth = self._get_zip_sys_path(pth)
         result = self._session.register_path(pth, True)
         self._log_sys_path_register_result(pth, result)
 
@@ -530,7 +559,10 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
             return
         end_time = time.time()
         total_time = end_time - start_time
-        self._logger.info(f"{self._config.lo_implementation_name} execution time: {total_time:.3f} seconds")
+        if msg:
+            self._logger.info(f"{self._config.lo_implementation_name} {msg} time: {total_time:.3f} seconds")
+        else:
+            self._logger.info(f"{self._config.lo_implementation_name} execution time: {total_time:.3f} seconds")
 
     def _get_user_profile_path(self, as_sys_path: bool = True, ctx: Any = None) -> str:  # noqa: ANN401
         """
@@ -64,6 +64,11 @@ class SheetCacheMgr(LogMixin, EventsPartial):
         EventsPartial.__init__(self)
         self.sheet_cache: MemCache
         self._cache_keys: Dict[str, Set[str]] = {}
+        # event name -> cache keys, so an event only visits the keys registered for it.
+        self._event_keys: Dict[str, Set[str]] = {}
+        self._subscribed: Set[str] = set()
+        self._evictions = 0
+        self._events_handled = 0
         self._sheet = sheet
         se = SharedEvent(sheet.calc_doc)
         se.add_event_observers(self.event_observer)
@@ -79,13 +84,24 @@ class SheetCacheMgr(LogMixin, EventsPartial):
             src (Any): Event source
             event (EventArgs): Event arguments containing event details
         """
-        self.log.debug("_on_event()")
-        for key, event_names in self._cache_keys.items():
-            for event_name in event_names:
-                if event_name != event.event_name:
+        keys = self._event_keys.pop(event.event_name, None)
+        if not keys:
+            return
+        self._events_handled += 1
+        for key in keys:
+            self.sheet_cache.remove(key)
+            self._evictions += 1
+            # the item is gone, the other events of the key no longer need to remove it.
+            for event_name in self._cache_keys.pop(key, ()):
+                if event_name == event.event_name:
                     continue
-                self.sheet_cache.remove(key)
-                self.log.debug("Removed event %s for cache key: %s", event_name, key)
+                event_keys = self._event_keys.get(event_name)
+                if event_keys is not None:
+                    event_keys.discard(key)
+                    if not event_keys:
+                        del self._event_keys[event_name]
+        if self.log.is_debug:
+            self.log.debug("_on_event() Removed %i cache keys for event %s", len(keys), event.event_name)
 
     def register_key(self, key: str, event_name: str) -> None:
         """
@@ -95,12 +111,13 @@ class SheetCacheMgr(LogMixin, EventsPartial):
             key (str): Cache key to register
             event_name (str): Event name that triggers cache clearing
         """
-        if key not in self._cache_keys:
-            self._cache_keys[key] = set()
-        self._cache_keys[key].add(event_name)
-        self.unsubscribe_event(event_name, self._fn_on_event)
-        self.subscribe_event(event_name, self._fn_on_event)
-        self.log.debug("Registered key: %s", key)
+        self._cache_keys.setdefault(key, set()).add(event_name)
+        self._event_keys.setdefault(event_name, set()).add(key)
+        if event_name not in self._subscribed:
+            self.subscribe_event(event_name, self._fn_on_event)
+            self._subscribed.add(event_name)
+        if self.log.is_debug:
+            self.log.debug("Registered key: %s", key)
 
     def unregister_key(self, key: str, event_name: str) -> None:
         """
@@ -110,13 +127,45 @@ class SheetCacheMgr(LogMixin, EventsPartial):
             key (str): Cache key to unregister
             event_name (str): Event name to unregister
         """
-        if key not in self._cache_keys:
+        event_names = self._cache_keys.get(key)
+        if not event_names or event_name not in event_names:
             return
-        self.unsubscribe_event(event_name, self._fn_on_event)
-        self.log.debug("Unregistered key: %s", key)
-        self._cache_keys[key].remove(event_name)
-        if not self._cache_keys[key]:
+        event_names.remove(event_name)
+        if not event_names:
             del self._cache_keys[key]
+        event_keys = self._event_keys.get(event_name)
+        if event_keys is not None:
+            event_keys.discard(key)
+            if not event_keys:
+                del self._event_keys[event_name]
+        self.log.debug("Unregistered key: %s", key)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gets cache statistics for the sheet.
+
+        Returns:
+            Dict[str, int]: Dictionary with ``size``, ``registered_keys``, ``event_names``, ``evictions``
+            and ``events_handled`` keys.
+        """
+        return {
+            "size": len(self.sheet_cache),
+            "registered_keys": len(self._cache_keys),
+            "event_names": len(self._event_keys),
+            "evictions": self._evictions,
+            "events_handled": self._events_handled,
+        }
+
+    # region Properties
+    @property
+    def evictions(self) -> int:
+        """Number of cache items removed by events."""
+        return self._evictions
+
+    @property
+    def size(self) -> int:
+        """Number of items in the sheet cache."""
+        return len(self.sheet_cache)
 
     @property
     def sheet(self) -> CalcSheet:
@@ -127,3 +176,5 @@ class SheetCacheMgr(LogMixin, EventsPartial):
             CalcSheet: The managed sheet
         """
         return self._sheet
+
+    # endregion Properties
@@ -0,0 +1,260 @@
+from __future__ import annotations
+from typing import Any, Dict, Optional, TYPE_CHECKING
+from collections import OrderedDict
+from pathlib import Path
+import hashlib
+import io
+import threading
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
+else:
+    from libre_pythonista_lib.log.log_mixin import LogMixin
+
+    Figure = Any
+
+_INST: Optional[FigCache] = None
+_LOCK = threading.Lock()
+
+
+class FigCache(LogMixin):
+    """
+    Content addressed file cache for the images of Matplotlib figures.
+
+    A figure is rendered in memory, SVG is rendered with a fixed hash salt and without a date so the same figure
+    always gives the same bytes. The file name is the hash of the image, which is the fingerprint of the figure data
+    and properties. A figure that has not changed reuses the existing file instead of writing a new one.
+
+    Figures with more than ``PNG_POINTS`` points are rendered as PNG when the format is ``auto``, large SVG files are
+    slow for Calc to draw. Matplotlib is not thread safe, figures are rendered on the calling thread.
+
+    When the total size of the files is more than ``max_size`` the least recently used files are removed.
+    """
+
+    MAX_SIZE = 50 * 1024 * 1024
+    """Default maximum total size of the cached files in bytes."""
+
+    PNG_POINTS = 10_000
+    """Number of points above which the ``auto`` format renders PNG."""
+
+    FILE_PREFIX = "plt_"
+    FORMATS = ("svg", "png")
+
+    def __init__(self, cache_dir: Path, max_size: int = MAX_SIZE) -> None:
+        """
+        Constructor
+
+        Args:
+            cache_dir (Path): Directory of the cached files, created if it does not exist.
+            max_size (int, optional): Maximum total size of the cached files in bytes. Defaults to ``MAX_SIZE``.
+        """
+        LogMixin.__init__(self)
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        # file name to size, least recently used first.
+        self._files: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load()
+        self.log.debug("Init")
+
+    def _load(self) -> None:
+        """Adds the files of a previous instance, oldest first."""
+        files = [pth for fmt in FigCache.FORMATS for pth in self._cache_dir.glob(f"{FigCache.FILE_PREFIX}*.{fmt}")]
+        files.sort(key=lambda p: p.stat().st_mtime)
+        for pth in files:
+            size = pth.stat().st_size
+            self._files[pth.name] = size
+            self._size += size
+        self._evict()
+
+    def _evict(self, keep: str = "") -> None:
+        while self._size > self._max_size and len(self._files) > 1:
+            name, size = next(iter(self._files.items()))
+            if name == keep:
+                self._files.move_to_end(name)
+                continue
+            del self._files[name]
+            self._size -= size
+            self._evictions += 1
+            try:
+                (self._cache_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+            except Exception:
+                self.log.warning("_evict() Unable to remove %s", name, exc_info=True)
+
+    # region Static Methods
+    @staticmethod
+    def get_point_count(fig: Figure) -> int:
+        """
+        Gets the number of data points drawn by a figure.
+
+        Args:
+            fig (Figure): Matplotlib figure.
+
+        Returns:
+            int: Number of points of the lines, collections and patches of all the axes.
+        """
+        count = 0
+        for ax in fig.get_axes():
+            for line in ax.get_lines():
+                count += len(line.get_xydata())
+            for coll in ax.collections:
+                offsets = coll.get_offsets()
+                count += max(len(offsets), len(coll.get_paths()))
+            count += len(ax.patches)
+        return count
+
+    @staticmethod
+    def get_format(fig: Figure, fmt: str = "auto") -> str:
+        """
+        Gets the image format of a figure.
+
+        Args:
+            fig (Figure): Matplotlib figure.
+            fmt (str, optional): ``auto``, ``svg`` or ``png``. Defaults to ``auto``.
+
+        Returns:
+            str: ``svg`` or ``png``.
+        """
+        fmt = fmt.lower()
+        if fmt in FigCache.FORMATS:
+            return fmt
+        return "png" if FigCache.get_point_count(fig) > FigCache.PNG_POINTS else "svg"
+
+    @staticmethod
+    def render(fig: Figure, fmt: str = "svg", dpi: Optional[int] = None) -> bytes:
+        """
+        Renders a figure.
+
+        Args:
+            fig (Figure): Matplotlib figure.
+            fmt (str, optional): ``svg`` or ``png``. Defaults to ``svg``.
+            dpi (int, optional): Resolution of ``png`` images. Defaults to the dpi of the figure.
+
+        Returns:
+            bytes: Image content, the same figure always gives the same content.
+        """
+        buf = io.BytesIO()
+        if fmt == "png":
+            fig.savefig(buf, format="png", dpi=dpi or "figure")
+        else:
+            _set_svg_salt()
+            fig.savefig(buf, format="svg", metadata={"Date": None})
+        return buf.getvalue()
+
+    @staticmethod
+    def get_fingerprint(content: bytes) -> str:
+        """
+        Gets the fingerprint of image content.
+
+        Args:
+            content (bytes): Image content.
+
+        Returns:
+            str: Hex digest of the content.
+        """
+        return hashlib.sha256(content).hexdigest()[:32]
+
+    # endregion Static Methods
+
+    def get_file(self, fig: Figure, fmt: str = "svg", dpi: Optional[int] = None) -> Path:
+        """
+        Gets the image file of a figure, the file is only written if it is not already cached.
+
+        Args:
+            fig (Figure): Matplotlib figure.
+            fmt (str, optional): ``auto``, ``svg`` or ``png``. Defaults to ``svg``.
+            dpi (int, optional): Resolution of ``png`` images. Defaults to the dpi of the figure.
+
+        Returns:
+            Path: Path of the image file.
+        """
+        fmt = FigCache.get_format(fig, fmt)
+        content = FigCache.render(fig, fmt, dpi)
+        name = f"{FigCache.FILE_PREFIX}{FigCache.get_fingerprint(content)}.{fmt}"
+        pth = self._cache_dir / name
+        with self._lock:
+            if name in self._files and pth.exists():
+                self._files.move_to_end(name)
+                self._hits += 1
+                return pth
+            pth.write_bytes(content)
+            size = len(content)
+            self._size += size - self._files.pop(name, 0)
+            self._files[name] = size
+            self._misses += 1
+            self._evict(keep=name)
+        if self.log.is_debug:
+            self.log.debug("get_file() Wrote %s, %i bytes.", name, size)
+        return pth
+
+    def clear(self) -> None:
+        """Removes all the cached files and resets the counters."""
+        with self._lock:
+            for name in self._files:
+                try:
+                    (self._cache_dir / name).unlink()
+                except FileNotFoundError:
+                    pass
+            self._files.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gets cache statistics.
+
+        Returns:
+            Dict[str, int]: Dictionary with ``files``, ``size``, ``hits``, ``misses`` and ``evictions`` keys.
+        """
+        return {
+            "files": len(self._files),
+            "size": self._size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+    # region Properties
+    @property
+    def cache_dir(self) -> Path:
+        """Directory of the cached files."""
+        return self._cache_dir
+
+    @property
+    def max_size(self) -> int:
+        """Maximum total size of the cached files in bytes."""
+        return self._max_size
+
+    # endregion Properties
+
+
+def _set_svg_salt() -> None:
+    # element ids are random unless a salt is set. rcParams are global, the salt is set once on the rendering
+    # thread instead of changing rcParams with rc_context() on every render.
+    import matplotlib
+
+    if matplotlib.rcParams["svg.hashsalt"] is None:
+        with _LOCK:
+            matplotlib.rcParams["svg.hashsalt"] = "libre_pythonista"
+
+
+def get_fig_cache() -> FigCache:
+    """Gets the figure cache of the LibreOffice temporary directory."""
+    global _INST
+    if _INST is None:
+        with _LOCK:
+            if _INST is None:
+                from ooodev.loader import Lo
+
+                _INST = FigCache(Lo.tmp_dir / "lp_fig")
+    return _INST
@@ -15,6 +15,8 @@ else:
 
 
 class LogCfg(SingletonBase):
+    MAX_LINES = 1000
+    """Default maximum number of lines of the log window."""
 
     def __init__(self) -> None:
         if getattr(self, "_is_init", False):
@@ -129,4 +131,18 @@ class LogCfg(SingletonBase):
         """
         self._cfg["mb_height"] = value
 
+    @property
+    def max_lines(self) -> int:
+        """
+        Gets the maximum number of lines of the log window, older lines are removed.
+        """
+        return max(1, int(self._cfg.get("max_lines", LogCfg.MAX_LINES)))
+
+    @max_lines.setter
+    def max_lines(self, value: int) -> None:
+        """
+        Sets the maximum number of lines of the log window.
+        """
+        self._cfg["max_lines"] = value
+
     # endregion Properties
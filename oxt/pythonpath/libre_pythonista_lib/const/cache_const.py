@@ -16,3 +16,6 @@ DOC_STATE_RULES_DEFAULT = "DocStateRulesDefault"
 DOC_CTX_LOADED = "DocCtxLoaded"
 
 DOC_MOD_STATES_INIT = "DocModStatesInit"
+
+# See libre_pythonista_lib.cq.qry.calc.doc.qry_lp_cell_index.QryLpCellIndex
+DOC_LP_CELL_INDEX = "DocLpCellIndex"
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, List, TYPE_CHECKING, Type, Union
+from typing import Any, Dict, List, Optional, TYPE_CHECKING, Type, Union
 
 
 if TYPE_CHECKING:
@@ -7,7 +7,12 @@ if TYPE_CHECKING:
 
 
 class ArrayRules:
-    """Array Rules Class."""
+    """
+    Array Rules Class.
+
+    Rules are instantiated once and the matched rule is cached by the type of the value,
+    so rules must match on the type of the value only.
+    """
 
     def __init__(self) -> None:
         """
@@ -16,6 +21,8 @@ class ArrayRules:
         if getattr(self, "_is_init", False):
             return
         self._rules: List[Type[ArrayRuleT]] = []
+        self._instances: Optional[List[ArrayRuleT]] = None
+        self._type_cache: Dict[type, Union[ArrayRuleT, None]] = {}
         self._register_known_rules()
 
     def __len__(self) -> int:
@@ -64,6 +71,7 @@ class ArrayRules:
             return
         # self._log.debug(f"add_rule_at() Rule {rule} registered at index {index}.")
         self._rules.insert(index, rule)
+        self._clear_cache()
 
     def remove_rule(self, rule: Type[ArrayRuleT]) -> None:
         """
@@ -77,6 +85,7 @@ class ArrayRules:
         """
         try:
             self._rules.remove(rule)
+            self._clear_cache()
             # self._log.debug(f"remove_rule_at() Rule {rule} removed.")
         except ValueError as e:
             msg = f"{self.__class__.__name__}.unregister_rule() Unable to unregister rule."
@@ -94,6 +103,7 @@ class ArrayRules:
         """
         try:
             del self._rules[index]
+            self._clear_cache()
             # self._log.debug(f"remove_rule_at() Rule at index {index} removed.")
         except IndexError as e:
             msg = f"{self.__class__.__name__}.unregister_rule() Unable to unregister rule."
@@ -102,32 +112,41 @@ class ArrayRules:
 
     def _reg_rule(self, rule: Type[ArrayRuleT]) -> None:
         self._rules.append(rule)
+        self._clear_cache()
+
+    def _clear_cache(self) -> None:
+        self._instances = None
+        self._type_cache.clear()
+
+    def _get_instances(self) -> List[ArrayRuleT]:
+        if self._instances is None:
+            self._instances = [rule() for rule in self._rules]
+        return self._instances
 
     def _register_known_rules(self) -> None:
         return
 
     def get_matched_rule(self, value: Any) -> Union[ArrayRuleT, None]:  # noqa: ANN401
         """
-        Get matched rules
+        Get matched rule
+
+        The rule is resolved once for each type of value and then reused.
 
         Args:
-            mod (types.ModuleType): Module
-            code (str): Code string.
+            value (Any): Value to get the rule for.
 
         Returns:
-            List[ArrayRuleT]: Matched rule. Defaults to ``default_rule`` value.
+            ArrayRuleT, None: Matched rule or None if no rule matches.
         """
-        # is_db = self._log.is_debug
-        # if is_db:
-        #     self._log.debug(f"get_matched_rule() cell: {cell.cell_obj}. Data Type {type(data).__name__}")
+        value_type = type(value)
+        if value_type in self._type_cache:
+            return self._type_cache[value_type]
         result = None
-        for rule in self._rules:
-            inst = rule()
+        for inst in self._get_instances():
             if inst.get_is_match(value):
-                # if is_db:
-                #     self._log.debug(f"get_matched_rule() Rule {inst} matched.")
                 result = inst
                 break
+        self._type_cache[value_type] = result
         return result
 
     # endregion Methods
@@ -5,6 +5,9 @@ from typing import Any, Protocol
 class ArrayRuleT(Protocol):
     """
     A class to represent a Array Rule.
+
+    Rule instances are shared and matched rules are cached by the type of the value,
+    so ``get_is_match()`` must only depend on the type of the value.
     """
 
     def get_is_match(self, value: Any) -> bool: ...  # noqa: ANN401
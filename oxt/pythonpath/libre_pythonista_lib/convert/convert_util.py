@@ -1,11 +1,17 @@
 from __future__ import annotations
-from typing import Union
+from typing import Optional, Union
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 from ooodev.loader import Lo
 
+_SECONDS_PER_DAY = 86400
+
 
 class ConvertUtil:
+    _lo_null_date: Optional[datetime] = None
+    _lo_epoch: Optional[datetime] = None
+
     @staticmethod
     def pandas_timestamp_to_iso8601(timestamp: pd.Timestamp) -> str:
         """
@@ -39,16 +45,21 @@ class ConvertUtil:
         duration = f"P{days}DT{hours}H{minutes}M{seconds}S"
         return duration
 
-    @staticmethod
-    def get_lo_epoch() -> datetime:
+    @classmethod
+    def get_lo_epoch(cls) -> datetime:
         """
         Get the epoch used by LibreOffice Calc.
 
+        The epoch is cached until ``Lo.null_date`` changes.
+
         Returns:
             datetime: The epoch used by LibreOffice Calc.
         """
         nd = Lo.null_date  # contains timezone of utc
-        return datetime(nd.year, nd.month, nd.day)
+        if cls._lo_epoch is None or nd is not cls._lo_null_date:
+            cls._lo_epoch = datetime(nd.year, nd.month, nd.day)
+            cls._lo_null_date = nd
+        return cls._lo_epoch
 
     @classmethod
     def lo_date_to_pandas_timestamp(cls, numeric_date: float) -> pd.Timestamp:
@@ -84,7 +95,10 @@ class ConvertUtil:
         # Base date for LibreOffice Calc
         epoch = cls.get_lo_epoch()  # must not contain tz
         # epoch = datetime(1899, 12, 30)
+        return cls._pandas_to_lo_date(timestamp, epoch)
 
+    @staticmethod
+    def _pandas_to_lo_date(timestamp: Union[pd.Timestamp, datetime], epoch: datetime) -> int:
         # Ensure the timestamp is a datetime object
         if isinstance(timestamp, pd.Timestamp):
             timestamp = timestamp.to_pydatetime()
@@ -94,3 +108,88 @@ class ConvertUtil:
         libreoffice_number = delta.days + delta.seconds / 86400  # 86400 seconds in a day
 
         return round(libreoffice_number)
+
+    @classmethod
+    def pandas_series_to_lo_date(cls, series: pd.Series, epoch: Optional[datetime] = None) -> pd.Series:
+        """
+        Convert a Series of datetime values to LibreOffice Calc numeric dates.
+
+        Vectorized version of :py:meth:`pandas_to_lo_date`.
+        Timezone aware values are converted using their local time without the timezone.
+
+        Args:
+            series (pd.Series): The Series to convert.
+            epoch (datetime, optional): Epoch without timezone. Defaults to :py:meth:`get_lo_epoch`.
+
+        Returns:
+            pd.Series: Series of numeric dates. If the Series contains ``NaT`` then the result is float
+            and ``NaT`` values are ``NaN``; Otherwise, the result is int.
+        """
+        if epoch is None:
+            epoch = cls.get_lo_epoch()
+        if not pd.api.types.is_datetime64_any_dtype(series):
+            return series.apply(lambda value: cls._pandas_to_lo_date(value, epoch))
+        if series.dt.tz is not None:
+            series = series.dt.tz_localize(None)
+        # whole seconds, same as delta.days + delta.seconds in pandas_to_lo_date()
+        values = series.to_numpy().astype("datetime64[s]")
+        days = np.round((values - np.datetime64(epoch, "s")).astype(np.int64) / _SECONDS_PER_DAY)
+        is_nat = np.isnat(values)
+        if is_nat.any():
+            days[is_nat] = np.nan
+        else:
+            days = days.astype(np.int64)
+        return pd.Series(days, index=series.index, name=series.name)
+
+    @classmethod
+    def pandas_series_to_iso8601(cls, series: pd.Series) -> pd.Series:
+        """
+        Convert a Series of datetime values to ISO 8601 strings.
+
+        Vectorized version of :py:meth:`pandas_timestamp_to_iso8601` for timezone naive values without fractional seconds.
+        Other values are converted one at a time.
+
+        Args:
+            series (pd.Series): The Series to convert.
+
+        Returns:
+            pd.Series: Series of ISO 8601 strings.
+        """
+        if pd.api.types.is_datetime64_any_dtype(series) and series.dt.tz is None:
+            values = series.to_numpy()
+            seconds = values.astype("datetime64[s]")
+            if ((values == seconds) | np.isnat(values)).all():
+                return pd.Series(
+                    np.datetime_as_string(seconds, unit="s"), index=series.index, name=series.name, dtype=object
+                )
+        return series.apply(cls.pandas_timestamp_to_iso8601)
+
+    @classmethod
+    def lo_date_series_to_pandas_timestamp(cls, series: pd.Series, epoch: Optional[datetime] = None) -> pd.Series:
+        """
+        Convert a Series of LibreOffice Calc numeric dates to Pandas Timestamps.
+
+        Vectorized version of :py:meth:`lo_date_to_pandas_timestamp`. ``NaN`` values are converted to ``NaT``.
+
+        Args:
+            series (pd.Series): The Series to convert.
+            epoch (datetime, optional): Epoch without timezone. Defaults to :py:meth:`get_lo_epoch`.
+
+        Returns:
+            pd.Series: Series of Pandas Timestamps.
+        """
+        if epoch is None:
+            epoch = cls.get_lo_epoch()
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            # microseconds, same resolution as timedelta(days=numeric_date)
+            micro = np.round(values * (_SECONDS_PER_DAY * 1_000_000))
+            is_nan = np.isnan(micro)
+            if is_nan.any():
+                micro[is_nan] = 0
+            delta = micro.astype(np.int64).astype("timedelta64[us]")
+            result = np.datetime64(epoch, "us") + delta
+            if is_nan.any():
+                result[is_nan] = np.datetime64("NaT")
+            return pd.Series(result, index=series.index, name=series.name)
+        return series.apply(lambda value: pd.Timestamp(epoch + timedelta(days=value)))
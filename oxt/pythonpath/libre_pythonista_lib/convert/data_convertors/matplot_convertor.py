@@ -1,25 +1,25 @@
 """Converts Matplotlib objects to other formats such exporting to SVG, PNG, etc."""
 
 from __future__ import annotations
+from typing import TYPE_CHECKING
 from pathlib import Path
 import uno
-from ooodev.loader import Lo
-
-from ooodev.utils.gen_util import Util as GenUtil
 from matplotlib import pyplot as plt
 
+if TYPE_CHECKING:
+    from oxt.pythonpath.libre_pythonista_lib.cache.fig_cache import get_fig_cache
+else:
+    from libre_pythonista_lib.cache.fig_cache import get_fig_cache
+
 
 def fig_to_svg() -> Path:
     """Converts a Matplotlib figure to SVG format and returns the file path.
 
-    The file is a temporary file of LibreOffice.
+    The file is in the figure cache in the temporary folder of LibreOffice.
+    An unchanged figure returns the same file.
 
     Returns:
         Path: The path to the SVG file.
     """
     # https://stackoverflow.com/questions/24525111/how-can-i-get-the-output-of-a-matplotlib-plot-as-an-svg
-    s = "img_" + GenUtil.generate_random_hex_string(12) + ".svg"
-    tmp_file = Lo.tmp_dir / s
-    fig = plt.show()
-    fig.savefig(str(tmp_file), format="svg")
-    return tmp_file
+    return get_fig_cache().get_file(plt.gcf())
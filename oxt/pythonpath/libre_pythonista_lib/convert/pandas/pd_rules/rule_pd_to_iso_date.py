@@ -23,5 +23,5 @@ class RulePdToIsoDate(RuleBase):
                 # df.iloc[:, col] = df.iloc[:, col].apply(cls.libreoffice_date_to_pandas)
             else:
                 col_name = col
-            df[col_name] = df[col_name].apply(ConvertUtil.pandas_timestamp_to_iso8601)
+            df[col_name] = ConvertUtil.pandas_series_to_iso8601(df[col_name])
         return df
@@ -0,0 +1,83 @@
+from __future__ import annotations
+from typing import Any, Dict, Tuple, TYPE_CHECKING
+
+from ooodev.io.json.doc_json_file import DocJsonFile
+
+if TYPE_CHECKING:
+    from ooodev.calc import CalcDoc
+    from oxt.pythonpath.libre_pythonista_lib.utils.custom_ext import override
+    from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_base import CmdBase
+    from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_cache_t import CmdCacheT
+    from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.doc.qry_lp_cell_index import (
+        QryLpCellIndex,
+        CELL_INDEX_VERSION,
+    )
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan import QryLpCellsScan
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.config.qry_cell_cp_codename import QryCellCpCodeName
+    from oxt.pythonpath.libre_pythonista_lib.const.cache_const import DOC_LP_CELL_INDEX
+    from oxt.pythonpath.libre_pythonista_lib.kind.calc_cmd_kind import CalcCmdKind
+else:
+    from libre_pythonista_lib.utils.custom_ext import override
+    from libre_pythonista_lib.cq.cmd.cmd_base import CmdBase
+    from libre_pythonista_lib.cq.cmd.cmd_cache_t import CmdCacheT
+    from libre_pythonista_lib.log.log_mixin import LogMixin
+    from libre_pythonista_lib.cq.qry.calc.doc.qry_lp_cell_index import QryLpCellIndex, CELL_INDEX_VERSION
+    from libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan import QryLpCellsScan
+    from libre_pythonista_lib.cq.qry.config.qry_cell_cp_codename import QryCellCpCodeName
+    from libre_pythonista_lib.const.cache_const import DOC_LP_CELL_INDEX
+    from libre_pythonista_lib.kind.calc_cmd_kind import CalcCmdKind
+
+
+class CmdLpCellIndex(CmdBase, LogMixin, CmdCacheT):
+    """
+    Writes the index of the code cells into the document.
+
+    The index lets the next open of the document validate the code cells of each sheet instead of reading the
+    custom properties of every cell again. The file is only written when the index has changed.
+    """
+
+    def __init__(self, doc: CalcDoc) -> None:
+        CmdBase.__init__(self)
+        LogMixin.__init__(self)
+        self.kind = CalcCmdKind.SIMPLE_CACHE
+        self._doc = doc
+        self.log.debug("init done for doc %s", doc.runtime_uid)
+
+    def _get_index(self, stored: Dict[str, Any]) -> Dict[str, Any]:
+        filter_key = self._execute_qry(QryCellCpCodeName())
+        result = {}
+        for sheet in self._doc.sheets:
+            name = sheet.name
+            qry = QryLpCellsScan(sheet=sheet, filter_key=filter_key, sheet_index=stored.get(name))
+            _, sheet_index = self._execute_qry(qry)
+            if sheet_index.get("cells"):
+                result[name] = sheet_index
+        return result
+
+    @override
+    def execute(self) -> None:
+        self.success = False
+        try:
+            qry = QryLpCellIndex(self._doc)
+            stored = self._execute_qry(qry)
+            index = self._get_index(stored)
+            if index == stored:
+                self.log.debug("Cell index has not changed.")
+                self.success = True
+                return
+            djf = DocJsonFile(self._doc, "json")
+            djf.write_json(qry.file_name, {"version": CELL_INDEX_VERSION, "sheets": index})
+        except Exception:
+            self.log.exception("Error writing cell index.")
+            return
+        self.log.debug("Successfully executed command.")
+        self.success = True
+
+    @override
+    def undo(self) -> None:
+        self.log.debug("Undo not needed for this command.")
+
+    @property
+    def cache_keys(self) -> Tuple[str, ...]:
+        return (DOC_LP_CELL_INDEX,)
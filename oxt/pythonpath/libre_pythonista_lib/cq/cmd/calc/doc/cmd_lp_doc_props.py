@@ -36,6 +36,7 @@ class CmdLpDocProps(CmdBase, LogMixin, CmdCacheT):
     Set properties in the document.
 
     Ensures that the document json file exists.
+    The json file is not written when the properties are the same as the properties already in the document.
     """
 
     def __init__(self, doc: CalcDoc, props: dict) -> None:
@@ -78,9 +79,15 @@ class CmdLpDocProps(CmdBase, LogMixin, CmdCacheT):
             self.success = True
             return
 
+        self._json_file = json_file
         if self._current_state is NULL_OBJ:
             self._current_state = json_file.read_json(self._file_name)
 
+        if self._current_state == self._props:
+            self.log.debug("Properties have not changed. Nothing to write.")
+            self.success = True
+            return
+
         self.success = False
         try:
             json_file.write_json(file_name=self._file_name, data=self._props)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import cast, List, Tuple, TYPE_CHECKING, Union
+from typing import cast, Dict, List, Tuple, TYPE_CHECKING, Union
 from pathlib import Path
 
 from ooodev.units import UnitMM100
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.sheet.draw_page.qry_shape_by_name import QryShapeByName
     from oxt.pythonpath.libre_pythonista_lib.cq.cmd.calc.sheet.cell.prop.cmd_code_name import CmdCodeName
     from oxt.pythonpath.libre_pythonista_lib.utils.result import Result
+    from oxt.pythonpath.libre_pythonista_lib.doc.doc_globals import DocGlobals
 else:
     from libre_pythonista_lib.utils.custom_ext import override
     from libre_pythonista_lib.cq.cmd.cmd_base import CmdBase
@@ -34,6 +35,12 @@ else:
     from libre_pythonista_lib.cq.qry.calc.sheet.draw_page.qry_shape_by_name import QryShapeByName
     from libre_pythonista_lib.cq.cmd.calc.sheet.cell.prop.cmd_code_name import CmdCodeName
     from libre_pythonista_lib.utils.result import Result
+    from libre_pythonista_lib.doc.doc_globals import DocGlobals
+
+_KEY = "libre_pythonista_lib.cq.cmd.calc.sheet.cell.draw_page.cmd_add_image_linked.CmdAddImageLinked.sources"
+
+_SourceStamp = Tuple[str, int, int]
+"""Image file path, modified time in nanoseconds and size."""
 
 
 class CmdAddImageLinked(CmdBase, LogMixin, CmdCellT):
@@ -43,6 +50,7 @@ class CmdAddImageLinked(CmdBase, LogMixin, CmdCellT):
     This command handles adding an image that is linked to a specific cell, including:
     - Setting a unique code name for the cell if not already present
     - Managing existing images in the cell (removing old ones before adding new ones)
+    - Keeping the existing image when it was inserted from the same unchanged file
     - Configuring image properties like anchoring and resize behavior
     - Supporting undo operations
 
@@ -75,6 +83,8 @@ class CmdAddImageLinked(CmdBase, LogMixin, CmdCellT):
         self._success_cmds: List[CmdCellT] = []
         self._current_shape = cast(Union[DrawShape[SpreadsheetDrawPage[CalcSheet]], None], NULL_OBJ)
         self._new_shape: Union[DrawShape[SpreadsheetDrawPage[CalcSheet]], None] = None
+        self._is_reused = False
+        self._prev_stamp: Union[_SourceStamp, None] = None
         self.log.debug("init done for cell %s", cell.cell_obj)
 
     def _validate(self) -> bool:
@@ -87,6 +97,38 @@ class CmdAddImageLinked(CmdBase, LogMixin, CmdCellT):
             return False
         return True
 
+    def _get_sources(self) -> Dict[str, _SourceStamp]:
+        """
+        Gets the source files of the images inserted in the document, keyed by shape name.
+
+        Returns:
+            Dict[str, _SourceStamp]: Source stamps of the document.
+        """
+        gbl_cache = DocGlobals.get_current(self.cell.calc_doc.runtime_uid)
+        if _KEY not in gbl_cache.mem_cache:
+            gbl_cache.mem_cache[_KEY] = {}
+        return gbl_cache.mem_cache[_KEY]
+
+    def _get_source_stamp(self) -> _SourceStamp:
+        """
+        Gets the stamp of the image file.
+
+        Returns:
+            _SourceStamp: Path, modified time and size of the file.
+        """
+        fnm_pth = Path(self._fnm)
+        st = fnm_pth.stat()
+        return (str(fnm_pth), st.st_mtime_ns, st.st_size)
+
+    def _is_source_unchanged(self) -> bool:
+        """
+        Gets if the existing image was inserted from the same file and the file has not changed since.
+
+        Returns:
+            bool: True if the existing image can be kept, False otherwise
+        """
+        return self._get_sources().get(self._shape_name) == self._get_source_stamp()
+
     def _cmd_code_name(self) -> bool:
         """
         Sets a unique code name for the cell.
@@ -255,14 +297,22 @@ class CmdAddImageLinked(CmdBase, LogMixin, CmdCellT):
 
             if self._current_shape is NULL_OBJ:
                 self._current_shape = self._qry_shape_by_name()
-                if self._current_shape:
+                # a figure that has not changed is written to the same file, see FigCache.
+                self._is_reused = bool(self._current_shape) and self._is_source_unchanged()
+                if self._current_shape and not self._is_reused:
                     # if there is a shape remove it before adding a new one.
                     self.log.debug("Removing cell image for %s", self.cell.cell_obj)
                     self._remove_known_cell_image_linked(self._current_shape)
 
-            self._new_shape = self._add_cell_image_linked()
-            self._set_shape_props(self._new_shape)
-            self._set_shape_name(self._new_shape)
+            if self._is_reused:
+                self.log.debug("Image of cell %s has not changed. Keeping shape.", self.cell.cell_obj)
+            else:
+                self._new_shape = self._add_cell_image_linked()
+                self._set_shape_props(self._new_shape)
+                self._set_shape_name(self._new_shape)
+                sources = self._get_sources()
+                self._prev_stamp = sources.get(self._shape_name)
+                sources[self._shape_name] = self._get_source_stamp()
         except Exception as e:
             self.log.exception("Error setting cell Code: %s", e)
             for cmd in reversed(self._success_cmds):
@@ -283,6 +333,14 @@ class CmdAddImageLinked(CmdBase, LogMixin, CmdCellT):
                 self._execute_cmd_undo(cmd)
             self._success_cmds.clear()
 
+            if self._new_shape:
+                sources = self._get_sources()
+                if self._prev_stamp is None:
+                    sources.pop(self._shape_name, None)
+                else:
+                    sources[self._shape_name] = self._prev_stamp
+                self._prev_stamp = None
+
             if self._current_shape and self._new_shape:
                 self._remove_known_cell_image_linked(self._new_shape)
                 self._add_known_cell_image_linked(self._current_shape)
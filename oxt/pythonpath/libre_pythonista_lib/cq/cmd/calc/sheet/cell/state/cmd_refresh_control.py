@@ -8,6 +8,9 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module_t import PyModuleT
     from oxt.pythonpath.libre_pythonista_lib.cq.cmd.calc.sheet.cell.cmd_cell_t import CmdCellT
     from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_base import CmdBase
+    from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_coalesce_t import CmdCoalesceT
+    from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_follow_up_t import CmdFollowUpT
+    from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_t import CmdT
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.doc.qry_py_module_default import QryPyModuleDefault
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.sheet.cell.prop.qry_ctl_kind import QryCtlKind
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.sheet.cell.state.qry_module_state import QryModuleState
@@ -26,6 +29,9 @@ else:
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module_t import PyModuleT
     from libre_pythonista_lib.cq.cmd.calc.sheet.cell.cmd_cell_t import CmdCellT
     from libre_pythonista_lib.cq.cmd.cmd_base import CmdBase
+    from libre_pythonista_lib.cq.cmd.cmd_coalesce_t import CmdCoalesceT
+    from libre_pythonista_lib.cq.cmd.cmd_follow_up_t import CmdFollowUpT
+    from libre_pythonista_lib.cq.cmd.cmd_t import CmdT
     from libre_pythonista_lib.cq.qry.calc.doc.qry_py_module_default import QryPyModuleDefault
     from libre_pythonista_lib.cq.qry.calc.sheet.cell.prop.qry_ctl_kind import QryCtlKind
     from libre_pythonista_lib.cq.qry.calc.sheet.cell.state.qry_module_state import QryModuleState
@@ -39,13 +45,20 @@ else:
     from libre_pythonista_lib.utils.result import Result
 
 
-class CmdRefreshControl(CmdBase, LogMixin, CmdCellT):
+# tested in: tests/test_cmd/test_cmd_append_code.py
+
+
+class CmdRefreshControl(CmdBase, LogMixin, CmdCellT, CmdCoalesceT, CmdFollowUpT):
     """
     Command to refresh/update a cell's control based on its current state.
 
     This command handles creating, removing and updating controls attached to cells
     based on the cell's current Python code and state rules.
 
+    A refresh follows up on other commands of the same cell, so consecutive code updates of a cell
+    are still merged by the command handler. A later refresh of the same cell that did not change the control
+    is merged into this command.
+
     Args:
         cell (CalcCell): The cell to refresh the control for
         mod (PyModuleT, None): Optional Python module. If None, will be queried
@@ -196,6 +209,37 @@ class CmdRefreshControl(CmdBase, LogMixin, CmdCellT):
         else:
             self.log.debug("Undo not needed.")
 
+    def coalesce(self, cmd: CmdT) -> bool:
+        """
+        Merges a later refresh of the same cell that did not change the control into this command.
+
+        Args:
+            cmd (CmdT): Command that was executed after this command.
+
+        Returns:
+            bool: ``True`` if ``cmd`` was merged, otherwise ``False``.
+        """
+        if not isinstance(cmd, CmdRefreshControl):
+            return False
+        if not (self.success and cmd.success) or cmd._state_changed:
+            return False
+        return self.cell.cell_obj == cmd.cell.cell_obj
+
+    def is_follow_up(self, cmd: CmdT) -> bool:
+        """
+        Gets if this command refreshed the control of the cell that ``cmd`` operates on.
+
+        Args:
+            cmd (CmdT): Command that was executed after this command.
+
+        Returns:
+            bool: ``True`` if ``cmd`` operates on the same cell, otherwise ``False``.
+        """
+        cell = getattr(cmd, "cell", None)
+        if cell is None:
+            return False
+        return self.cell.cell_obj == cell.cell_obj
+
     @property
     def cell(self) -> CalcCell:
         """Gets the cell this command operates on"""
@@ -7,6 +7,8 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module_t import PyModuleT
     from oxt.pythonpath.libre_pythonista_lib.cq.cmd.calc.sheet.cell.cmd_cell_t import CmdCellT
     from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_base import CmdBase
+    from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_coalesce_t import CmdCoalesceT
+    from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_t import CmdT
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_source_manager import PySourceManager
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.doc.qry_py_module_default import QryPyModuleDefault
     from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
@@ -14,6 +16,8 @@ if TYPE_CHECKING:
 else:
     from libre_pythonista_lib.cq.cmd.calc.sheet.cell.cmd_cell_t import CmdCellT
     from libre_pythonista_lib.cq.cmd.cmd_base import CmdBase
+    from libre_pythonista_lib.cq.cmd.cmd_coalesce_t import CmdCoalesceT
+    from libre_pythonista_lib.cq.cmd.cmd_t import CmdT
     from libre_pythonista_lib.log.log_mixin import LogMixin
     from libre_pythonista_lib.cq.qry.calc.doc.qry_py_module_default import QryPyModuleDefault
     from libre_pythonista_lib.utils.custom_ext import override
@@ -24,12 +28,14 @@ else:
 # tested in: tests/test_cmd/test_cmd_append_code.py
 
 
-class CmdUpdateCode(CmdBase, LogMixin, CmdCellT):
+class CmdUpdateCode(CmdBase, LogMixin, CmdCellT, CmdCoalesceT):
     """
     Command to update Python code for a cell.
 
     Command will fail is the cell does not exist in the source manager.
 
+    Consecutive updates of the same cell are merged into one undo step by the command handler.
+
     Args:
         cell (CalcCell): The target cell to append code to
         mod (PyModuleT, optional): The Python module to associate the code with. Defaults to None.
@@ -138,6 +144,30 @@ class CmdUpdateCode(CmdBase, LogMixin, CmdCellT):
         else:
             self.log.debug("Undo not needed.")
 
+    @override
+    def coalesce(self, cmd: CmdT) -> bool:
+        """
+        Merges a later update of the same cell into this command.
+
+        Undo still restores the code from before this command and redo sets the code of ``cmd``.
+
+        Args:
+            cmd (CmdT): Command that was executed after this command.
+
+        Returns:
+            bool: ``True`` if ``cmd`` was merged, otherwise ``False``.
+        """
+        if not isinstance(cmd, CmdUpdateCode):
+            return False
+        if not (self.success and cmd.success and self._state_changed):
+            return False
+        if self._py_src_mgr is None or self._py_src_mgr is not cmd._py_src_mgr:
+            return False
+        if self.cell.cell_obj != cmd.cell.cell_obj:
+            return False
+        self._code = cmd._code
+        return True
+
     @property
     def cell(self) -> CalcCell:
         """Gets the cell this command operates on"""
@@ -0,0 +1,24 @@
+from __future__ import annotations
+from typing import Protocol, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_t import CmdT
+else:
+    from libre_pythonista_lib.cq.cmd.cmd_t import CmdT
+
+
+class CmdCoalesceT(CmdT, Protocol):
+    def coalesce(self, cmd: CmdT) -> bool:
+        """
+        Merges a command that was executed right after this command into this command.
+
+        After a merge, undo of this command must restore the state from before this command was executed
+        and redo must restore the state after ``cmd`` was executed.
+
+        Args:
+            cmd (CmdT): Command that was executed after this command.
+
+        Returns:
+            bool: ``True`` if ``cmd`` was merged and is no longer needed in the undo history, otherwise ``False``.
+        """
+        ...
@@ -0,0 +1,24 @@
+from __future__ import annotations
+from typing import Protocol, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_t import CmdT
+else:
+    from libre_pythonista_lib.cq.cmd.cmd_t import CmdT
+
+
+class CmdFollowUpT(CmdT, Protocol):
+    def is_follow_up(self, cmd: CmdT) -> bool:
+        """
+        Gets if this command only follows up on changes of the same kind as ``cmd``.
+
+        The command handler looks past a follow up command when it searches the undo history for a command
+        that can merge ``cmd``.
+
+        Args:
+            cmd (CmdT): Command that was executed after this command.
+
+        Returns:
+            bool: ``True`` if this command follows up on ``cmd``, otherwise ``False``.
+        """
+        ...
@@ -1,6 +1,8 @@
 # region Imports
 from __future__ import annotations
-from typing import Any, Iterable, cast, List, TYPE_CHECKING
+from typing import Any, Deque, Iterable, NamedTuple, cast, TYPE_CHECKING
+from collections import deque
+import sys
 
 if TYPE_CHECKING:
     from ooodev.utils.cache import MemCache
@@ -9,6 +11,8 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_handler_t import CmdHandlerT
     from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_t import CmdT
     from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_cache_t import CmdCacheT
+    from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_coalesce_t import CmdCoalesceT
+    from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_follow_up_t import CmdFollowUpT
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.general.qry_cache import QryCache
     from oxt.pythonpath.libre_pythonista_lib.kind.calc_cmd_kind import CalcCmdKind
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.sheet.cell.qry_cell_cache import QryCellCache
@@ -20,6 +24,8 @@ else:
     from libre_pythonista_lib.cq.cmd.cmd_handler_t import CmdHandlerT
     from libre_pythonista_lib.cq.cmd.cmd_t import CmdT
     from libre_pythonista_lib.cq.cmd.cmd_cache_t import CmdCacheT
+    from libre_pythonista_lib.cq.cmd.cmd_coalesce_t import CmdCoalesceT
+    from libre_pythonista_lib.cq.cmd.cmd_follow_up_t import CmdFollowUpT
     from libre_pythonista_lib.cq.qry.general.qry_cache import QryCache
     from libre_pythonista_lib.kind.calc_cmd_kind import CalcCmdKind
     from libre_pythonista_lib.cq.qry.calc.sheet.cell.qry_cell_cache import QryCellCache
@@ -31,29 +37,66 @@ else:
 # endregion Imports
 
 
+class _HistoryItem(NamedTuple):
+    cmd: CmdT
+    size: int
+    """Estimated number of bytes retained by the command."""
+    is_top: bool
+    """``True`` if the command was not executed by another command."""
+
+
 class CmdHandler(CmdHandlerT):
+    """
+    Executes commands and keeps the undo and redo history.
+
+    The undo history is limited by number of commands and by the estimated number of bytes the commands retain.
+    When a limit is reached the oldest commands are removed and can no longer be undone.
+    """
+
+    MAX_HISTORY = 500
+    """Default maximum number of commands in the undo history."""
+    MAX_HISTORY_BYTES = 16 * 1024 * 1024
+    """Default maximum estimated bytes retained by the commands in the undo history."""
+
     # region Handle methods
-    def __init__(self) -> None:
-        self._undo_stack: List[CmdT] = []
-        self._redo_stack: List[CmdT] = []
+    def __init__(self, max_history: int = MAX_HISTORY, max_history_bytes: int = MAX_HISTORY_BYTES) -> None:
+        """
+        Constructor
+
+        Args:
+            max_history (int, optional): Maximum number of commands in the undo history. ``0`` for no limit.
+                Defaults to ``MAX_HISTORY``.
+            max_history_bytes (int, optional): Maximum estimated bytes retained by the commands in the undo history.
+                ``0`` for no limit. Defaults to ``MAX_HISTORY_BYTES``.
+        """
+        self._undo_stack: Deque[_HistoryItem] = deque()
+        self._redo_stack: Deque[_HistoryItem] = deque()
+        self._undo_bytes = 0
+        self._max_history = max_history
+        self._max_history_bytes = max_history_bytes
+        self._depth = 0
 
     def handle(self, cmd: CmdT) -> None:  # noqa: ANN401
-        if cmd.kind in (CalcCmdKind.SIMPLE, CalcCmdKind.SHEET, CalcCmdKind.CELL):
-            self._handle_simple(cmd)
-        elif cmd.kind == CalcCmdKind.SIMPLE_CACHE:
-            self._handle_simple_cache(cast(CmdCacheT, cmd))
-        elif cmd.kind == CalcCmdKind.CELL_CACHE:
-            self._handle_cell_cache(cast(CmdCellCacheT, cmd))
-        elif cmd.kind == CalcCmdKind.SHEET_CACHE:
-            self._handle_sheet_cache(cast(CmdSheetCacheT, cmd))
-        else:
-            raise NotImplementedError
+        # commands may execute other commands. Only commands handled at depth 1 are top level commands.
+        self._depth += 1
+        try:
+            if cmd.kind in (CalcCmdKind.SIMPLE, CalcCmdKind.SHEET, CalcCmdKind.CELL):
+                self._handle_simple(cmd)
+            elif cmd.kind == CalcCmdKind.SIMPLE_CACHE:
+                self._handle_simple_cache(cast(CmdCacheT, cmd))
+            elif cmd.kind == CalcCmdKind.CELL_CACHE:
+                self._handle_cell_cache(cast(CmdCellCacheT, cmd))
+            elif cmd.kind == CalcCmdKind.SHEET_CACHE:
+                self._handle_sheet_cache(cast(CmdSheetCacheT, cmd))
+            else:
+                raise NotImplementedError
+        finally:
+            self._depth -= 1
 
     def _handle_simple(self, cmd: CmdT) -> None:
         cmd.execute()
         if cmd.success:
-            self._undo_stack.append(cmd)
-            self._redo_stack.clear()
+            self._push_undo(cmd)
 
     def _handle_simple_cache(self, cmd: CmdCacheT) -> None:  # noqa: ANN401
         cache_qry = QryCache()
@@ -64,8 +107,7 @@ class CmdHandler(CmdHandlerT):
         self._clear_cache(cache, cmd.cache_keys)
         cmd.execute()
         if cmd.success:
-            self._undo_stack.append(cmd)
-            self._redo_stack.clear()
+            self._push_undo(cmd)
 
         # Executing some commands may call a query which will add the key back into the cache.
         # So we need to remove it again after the command is executed to reflect new values that the command executed.
@@ -80,8 +122,7 @@ class CmdHandler(CmdHandlerT):
         self._clear_cache(cache, cmd.cache_keys)
         cmd.execute()
         if cmd.success:
-            self._undo_stack.append(cmd)
-            self._redo_stack.clear()
+            self._push_undo(cmd)
 
         # Executing some commands may call a query which will add the key back into the cache.
         # So we need to remove it again after the command is executed to reflect new values that the command executed.
@@ -95,8 +136,7 @@ class CmdHandler(CmdHandlerT):
         self._clear_cache(cache, cmd.cache_keys)
         cmd.execute()
         if cmd.success:
-            self._undo_stack.append(cmd)
-            self._redo_stack.clear()
+            self._push_undo(cmd)
 
         # Executing some commands may call a query which will add the key back into the cache.
         # So we need to remove it again after the command is executed to reflect new values that the command executed.
@@ -207,41 +247,154 @@ class CmdHandler(CmdHandlerT):
 
     # endregion Cache methods
 
+    # region History methods
+    @staticmethod
+    def _get_size(cmd: CmdT) -> int:
+        """Gets a rough estimate of the bytes retained by a command, the command and its text and byte attributes."""
+        size = sys.getsizeof(cmd)
+        try:
+            for value in vars(cmd).values():
+                if isinstance(value, (str, bytes, bytearray)):
+                    size += sys.getsizeof(value)
+        except TypeError:
+            pass
+        return size
+
+    def _get_coalesce_index(self, cmd: CmdT) -> int:
+        """
+        Gets the index of the top level command in the undo history that merged ``cmd``.
+
+        Commands executed by other commands and top level commands that only follow up on ``cmd`` are skipped,
+        such as a control refresh that runs after each code update of a cell.
+
+        Returns:
+            int: Index of the command that merged ``cmd`` or ``-1`` if ``cmd`` was not merged.
+        """
+        for i in range(len(self._undo_stack) - 1, -1, -1):
+            prev = self._undo_stack[i]
+            # only top level commands are merged, commands executed by other commands are owned by them.
+            if not prev.is_top:
+                continue
+            if hasattr(prev.cmd, "coalesce") and cast(CmdCoalesceT, prev.cmd).coalesce(cmd):
+                return i
+            if hasattr(prev.cmd, "is_follow_up") and cast(CmdFollowUpT, prev.cmd).is_follow_up(cmd):
+                continue
+            break
+        return -1
+
+    def _push_undo(self, cmd: CmdT) -> None:
+        self._redo_stack.clear()
+        is_top = self._depth <= 1
+        if is_top:
+            index = self._get_coalesce_index(cmd)
+            if index >= 0:
+                prev = self._undo_stack[index]
+                item = _HistoryItem(cmd=prev.cmd, size=self._get_size(prev.cmd), is_top=True)
+                self._undo_stack[index] = item
+                self._undo_bytes += item.size - prev.size
+                self._trim_undo()
+                return
+        item = _HistoryItem(cmd=cmd, size=self._get_size(cmd), is_top=is_top)
+        self._undo_stack.append(item)
+        self._undo_bytes += item.size
+        self._trim_undo()
+
+    def _trim_undo(self) -> None:
+        """Removes the oldest commands until the undo history is within its limits. The newest command is always kept."""
+        while len(self._undo_stack) > 1 and (
+            (self._max_history > 0 and len(self._undo_stack) > self._max_history)
+            or (self._max_history_bytes > 0 and self._undo_bytes > self._max_history_bytes)
+        ):
+            item = self._undo_stack.popleft()
+            self._undo_bytes -= item.size
+
+    def clear_history(self) -> None:
+        """Clears the undo and redo history."""
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        self._undo_bytes = 0
+
+    # endregion History methods
+
     # region Undo/Redo stack methods
     def undo(self) -> None:
         """Undo the last command"""
         if not self._undo_stack:
             return
-        cmd = self._undo_stack.pop()
-        self.handle_undo(cmd)
-        self._redo_stack.append(cmd)
+        item = self._undo_stack.pop()
+        self._undo_bytes -= item.size
+        self.handle_undo(item.cmd)
+        self._redo_stack.append(item)
 
     def redo(self) -> None:
         """Redo the last command"""
         if not self._redo_stack:
             return
-        cmd = self._redo_stack.pop()
-        self.handle_redo(cmd)
-        self._undo_stack.append(cmd)
+        item = self._redo_stack.pop()
+        self.handle_redo(item.cmd)
+        self._undo_stack.append(item)
+        self._undo_bytes += item.size
+        self._trim_undo()
 
     def undo_all(self) -> None:
         """Undo all commands"""
         if not self._undo_stack:
             return
-        for cmd in reversed(self._undo_stack):
+        for item in reversed(self._undo_stack):
             # cmd = self._undo_stack.pop()
-            self.handle_undo(cmd)
-            self._redo_stack.append(cmd)
+            self.handle_undo(item.cmd)
+            self._redo_stack.append(item)
         self._undo_stack.clear()
+        self._undo_bytes = 0
 
     def redo_all(self) -> None:
         """Redo all commands"""
         if not self._redo_stack:
             return
-        for cmd in self._redo_stack:
+        for item in self._redo_stack:
             # cmd = self._redo_stack.pop()
-            self.handle_redo(cmd)
-            self._undo_stack.append(cmd)
+            self.handle_redo(item.cmd)
+            self._undo_stack.append(item)
+            self._undo_bytes += item.size
         self._redo_stack.clear()
+        self._trim_undo()
 
     # endregion Undo/Redo stack methods
+
+    # region Properties
+    @property
+    def max_history(self) -> int:
+        """Gets/Sets the maximum number of commands in the undo history. ``0`` for no limit."""
+        return self._max_history
+
+    @max_history.setter
+    def max_history(self, value: int) -> None:
+        self._max_history = value
+        self._trim_undo()
+
+    @property
+    def max_history_bytes(self) -> int:
+        """Gets/Sets the maximum estimated bytes retained by the commands in the undo history. ``0`` for no limit."""
+        return self._max_history_bytes
+
+    @max_history_bytes.setter
+    def max_history_bytes(self, value: int) -> None:
+        self._max_history_bytes = value
+        self._trim_undo()
+
+    @property
+    def undo_count(self) -> int:
+        """Gets the number of commands in the undo history."""
+        return len(self._undo_stack)
+
+    @property
+    def redo_count(self) -> int:
+        """Gets the number of commands in the redo history."""
+        return len(self._redo_stack)
+
+    @property
+    def undo_bytes(self) -> int:
+        """Gets the estimated bytes retained by the commands in the undo history."""
+        return self._undo_bytes
+
+    # endregion Properties
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
     from oxt.pythonpath.libre_pythonista_lib.utils.result import Result
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.config.qry_cell_cp_codename import QryCellCpCodeName
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan import QryLpCellsScan
 
 else:
     from libre_pythonista_lib.cq.qry.qry_base import QryBase
@@ -17,6 +18,7 @@ else:
     from libre_pythonista_lib.log.log_mixin import LogMixin
     from libre_pythonista_lib.utils.result import Result
     from libre_pythonista_lib.cq.qry.config.qry_cell_cp_codename import QryCellCpCodeName
+    from libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan import QryLpCellsScan
 
 
 # I was checking for the existence of folder vnd.sun.star.tdoc:/1/librepythonista.
@@ -54,7 +56,8 @@ class QryIsDocPythonista(QryBase, LogMixin, QryDocT[Union[Result[bool, None], Re
         """
         filter_key = self._qry_cell_cp_code_name()
         for sheet in self._doc.sheets:
-            code_cell = sheet.custom_cell_properties.get_cell_properties(filter_key)
+            # the stored cell index is not used, it is read using sfa. See note above.
+            code_cell, _ = self._execute_qry(QryLpCellsScan(sheet=sheet, filter_key=filter_key))
             if len(code_cell) > 0:
                 return True
 
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from typing import Any, Dict, TYPE_CHECKING
+
+from ooodev.io.json.doc_json_file import DocJsonFile
+
+if TYPE_CHECKING:
+    from ooodev.calc import CalcDoc
+    from oxt.___lo_pip___.basic_config import BasicConfig
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.qry_base import QryBase
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.qry_cache_t import QryCacheT
+    from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
+    from oxt.pythonpath.libre_pythonista_lib.kind.calc_qry_kind import CalcQryKind
+    from oxt.pythonpath.libre_pythonista_lib.const.cache_const import DOC_LP_CELL_INDEX
+else:
+    from ___lo_pip___.basic_config import BasicConfig
+    from libre_pythonista_lib.cq.qry.qry_base import QryBase
+    from libre_pythonista_lib.cq.qry.qry_cache_t import QryCacheT
+    from libre_pythonista_lib.log.log_mixin import LogMixin
+    from libre_pythonista_lib.kind.calc_qry_kind import CalcQryKind
+    from libre_pythonista_lib.const.cache_const import DOC_LP_CELL_INDEX
+
+CELL_INDEX_VERSION = 1
+"""Version of the format of the cell index file."""
+
+
+class QryLpCellIndex(QryBase, LogMixin, QryCacheT[Dict[str, Any]]):
+    """
+    Gets the index of the code cells that is stored in the document.
+
+    The index is written by :py:class:`~libre_pythonista_lib.cq.cmd.calc.doc.cmd_lp_cell_index.CmdLpCellIndex`
+    when the document is saved. Each sheet name maps to the entry returned by
+    :py:class:`~libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan.QryLpCellsScan`.
+
+    Returns:
+        Dict[str, Any]: Sheet name to index entry. Empty if the document has no index or the index has another version.
+    """
+
+    def __init__(self, doc: CalcDoc) -> None:
+        QryBase.__init__(self)
+        LogMixin.__init__(self)
+        self.kind = CalcQryKind.SIMPLE_CACHE
+        self._doc = doc
+        cfg = BasicConfig()
+        self.file_name = f"{cfg.general_code_name}{cfg.calc_cell_index_json_name}"
+
+    def execute(self) -> Dict[str, Any]:
+        """
+        Executes the query.
+
+        Returns:
+            Dict[str, Any]: Sheet name to index entry.
+        """
+        try:
+            djf = DocJsonFile(self._doc, "json")
+            if not djf.file_exist(self.file_name):
+                self.log.debug("execute() Cell index does not exist.")
+                return {}
+            data = djf.read_json(self.file_name)
+            if data.get("version") != CELL_INDEX_VERSION:
+                self.log.debug("execute() Cell index version %s is not supported.", data.get("version"))
+                return {}
+            return data.get("sheets", {})
+        except Exception:
+            self.log.exception("Error reading cell index")
+        return {}
+
+    @property
+    def cache_key(self) -> str:
+        """Gets the cache key."""
+        return DOC_LP_CELL_INDEX
@@ -11,12 +11,16 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.index_cell_props import IndexCellProps
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.config.qry_cell_cp_codename import QryCellCpCodeName
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.doc.qry_lp_cell_index import QryLpCellIndex
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan import QryLpCellsScan
 else:
     from libre_pythonista_lib.cq.qry.qry_base import QryBase
     from libre_pythonista_lib.cq.qry.calc.doc.qry_doc_t import QryDocT
     from libre_pythonista_lib.log.log_mixin import LogMixin
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.index_cell_props import IndexCellProps
     from libre_pythonista_lib.cq.qry.config.qry_cell_cp_codename import QryCellCpCodeName
+    from libre_pythonista_lib.cq.qry.calc.doc.qry_lp_cell_index import QryLpCellIndex
+    from libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan import QryLpCellsScan
 
 
 class QryLpCells(QryBase, LogMixin, QryDocT[Dict[int, Dict[CellObj, IndexCellProps]]]):
@@ -66,12 +70,14 @@ class QryLpCells(QryBase, LogMixin, QryDocT[Dict[int, Dict[CellObj, IndexCellPro
 
         Searches through all sheets in the document for cells that have the specific
         custom property defined by the codename from _qry_cell_cp_code_name().
+        The index of the code cells stored in the document is used to validate the cells of each sheet.
 
         Returns:
             Dict[int, Dict[CellObj, IndexCellProps]]: A dictionary mapping sheet indices to another dictionary
             that maps CellObj instances to their corresponding IndexCellProps.
         """
         filter_key = self._qry_cell_cp_code_name()
+        stored = self._execute_qry(QryLpCellIndex(self._doc))
         code_cells: Dict[int, Dict[CellObj, IndexCellProps]] = {}
         sheet_indexes = []
         for sheet in self._doc.sheets:
@@ -80,21 +86,10 @@ class QryLpCells(QryBase, LogMixin, QryDocT[Dict[int, Dict[CellObj, IndexCellPro
 
         for idx in sheet_indexes:
             sheet = self._doc.sheets[idx]
-            code_index: Dict[CellObj, IndexCellProps] = {}
-            index = sheet.sheet_index
-            # deleted cells will not be in the custom properties
-
-            code_cell = sheet.custom_cell_properties.get_cell_properties(filter_key)  # sorted order
-            i = -1
-            for key, value in code_cell.items():
-                i += 1
-                cell = sheet[key]
-                code_name = cell.get_custom_property(filter_key, "")
-                if not code_name:
-                    self.log.error("_get_cells() Code Name not found for cell: %s. Skipping?", cell)
-                    continue
-                code_index[key] = IndexCellProps(code_name, value, i)
-            code_cells[index] = code_index
+            # addresses and code names are read in one pass, see QryLpCellsScan
+            qry = QryLpCellsScan(sheet=sheet, filter_key=filter_key, sheet_index=stored.get(sheet.name))
+            code_index, _ = self._execute_qry(qry)
+            code_cells[sheet.sheet_index] = code_index
         return code_cells
 
     def execute(self) -> Dict[int, Dict[CellObj, IndexCellProps]]:
@@ -10,11 +10,13 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.sheet.qry_sheet_t import QrySheetT
     from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.config.qry_cell_cp_codename import QryCellCpCodeName
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan import QryLpCellsScan
 else:
     from libre_pythonista_lib.cq.qry.qry_base import QryBase
     from libre_pythonista_lib.cq.qry.calc.sheet.qry_sheet_t import QrySheetT
     from libre_pythonista_lib.log.log_mixin import LogMixin
     from libre_pythonista_lib.cq.qry.config.qry_cell_cp_codename import QryCellCpCodeName
+    from libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan import QryLpCellsScan
 
 
 class QryLpCellObjList(QryBase, LogMixin, QrySheetT[List[CellObj]]):
@@ -42,7 +44,8 @@ class QryLpCellObjList(QryBase, LogMixin, QrySheetT[List[CellObj]]):
         sheet = self._sheet
         # deleted cells will not be in the custom properties
 
-        code_cell = sheet.custom_cell_properties.get_cell_properties(filter_key)  # sorted order
+        qry = QryLpCellsScan(sheet=sheet, filter_key=filter_key)
+        code_cell, _ = self._execute_qry(qry)  # sorted order
         for key in code_cell:
             code_cells.append(key)
 
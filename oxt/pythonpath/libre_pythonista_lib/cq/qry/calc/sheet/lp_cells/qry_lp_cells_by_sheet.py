@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast, Dict, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Tuple, Union
 from ooodev.utils.data_type.cell_obj import CellObj
 from ooodev.calc import CalcSheet
 
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.index_cell_props import IndexCellProps
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.config.qry_cell_cp_codename import QryCellCpCodeName
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan import QryLpCellsScan
     from oxt.pythonpath.libre_pythonista_lib.utils.result import Result
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.const import PYTHON_SOURCE_MODIFIED
     from oxt.pythonpath.libre_pythonista_lib.kind.calc_qry_kind import CalcQryKind
@@ -19,6 +20,7 @@ else:
     from libre_pythonista_lib.log.log_mixin import LogMixin
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.index_cell_props import IndexCellProps
     from libre_pythonista_lib.cq.qry.config.qry_cell_cp_codename import QryCellCpCodeName
+    from libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan import QryLpCellsScan
     from libre_pythonista_lib.utils.result import Result
     from libre_pythonista_lib.doc.calc.const import PYTHON_SOURCE_MODIFIED
     from libre_pythonista_lib.kind.calc_qry_kind import CalcQryKind
@@ -72,21 +74,9 @@ class QryLpCellsBySheet(
             Dict[CellObj, IndexCellProps]: Dictionary mapping cells to their index properties
         """
         filter_key = self._qry_cell_cp_code_name()
-        sheet = self._sheet
-
-        code_index: Dict[CellObj, IndexCellProps] = {}
-        # deleted cells will not be in the custom properties
-
-        code_cell = sheet.custom_cell_properties.get_cell_properties(filter_key)
-        i = -1
-        for key, value in code_cell.items():
-            i += 1
-            cell = sheet[key]
-            code_name = cast(str, cell.get_custom_property(filter_key, ""))
-            if not code_name:
-                self.log.error("_get_cells() Code Name not found for cell: %s. Skipping?", cell)
-                continue
-            code_index[key] = IndexCellProps(code_name, value, i)
+        # addresses and code names are read in one pass, see QryLpCellsScan
+        qry = QryLpCellsScan(sheet=self._sheet, filter_key=filter_key)
+        code_index, _ = self._execute_qry(qry)
         return code_index
 
     def execute(self) -> Union[Result[Dict[CellObj, IndexCellProps], None], Result[None, Exception]]:
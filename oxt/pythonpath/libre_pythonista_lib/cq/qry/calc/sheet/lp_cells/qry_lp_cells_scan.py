@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+from ooodev.utils.data_type.cell_obj import CellObj
+
+if TYPE_CHECKING:
+    from ooodev.calc import CalcSheet
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.qry_base import QryBase
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.sheet.qry_sheet_t import QrySheetT
+    from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.index_cell_props import IndexCellProps
+else:
+    from libre_pythonista_lib.cq.qry.qry_base import QryBase
+    from libre_pythonista_lib.cq.qry.calc.sheet.qry_sheet_t import QrySheetT
+    from libre_pythonista_lib.log.log_mixin import LogMixin
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.index_cell_props import IndexCellProps
+
+# Properties of the hidden control that are not custom properties.
+# See ooodev.calc.cell.custom_prop.CustomProp
+_FORBIDDEN_KEYS = frozenset(("HiddenValue", "Name", "ClassId", "Tag"))
+
+LpCellsScanResult = Tuple[Dict[CellObj, IndexCellProps], Dict[str, Any]]
+"""Cells with their properties and the index entry of the sheet."""
+
+
+class QryLpCellsScan(QryBase, LogMixin, QrySheetT[LpCellsScanResult]):
+    """
+    Query that finds the cells of a sheet that have a custom property in a single pass.
+
+    Cell custom properties are stored in hidden form controls that are linked to a shape anchored to the cell.
+    The shapes of the draw page are read once, the address comes from the anchor of the shape
+    and the code name and property names come from one read of the hidden control.
+
+    When the index entry of the sheet from a previous scan is passed and the number of shapes and controls of the sheet
+    have not changed the code names and property names are taken from the index, only the shape names and anchors
+    are read. Cell addresses are never taken from the index because cells move when rows and columns are inserted.
+
+    Returns:
+        Tuple[Dict[CellObj, IndexCellProps], Dict[str, Any]]: Cells sorted by row and column with their properties,
+        and the index entry of the sheet that can be passed to the next scan.
+    """
+
+    def __init__(self, sheet: CalcSheet, filter_key: str, sheet_index: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Initialize the query.
+
+        Args:
+            sheet (CalcSheet): The sheet to scan.
+            filter_key (str): Only cells with this custom property are returned, such as ``libre_pythonista_codename``.
+            sheet_index (Dict[str, Any], optional): Index entry of the sheet from a previous scan.
+        """
+        QryBase.__init__(self)
+        LogMixin.__init__(self)
+        self._sheet = sheet
+        self._filter_key = filter_key
+        self._sheet_index = sheet_index
+        self.reads = 0
+        """Number of hidden controls that were read by the last execute."""
+
+    def _get_form(self) -> Any:  # noqa: ANN401
+        cp = self._sheet.custom_cell_properties
+        forms = cp.draw_page.forms.component
+        if not forms.hasByName(cp.form_name):
+            return None
+        return forms.getByName(cp.form_name)
+
+    def _is_index_valid(self, draw_page: Any, form: Any) -> bool:  # noqa: ANN401
+        idx = self._sheet_index
+        if not idx:
+            return False
+        return idx.get("shapes") == draw_page.getCount() and idx.get("controls") == form.getCount()
+
+    def _read_control(self, form: Any, ctl_name: str) -> Optional[Tuple[str, Tuple[str, ...]]]:  # noqa: ANN401
+        if not form.hasByName(ctl_name):
+            return None
+        ctl = form.getByName(ctl_name)
+        self.reads += 1
+        # getPropertyValues() without arguments fails on hidden controls, see ooodev PropertyAccessPartial.
+        values = ctl.PropertyValues if hasattr(ctl, "PropertyValues") else ctl.getPropertyValues()
+        code_name = ""
+        names = []
+        for prop in values:
+            if prop.Name in _FORBIDDEN_KEYS:
+                continue
+            names.append(prop.Name)
+            if prop.Name == self._filter_key:
+                code_name = str(prop.Value)
+        if not code_name:
+            return None
+        return (code_name, tuple(names))
+
+    def _get_ctl_name(self, shape: Any, prefix: str, suffix: str) -> str:  # noqa: ANN401
+        """Gets the name of the hidden control of a cell property shape or an empty string for any other shape."""
+        # same checks as ooodev CustomProp._get_shapes_dict()
+        if not hasattr(shape, "Name"):
+            return ""
+        name = shape.Name
+        if not name or not (name.startswith(prefix) and name.endswith(suffix)):
+            return ""
+        if not shape.supportsService("com.sun.star.drawing.ControlShape"):
+            return ""
+        return name[len(prefix) : -len(suffix)]
+
+    def _get_cell_obj(self, shape: Any) -> Optional[CellObj]:  # noqa: ANN401
+        """Gets the cell the shape is anchored to or ``None`` if the shape is not anchored to a cell."""
+        if not hasattr(shape, "Anchor"):
+            return None
+        anchor = shape.Anchor
+        if anchor is None or not hasattr(anchor, "CellAddress"):
+            return None
+        return CellObj.from_cell(anchor.CellAddress)
+
+    def _scan(self) -> LpCellsScanResult:
+        cp = self._sheet.custom_cell_properties
+        prefix = cp.shape_prefix
+        suffix = cp.shape_suffix
+        draw_page = cp.draw_page.component
+        form = self._get_form()
+        if form is None:
+            return ({}, {"shapes": draw_page.getCount(), "controls": 0, "cells": {}})
+
+        if self._is_index_valid(draw_page, form):
+            known = self._sheet_index.get("cells", {})  # type: ignore
+        else:
+            # removes duplicate shapes and shapes of deleted cells.
+            cp.clean()
+            known = {}
+
+        found: Dict[CellObj, Tuple[str, str, Tuple[str, ...]]] = {}
+        for shape in draw_page:
+            # a bad shape is skipped, it must not fail the scan of the sheet.
+            try:
+                ctl_name = self._get_ctl_name(shape, prefix, suffix)
+                if not ctl_name:
+                    continue
+                cell_obj = self._get_cell_obj(shape)
+                if cell_obj is None:
+                    continue
+                item = known.get(ctl_name)
+                if item is None:
+                    item = self._read_control(form, ctl_name)
+                    if item is None:
+                        continue
+            except Exception:
+                self.log.debug("_scan() Skipping shape that could not be read.", exc_info=True)
+                continue
+            found[cell_obj] = (ctl_name, item[0], tuple(item[1]))
+
+        cells: Dict[CellObj, IndexCellProps] = {}
+        index_cells: Dict[str, Any] = {}
+        for i, cell_obj in enumerate(sorted(found, key=lambda co: (co.row, co.col_obj.index))):
+            ctl_name, code_name, names = found[cell_obj]
+            cells[cell_obj] = IndexCellProps(code_name, set(names), i)
+            index_cells[ctl_name] = [code_name, list(names)]
+
+        sheet_index = {"shapes": draw_page.getCount(), "controls": form.getCount(), "cells": index_cells}
+        return (cells, sheet_index)
+
+    def execute(self) -> LpCellsScanResult:
+        """
+        Executes the query.
+
+        Returns:
+            Tuple[Dict[CellObj, IndexCellProps], Dict[str, Any]]: Cells and the index entry of the sheet.
+        """
+        self.reads = 0
+        try:
+            result = self._scan()
+            if self.log.is_debug:
+                self.log.debug(
+                    "execute() Found %i cells on sheet %s, %i controls read.",
+                    len(result[0]),
+                    self._sheet.name,
+                    self.reads,
+                )
+            return result
+        except Exception:
+            self.log.exception("Error executing query")
+        return ({}, {})
+
+    @property
+    def sheet(self) -> CalcSheet:
+        """Gets the sheet."""
+        return self._sheet
@@ -63,6 +63,11 @@ class PandasDataObj:
     def _get_data(self) -> TupleArray:
         return self._sheet.get_array(range_obj=self._cell_rng.range_obj)
 
+    def _get_float_columns(self) -> List[int]:
+        # date columns are known to only have numbers, their values are read as float without type inference.
+        col_start = self._cell_rng.range_obj.start_col_index
+        return [i - col_start for i in self._data_info.date_columns]
+
     def _process_df_with_headers(self, df: pd.DataFrame) -> pd.DataFrame:
         with self._log.indent(True):
             try:
@@ -125,6 +130,7 @@ class PandasDataObj:
             self._log.debug("get_data_frame() Entered.")
             try:
                 data = self._get_data()
+                self._data_info.set_data(data)
                 data_len = len(data)
                 self._log.debug(f"get_data_frame() Data Length: {data_len}")
                 if data_len == 0:
@@ -135,11 +141,13 @@ class PandasDataObj:
                     if data_len == 1:
                         self._log.debug("get_data_frame() Exiting. No data. Only Headers")
                         return pd.DataFrame([], columns=data[0])
-                    df = pd.DataFrame(data[1:], columns=data[0])
+                    df = PandasUtil.array_to_data_frame(
+                        data, has_headers=True, float_columns=self._get_float_columns()
+                    )
                     self._process_df_with_headers(df)
                 else:
                     self._log.debug("get_data_frame() No Headers.")
-                    df = pd.DataFrame(data)
+                    df = PandasUtil.array_to_data_frame(data, float_columns=self._get_float_columns())
                     self._process_df_no_headers(df)
                 self._log.debug("get_data_frame() Exiting.")
                 return df
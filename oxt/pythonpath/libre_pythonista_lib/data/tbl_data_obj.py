@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import cast, List, Tuple, TYPE_CHECKING
+from typing import cast, List, Optional, Tuple, TYPE_CHECKING
 from com.sun.star.table import CellRangeAddress
 from com.sun.star.sheet import CellFlags  # const
 from ooodev.calc import CalcCellRange, RangeObj
 
 if TYPE_CHECKING:
+    from ooodev.utils.type_var import TupleArray
     from ....___lo_pip___.oxt_logger import OxtLogger
 else:
     from ___lo_pip___.oxt_logger import OxtLogger
@@ -29,6 +30,7 @@ class TblDataObj:
         self._cell_rng = cell_rng
         self._date_columns = None
         self._headers = None
+        self._data: Optional[TupleArray] = None
         with self._log.indent(True):
             self._log.debug("init complete.")
 
@@ -65,7 +67,8 @@ class TblDataObj:
         if found_rng != start_ro:
             self._log.debug("_rng_has_header() Found Range does not match start row, returning Headers: []")
             return []
-        arr = self._sheet.get_array(range_obj=found_rng)
+        # the found range is the first row of the range so the data that was already read can be used.
+        arr = self._data if self._data else self._sheet.get_array(range_obj=found_rng)
         # if self._log.is_debug:
         #     self._log.debug(f"_rng_has_header() Array: {arr}")
         try:
@@ -85,6 +88,15 @@ class TblDataObj:
             self._log.debug(f"_rng_has_header() returning Headers: {list(arr[0])}")
         return list(arr[0])
 
+    def _get_body_range_obj(self) -> RangeObj:
+        """Gets the range without the header row."""
+        ro = self._cell_rng.range_obj
+        if self.has_headers:
+            # skip the header row
+            # https://tinyurl.com/2zswb49z#subtracting-rows-using-integer
+            ro = 1 - ro
+        return ro
+
     def _get_date_columns(self) -> List[int]:
         """
         Queries all constant numeric values that have a date or time number format.
@@ -96,12 +108,7 @@ class TblDataObj:
         """
         try:
             self._log.debug("_get_date_columns() Entered")
-            ro = self._cell_rng.range_obj
-            if self.has_headers:
-                # skip the header row
-                # https://tinyurl.com/2zswb49z#subtracting-rows-using-integer
-                ro = 1 - ro
-
+            ro = self._get_body_range_obj()
             calc_rng = self._sheet.get_range(range_obj=ro)
             rv = ro.get_range_values()
             cursor = calc_rng.create_cursor()
@@ -126,6 +133,15 @@ class TblDataObj:
             self._log.exception(f"_get_date_columns() Error: {e}")
         return []
 
+    def set_data(self, data: TupleArray) -> None:
+        """
+        Sets the data array of the range when it has already been read, so the header row does not need to be read again.
+
+        Args:
+            data (TupleArray): Data array of the entire range.
+        """
+        self._data = data
+
     def get_date_column_names(self) -> List[str]:
         """Gets the names of the columns that contain date values."""
         try:
@@ -15,6 +15,8 @@ from ooodev.dialog.msgbox import MsgBox, MessageBoxResultsEnum, MessageBoxType,
 
 from ...log.py_logger import PyLogger
 from ...dialog.options.log_opt import LogOpt
+from ...dialog.log.log_text_writer import LogTextWriter
+from ...config.dialog.log_cfg import LogCfg
 from ...log.py_logger import PyLogger
 from ...const.event_const import LOG_PY_LOGGER_RESET
 from ...event.shared_event import SharedEvent
@@ -123,6 +125,7 @@ class LogWinHandler(XWindowListener, unohelper.Base):
         self._btn_clear = btn_clear
 
         self._log_txt = CtlTextEdit(cast("UnoControlEdit", self._dialog.getControl("txtLog")))
+        self._log_writer = LogTextWriter(self._log_txt, LogCfg().max_lines)
 
     def _on_log_py_inst_reset(self, src: Any, event_args: EventArgs) -> None:  # noqa: ANN401
         with self._log.indent(True):
@@ -142,7 +145,7 @@ class LogWinHandler(XWindowListener, unohelper.Base):
             self._write_line(event.event_data.log_msg)
 
     def _write_line(self, text: str) -> None:
-        self._log_txt.write_line(text)
+        self._log_writer.write(text)
 
     def _write(self, data: str, sel: Optional[Tuple[int, int]] = None) -> None:
         """Append data to edit control text"""
@@ -153,7 +156,7 @@ class LogWinHandler(XWindowListener, unohelper.Base):
 
     def clear(self) -> None:
         """Clears the Log Text."""
-        self._log_txt.text = ""
+        self._log_writer.clear()
 
     def resize(self, width: int, height: int) -> None:
         """Triggers resize of controls."""
@@ -58,6 +58,7 @@ if TYPE_CHECKING:
     from ...log.py_logger import PyLogger
     from .dialog_log_menu import DialogLogMenu
     from .dialog_log_window_listener import DialogLogWindowListener
+    from .log_text_writer import LogTextWriter
     from .key_handler import KeyHandler
 
     # from com.sun.star.frame import TaskCreator  # service
@@ -71,6 +72,7 @@ else:
     from libre_pythonista_lib.log.py_logger import PyLogger
     from libre_pythonista_lib.dialog.log.dialog_log_menu import DialogLogMenu
     from libre_pythonista_lib.dialog.log.dialog_log_window_listener import DialogLogWindowListener
+    from libre_pythonista_lib.dialog.log.log_text_writer import LogTextWriter
     from libre_pythonista_lib.dialog.log.key_handler import KeyHandler
 
 # see Also: https://ask.libreoffice.org/t/top-window-crashes-when-a-menubar-is-added/107282 This is not a issue here.
@@ -306,6 +308,7 @@ class DialogLog(TheDictionaryPartial, XTopWindowListener, unohelper.Base):
             HideInactiveSelection=True,
             Tabstop=True,
         )
+        self._log_writer = LogTextWriter(self._log_txt, self._cfg.max_lines)
         # self._code.view.addTextListener(TextListener(self))
         # self._code.add_event_text_changed(self._fn_on_text_changed)  # type: ignore
         # # self._code.add_event_key_pressed(self._fn_on_code_key_pressed)  # type: ignore
@@ -405,7 +408,7 @@ class DialogLog(TheDictionaryPartial, XTopWindowListener, unohelper.Base):
 
     def _on_log_event(self, src: Any, event: EventArgs) -> None:  # noqa: ANN401
         if self._log.is_debug:
-            self._log.debug("_on_log_event, Writing Line")
+            self._log.debug("_on_log_event, Writing %i Records", len(event.event_data.get("records", ())))
         self._write_line(event.event_data.log_msg)
 
     def _on_log_py_inst_reset(self, src: Any, event_args: EventArgs) -> None:  # noqa: ANN401
@@ -454,10 +457,10 @@ class DialogLog(TheDictionaryPartial, XTopWindowListener, unohelper.Base):
     # region Write Methods
     def clear(self) -> None:
         """Clears the Log Text."""
-        self._log_txt.text = ""
+        self._log_writer.clear()
 
     def _write_line(self, text: str) -> None:
-        self._log_txt.write_line(text)
+        self._log_writer.write(text)
 
     def _clear_data(self) -> None:
         self._log.debug("_clear_data")
@@ -654,7 +657,8 @@ class DialogLog(TheDictionaryPartial, XTopWindowListener, unohelper.Base):
 
     @text.setter
     def text(self, value: str) -> None:
-        self._log_txt.text = value
+        # the writer tracks the end of the text, the control must not be written directly.
+        self._log_writer.set_text(value)
 
     @property
     def doc(self) -> OfficeDocumentT:
@@ -0,0 +1,89 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from collections import deque
+import os
+
+import uno
+from com.sun.star.awt import Selection
+
+if TYPE_CHECKING:
+    from ooodev.dialog.dl_control import CtlTextEdit
+
+
+class LogTextWriter:
+    """
+    Writes log lines to a text control and keeps at most ``max_lines`` lines.
+
+    Lines are appended with a single ``insertText()`` call at the end of the text, the position is tracked instead of
+    being read from the control. The text is replaced with the last ``max_lines`` lines only when the control has
+    ``TRIM_RATIO`` times more lines than allowed so the text is not replaced on every write.
+    """
+
+    TRIM_RATIO = 1.25
+
+    def __init__(self, ctl: CtlTextEdit, max_lines: int) -> None:
+        """
+        Constructor
+
+        Args:
+            ctl (CtlTextEdit): Text control of the log window.
+            max_lines (int): Maximum number of lines that are kept.
+        """
+        self._ctl = ctl
+        self._max_lines = max(1, max_lines)
+        self._lines: deque[str] = deque(maxlen=max(self._max_lines, int(self._max_lines * LogTextWriter.TRIM_RATIO)))
+        self._line_count = 0
+        self._end = 0
+
+    @staticmethod
+    def _get_length(text: str) -> int:
+        # positions of the control are in UTF-16 code units.
+        return len(text.encode("utf-16-le")) // 2
+
+    def write(self, text: str) -> None:
+        """
+        Appends text to the control.
+
+        Args:
+            text (str): One or more lines separated by ``os.linesep``.
+        """
+        lines = text.split(os.linesep)
+        self._lines.extend(lines)
+        self._line_count += len(lines)
+        if self._line_count > self._lines.maxlen:  # type: ignore
+            kept = list(self._lines)[-self._max_lines :]
+            self._lines.clear()
+            self._lines.extend(kept)
+            self._line_count = len(kept)
+            data = os.linesep.join(kept)
+            self._ctl.text = data
+            self._end = self._get_length(data)
+            return
+        data = f"{os.linesep}{text}" if self._end > 0 else text
+        end = self._end + self._get_length(data)
+        self._ctl.view.insertText(Selection(self._end, self._end), data)
+        self._end = end
+
+    def set_text(self, text: str) -> None:
+        """
+        Replaces the text of the control, only the last ``max_lines`` lines are kept.
+
+        Args:
+            text (str): Lines separated by ``os.linesep``.
+        """
+        kept = text.split(os.linesep)[-self._max_lines :] if text else []
+        self._lines.clear()
+        self._lines.extend(kept)
+        self._line_count = len(kept)
+        data = os.linesep.join(kept)
+        self._ctl.text = data
+        self._end = self._get_length(data)
+
+    def clear(self) -> None:
+        """Clears the control."""
+        self.set_text("")
+
+    @property
+    def max_lines(self) -> int:
+        """Gets the maximum number of lines that are kept."""
+        return self._max_lines
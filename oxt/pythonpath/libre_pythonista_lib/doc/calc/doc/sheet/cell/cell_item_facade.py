@@ -283,7 +283,11 @@ class CellItemFacade(LogMixin):
         ctl_kind = self.qry_handler.handle(ctl_kind_qry)
         if ctl_kind != CtlKind.MAT_PLT_FIGURE and ctl_kind == current_control.control_kind:
             return
-        if self.remove_control():
+        if ctl_kind == current_control.control_kind:
+            # the figure control is built again without being removed first,
+            # CmdAddImageLinked keeps the image shape when the figure has not changed.
+            self.log.debug("Rebuilding figure control for cell: %s", self._cell.cell_obj)
+        elif self.remove_control():
             self.log.debug("Control removed for cell: %s", self._cell.cell_obj)
         else:
             self.log.error("Failed to remove control for cell: %s", self._cell.cell_obj)
@@ -304,6 +308,10 @@ class CellItemFacade(LogMixin):
                 self.log.debug("auto_update() - Document init CalculateAll not yet called. Skipping auto-update.")
                 return
             code = self._qry_src_code()
+            if self._py_src_mgr.is_source_current(self._cell.cell_obj, code):
+                # neither the code nor the sheet data it reads has changed since it was last executed.
+                self.log.debug("auto_update() - Code and inputs unchanged. Using last result.")
+                return
             self.update_code(code)
             self.log.debug("auto_update() - Code Auto Updated")
         except Exception as e:
@@ -34,6 +34,7 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.qry_handler_factory import QryHandlerFactory
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.doc.qry_lp_cells import QryLpCells
     from oxt.pythonpath.libre_pythonista_lib.data_type.calc.sheet.cell.prop.addr import Addr
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.cell_index import CellIndex
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.index_cell_props import IndexCellProps
     from oxt.pythonpath.libre_pythonista_lib.doc.doc_globals import DocGlobals
     from oxt.pythonpath.libre_pythonista_lib.event.shared_event import SharedEvent
@@ -52,6 +53,7 @@ else:
     from libre_pythonista_lib.cq.qry.qry_handler_factory import QryHandlerFactory
     from libre_pythonista_lib.cq.qry.calc.doc.qry_lp_cells import QryLpCells
     from libre_pythonista_lib.data_type.calc.sheet.cell.prop.addr import Addr
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.cell_index import CellIndex
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.index_cell_props import IndexCellProps
     from libre_pythonista_lib.doc.doc_globals import DocGlobals
     from libre_pythonista_lib.event.shared_event import SharedEvent
@@ -122,6 +124,8 @@ class CellCache(LogMixin):
         self._code_prop = self._cfg.cell_cp_codename
         self._doc = doc
         self._code_cells = cast(Dict[int, Dict[CellObj, IndexCellProps]], None)
+        self._cell_index = cast(CellIndex, None)
+        self._dirty_sheets: Set[int] = set()
         self._cache = {}
         self._previous_cell = None
         self._current_cell = None
@@ -206,31 +210,12 @@ class CellCache(LogMixin):
         if sheet_idx < 0:
             self.log.error("get_cell_before() Sheet index not set")
             raise ValueError("Sheet index not set")
-        count = self.get_cell_count(sheet_idx)
-        if count == 0:
-            return None
-        # get the index of the current cell if available
-        index = self.get_cell_index(cell, sheet_idx)
-        if self.log.is_debug:
-            self.log.debug("get_cell_before() Index for current cell %s is %i", cell, index)
-        if index == 0:
+        prev_key = self.cell_index.get_prev_key(CellIndex.to_key(cell, sheet_idx))
+        if prev_key is None or prev_key[0] != sheet_idx:
             if self.log.is_debug:
-                self.log.debug("get_cell_before() Current cell %s is the first cell", cell)
+                self.log.debug("get_cell_before() No cell before current cell %s", cell)
             return None
-        if index > 0:
-            co = self.get_by_index(index - 1, sheet_idx)
-            if self.log.is_debug:
-                self.log.debug("get_cell_before() Cell before current cell %s is %s", cell, co)
-            return co
-        # negative index means the cell is not in this instance.
-        items = self.code_cells[sheet_idx]
-        found = None
-        cell_objs = list(items.keys())
-        cell_objs.sort()
-        for co in cell_objs:
-            if co >= cell:
-                break
-            found = co
+        found = self.cell_index.get_cell(prev_key)
         if self.log.is_debug:
             self.log.debug("get_cell_before() Cell found before current cell %s is %s", cell, found)
         return found
@@ -242,12 +227,7 @@ class CellCache(LogMixin):
         Returns:
             int: Total number of cells in all the sheets.
         """
-        sheets_count = len(self.code_cells)
-        count = 0
-        for i in range(sheets_count):
-            sheet = self.code_cells[i]
-            count += len(sheet)
-        return count
+        return len(self.cell_index)
 
     def get_cell_count(self, sheet_idx: int = -1) -> int:
         if sheet_idx < 0:
@@ -255,7 +235,7 @@ class CellCache(LogMixin):
         if sheet_idx < 0:
             self.log.error("get_cell_count() Sheet index not set")
             raise ValueError("Sheet index not set")
-        return len(self.get_sheet_cells(sheet_idx))
+        return self.cell_index.get_sheet_count(sheet_idx)
 
     def get_by_index(self, index: int, sheet_idx: int = -1) -> CellObj:
         if sheet_idx < 0:
@@ -266,14 +246,11 @@ class CellCache(LogMixin):
         if self.log.is_debug:
             self.log.debug("get_by_index() Index: %i - Sheet Index: %i", index, sheet_idx)
         self._ensure_sheet_index(sheet_idx)
-        indexes = self._get_indexes(sheet_idx)
-        if self.log.is_debug:
-            for key, value in indexes.items():
-                self.log.debug("get_by_index() Index: %i - Cell: %s", key, value)
-        if index not in indexes:
+        start, stop = self.cell_index.get_sheet_bounds(sheet_idx)
+        if index < 0 or start + index >= stop:
             self.log.error("get_by_index() Index: %i not in indexes", index)
             raise ValueError(f"Index: {index} not in indexes")
-        return indexes[index]
+        return cast(CellObj, self.cell_index.get_cell(self.cell_index.get_key(start + index)))
 
     def get_cell_index(self, cell: Optional[CellObj] = None, sheet_idx: int = -1) -> int:
         if sheet_idx < 0:
@@ -286,12 +263,12 @@ class CellCache(LogMixin):
         if cell is None:
             self.log.error("get_cell_index() Cell not set")
             raise ValueError("Cell not set")
-        items = self.code_cells[sheet_idx]
-        if cell not in items:
-            self.log.debug(f"get_cell_index() Cell: {cell} not in sheet index: {sheet_idx}")
+        index = self.cell_index.index_of(CellIndex.to_key(cell, sheet_idx))
+        if index < 0:
+            self.log.debug("get_cell_index() Cell: %s not in sheet index: %i", cell, sheet_idx)
             return -1
-        props = items[cell]
-        return props.index
+        start, _ = self.cell_index.get_sheet_bounds(sheet_idx)
+        return index - start
 
     def get_first_cell(self, sheet_idx: int = -1) -> CellObj:
         if sheet_idx < 0:
@@ -304,13 +281,7 @@ class CellCache(LogMixin):
         if count == 0:
             self.log.error("get_first_cell() No cells in sheet")
             raise ValueError("No cells in sheet")
-        key = f"first_cell_{sheet_idx}"
-        if key in self._cache:
-            first_cell = self._cache[key]
-        else:
-            first_cell = self.get_by_index(0, sheet_idx)
-            self._cache[key] = first_cell
-        return first_cell
+        return self.get_by_index(0, sheet_idx)
 
     def get_index_cell_props(self, cell: CellObj, sheet_idx: int = -1) -> IndexCellProps:
         """
@@ -335,6 +306,7 @@ class CellCache(LogMixin):
         if not self.has_cell(cell, sheet_idx):
             self.log.error("get_index_cell_props() Cell: %s not in sheet index: %i", cell, sheet_idx)
             raise ValueError(f"Cell: {cell} not in sheet index: {sheet_idx}")
+        self._update_indexes(sheet_idx)
         return self.code_cells[sheet_idx][cell]
 
     def get_last_cell(self, sheet_idx: int = -1) -> CellObj:
@@ -348,13 +320,7 @@ class CellCache(LogMixin):
         if count == 0:
             self.log.error("get_last_cell() No cells in sheet")
             raise ValueError("No cells in sheet")
-        key = f"last_cell_{sheet_idx}"
-        if key in self._cache:
-            last_cell = self._cache[key]
-        else:
-            last_cell = self.get_by_index(count - 1, sheet_idx)
-            self._cache[key] = last_cell
-        return last_cell
+        return self.get_by_index(count - 1, sheet_idx)
 
     def get_next_cell(self, cell: Optional[CellObj] = None, sheet_idx: int = -1) -> Union[CellObj, None]:
         if cell is None:
@@ -367,16 +333,13 @@ class CellCache(LogMixin):
         if sheet_idx < 0:
             self.log.error("get_next_cell() Sheet index not set")
             raise ValueError("Sheet index not set")
-        if self.is_last_cell(cell, sheet_idx):
-            return None
-        index = self.get_cell_index(cell, sheet_idx)
-        if index < 0:
+        key = CellIndex.to_key(cell, sheet_idx)
+        if key not in self.cell_index:
             return None
-        count = self.get_cell_count(sheet_idx)
-        next_index = index + 1
-        if next_index >= count - 1:
+        next_key = self.cell_index.get_next_key(key)
+        if next_key is None or next_key[0] != sheet_idx:
             return None
-        return self.get_by_index(next_index, sheet_idx)
+        return self.cell_index.get_cell(next_key)
 
     def get_sheet_cells(self, sheet_idx: int = -1) -> Dict[CellObj, IndexCellProps]:
         if sheet_idx < 0:
@@ -384,6 +347,7 @@ class CellCache(LogMixin):
         if sheet_idx < 0:
             self.log.error("get_sheet_cells() Sheet index not set")
             raise ValueError("Sheet index not set")
+        self._update_indexes(sheet_idx)
         return self.code_cells[sheet_idx]
 
     def has_cell(self, cell: CellObj, sheet_idx: int = -1) -> bool:
@@ -460,7 +424,8 @@ class CellCache(LogMixin):
             code_name,
         )
         self.code_cells[sheet_idx][cell] = IndexCellProps(code_name, props)
-        self._update_indexes()
+        self.cell_index.add(CellIndex.to_key(cell, sheet_idx), cell)
+        self._dirty_sheets.add(sheet_idx)
         self.log.debug(
             "insert() Inserted Cell: %s into Sheet Index: %i with Code Name: %s",
             cell,
@@ -567,12 +532,13 @@ class CellCache(LogMixin):
             self.log.error("remove_cell() Cell: %s not in sheet index: %i", cell, sheet_idx)
             return
         del self.code_cells[sheet_idx][cell]
+        self.cell_index.remove(CellIndex.to_key(cell, sheet_idx))
+        self._dirty_sheets.add(sheet_idx)
         self.log.debug(
             "remove_cell() Removed Cell: %s from sheet index: %i",
             cell,
             sheet_idx,
         )
-        self._update_indexes()
         if "code_name_map" in self._cache:
             del self._cache["code_name_map"]
         return None
@@ -640,37 +606,28 @@ class CellCache(LogMixin):
         qry = QryLpCells(doc=self._doc)
         return self._qry_handler.handle(qry)
 
-    def _get_indexes(self, sheet_idx: int = -1) -> Dict[int, CellObj]:
-        if sheet_idx < 0:
-            sheet_idx = self.current_sheet_index
-        if sheet_idx < 0:
-            raise ValueError("Sheet index not set")
-        key = f"{sheet_idx}_indexes"
-        if key in self._cache:
-            return self._cache[key]
-        result = {}
-        items = self.code_cells[sheet_idx]
-        for cell, props in items.items():
-            result[props.index] = cell
-        self._cache[key] = result
+    def _get_cell_index(self) -> CellIndex:
+        result = CellIndex()
+        for sheet_idx, items in self.code_cells.items():
+            for cell in items:
+                result.add(CellIndex.to_key(cell, sheet_idx), cell)
         return result
 
-    def _update_indexes(self) -> None:
-        self.log.debug("_update_indexes() Updating Indexes")
-        count = 0
-        for sheet_idx in self.code_cells:
-            i = -1
-            items = self.code_cells[sheet_idx]
-            for itm in items.values():
-                i += 1
-                itm.index = i
-                count += 1
-
-            # clear the cache for the indexes
-            key = f"{sheet_idx}_indexes"
-            if key in self._cache:
-                del self._cache[key]
-        self.log.debug("_update_indexes() %i Indexes Updated", count)
+    def _update_indexes(self, sheet_idx: int) -> None:
+        # Inserting and removing cells only updates the cell index.
+        # The sheet items are put back in order and renumbered when they are read.
+        if sheet_idx not in self._dirty_sheets:
+            return
+        self._dirty_sheets.discard(sheet_idx)
+        items = self.code_cells[sheet_idx]
+        sorted_items: Dict[CellObj, IndexCellProps] = {}
+        for i, key in enumerate(self.cell_index.get_sheet_keys(sheet_idx)):
+            cell = cast(CellObj, self.cell_index.get_cell(key))
+            props = items[cell]
+            props.index = i
+            sorted_items[cell] = props
+        self.code_cells[sheet_idx] = sorted_items
+        self.log.debug("_update_indexes() %i Indexes Updated for sheet index: %i", len(sorted_items), sheet_idx)
 
     def _ensure_sheet_index(self, sheet_idx: int) -> None:
         self.log.debug("_ensure_sheet_index() Sheet Index: %s", sheet_idx)
@@ -751,6 +708,17 @@ class CellCache(LogMixin):
             self._code_cells = self._qry_lp_cells()
         return self._code_cells
 
+    @property
+    def cell_index(self) -> CellIndex:
+        """
+        Gets the sorted index of the code cells of all sheets.
+
+        Keys are ``(sheet index, row, column)`` tuples.
+        """
+        if self._cell_index is None:
+            self._cell_index = self._get_cell_index()
+        return self._cell_index
+
     @property
     def code_name_cell_map(self) -> Dict[str, CellObj]:
         """
@@ -0,0 +1,204 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, Optional, Tuple, TYPE_CHECKING
+from sortedcontainers import SortedDict
+
+if TYPE_CHECKING:
+    from ooodev.utils.data_type.cell_obj import CellObj
+
+CellKey = Tuple[int, int, int]
+"""Sheet index, zero based row and zero based column."""
+
+
+class CellIndex:
+    """
+    Sorted index of cells keyed by ``(sheet index, row, column)``.
+
+    The keys are kept in a sorted array so finding the position of a cell, the cell at a position and the cells
+    before and after a cell are ``O(log n)``. Inserting and removing a cell does not require the positions of the
+    other cells to be updated.
+
+    Each key maps to the ``CellObj`` it was added with.
+    """
+
+    def __init__(self, cells: Optional[Iterable[Tuple[int, CellObj]]] = None) -> None:
+        """
+        Constructor
+
+        Args:
+            cells (Iterable[Tuple[int, CellObj]], optional): Sheet index and cell pairs to add.
+        """
+        self._data = SortedDict()
+        if cells is not None:
+            for sheet_idx, cell in cells:
+                self._data[CellIndex.to_key(cell, sheet_idx)] = cell
+
+    # region Static Methods
+    @staticmethod
+    def to_key(cell: CellObj, sheet_idx: int = -1) -> CellKey:
+        """
+        Gets the key of a cell.
+
+        Args:
+            cell (CellObj): Cell.
+            sheet_idx (int, optional): Sheet index. Defaults to the sheet index of ``cell``.
+
+        Returns:
+            CellKey: Tuple of ``(sheet index, row, column)``, row and column are zero based.
+        """
+        if sheet_idx < 0:
+            sheet_idx = cell.sheet_idx
+        return (sheet_idx, cell.row - 1, cell.col_obj.index)
+
+    # endregion Static Methods
+
+    # region Dunder Methods
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: CellKey) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[CellKey]:
+        return iter(self._data)
+
+    # endregion Dunder Methods
+
+    # region Public Methods
+    def add(self, key: CellKey, cell: CellObj) -> None:
+        """
+        Adds or replaces a cell.
+
+        Args:
+            key (CellKey): Key of the cell.
+            cell (CellObj): Cell.
+        """
+        self._data[key] = cell
+
+    def remove(self, key: CellKey) -> bool:
+        """
+        Removes a cell.
+
+        Args:
+            key (CellKey): Key of the cell.
+
+        Returns:
+            bool: ``True`` if the cell was in the index.
+        """
+        return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Removes all cells."""
+        self._data.clear()
+
+    def get_cell(self, key: CellKey) -> Optional[CellObj]:
+        """
+        Gets the cell of a key.
+
+        Args:
+            key (CellKey): Key of the cell.
+
+        Returns:
+            CellObj, None: Cell or ``None`` if the key is not in the index.
+        """
+        return self._data.get(key)
+
+    def index_of(self, key: CellKey) -> int:
+        """
+        Gets the position of a cell.
+
+        Args:
+            key (CellKey): Key of the cell.
+
+        Returns:
+            int: Zero based position or ``-1`` if the key is not in the index.
+        """
+        if key not in self._data:
+            return -1
+        return self._data.index(key)
+
+    def get_key(self, index: int) -> CellKey:
+        """
+        Gets the key at a position.
+
+        Args:
+            index (int): Zero based position, negative values count from the end.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Returns:
+            CellKey: Key at the position.
+        """
+        return self._data.keys()[index]
+
+    def get_next_key(self, key: CellKey) -> Optional[CellKey]:
+        """
+        Gets the key after a key. The key does not have to be in the index.
+
+        Args:
+            key (CellKey): Key of the cell.
+
+        Returns:
+            CellKey, None: Next key or ``None`` if there is no key after ``key``.
+        """
+        i = self._data.bisect_right(key)
+        if i >= len(self._data):
+            return None
+        return self._data.keys()[i]
+
+    def get_prev_key(self, key: CellKey) -> Optional[CellKey]:
+        """
+        Gets the key before a key. The key does not have to be in the index.
+
+        Args:
+            key (CellKey): Key of the cell.
+
+        Returns:
+            CellKey, None: Previous key or ``None`` if there is no key before ``key``.
+        """
+        i = self._data.bisect_left(key)
+        if i == 0:
+            return None
+        return self._data.keys()[i - 1]
+
+    def get_sheet_bounds(self, sheet_idx: int) -> Tuple[int, int]:
+        """
+        Gets the positions of the cells of a sheet.
+
+        Args:
+            sheet_idx (int): Sheet index.
+
+        Returns:
+            Tuple[int, int]: Start and stop positions, the cells of the sheet are ``start <= i < stop``.
+        """
+        start = self._data.bisect_left((sheet_idx,))
+        stop = self._data.bisect_left((sheet_idx + 1,))
+        return (start, stop)
+
+    def get_sheet_count(self, sheet_idx: int) -> int:
+        """
+        Gets the number of cells of a sheet.
+
+        Args:
+            sheet_idx (int): Sheet index.
+
+        Returns:
+            int: Number of cells.
+        """
+        start, stop = self.get_sheet_bounds(sheet_idx)
+        return stop - start
+
+    def get_sheet_keys(self, sheet_idx: int) -> Iterator[CellKey]:
+        """
+        Gets the keys of a sheet in order.
+
+        Args:
+            sheet_idx (int): Sheet index.
+
+        Returns:
+            Iterator[CellKey]: Keys of the sheet.
+        """
+        start, stop = self.get_sheet_bounds(sheet_idx)
+        return self._data.islice(start, stop)
+
+    # endregion Public Methods
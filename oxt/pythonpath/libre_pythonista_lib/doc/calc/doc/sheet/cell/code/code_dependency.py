@@ -0,0 +1,377 @@
+from __future__ import annotations
+from typing import Any, FrozenSet, List, Optional, Set, Tuple, Union
+import ast
+import builtins
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Names that are set by the source manager for every cell.
+# They never create a dependency between cells.
+_IGNORED_NAMES = frozenset({"_", "CURRENT_CELL_ID", "CURRENT_CELL_OBJ", "PY_ARGS"})
+
+# Calls that can read or write module globals in ways that can not be tracked from the AST.
+_OPAQUE_CALLS = frozenset({"exec", "eval", "globals", "locals", "vars", "setattr", "delattr", "__import__"})
+
+# Builtin functions that may change the objects they are given.
+_MUTATING_BUILTINS = frozenset({"next", "exec", "eval", "setattr", "delattr"})
+
+# Same address forms as the lp() rules in mod_helper.lp_rules (cell, range, sheet cell and sheet range).
+_RE_LP_ADDR = re.compile(
+    r"^(?:(?P<sheet>[A-Za-z\s\d]+)\.)?(?P<col1>[A-Za-z]{1,3})(?P<row1>\d{1,7})(?::(?P<col2>[A-Za-z]{1,3})(?P<row2>\d{1,7}))?$"
+)
+
+
+def _col_to_index(col: str) -> int:
+    """Converts a column name such as ``A`` or ``AB`` to a zero based index."""
+    result = 0
+    for char in col.upper():
+        result = result * 26 + (ord(char) - ord("A") + 1)
+    return result - 1
+
+
+@dataclass(frozen=True)
+class LpRef:
+    """
+    Cell or range that is referenced by a ``lp()`` call.
+
+    Indexes are zero based. ``sheet`` is an empty string when the address does not contain a sheet name,
+    in which case the address is relative to the sheet of the cell that contains the code.
+    """
+
+    sheet: str
+    col_start: int
+    row_start: int
+    col_end: int
+    row_end: int
+
+    @staticmethod
+    def from_addr(addr: str) -> Optional[LpRef]:
+        """
+        Gets a reference from a ``lp()`` address.
+
+        Args:
+            addr (str): Address such as ``A1``, ``A1:C10``, ``Sheet1.A1`` or ``Sheet1.A1:C10``.
+
+        Returns:
+            LpRef, None: Reference or ``None`` if the address is not a cell or range address, such as a named range.
+        """
+        m = _RE_LP_ADDR.match(addr.strip())
+        if m is None:
+            return None
+        col1 = _col_to_index(m.group("col1"))
+        row1 = int(m.group("row1")) - 1
+        if m.group("col2"):
+            col2 = _col_to_index(m.group("col2"))
+            row2 = int(m.group("row2")) - 1
+        else:
+            col2 = col1
+            row2 = row1
+        return LpRef(
+            sheet=m.group("sheet") or "",
+            col_start=min(col1, col2),
+            row_start=min(row1, row2),
+            col_end=max(col1, col2),
+            row_end=max(row1, row2),
+        )
+
+
+@dataclass(frozen=True)
+class CallArg:
+    """Module level name that is passed to a call."""
+
+    name: str
+    callee: str
+    """Called name or the base name of the object whose method is called. Empty string if not a name."""
+    is_method: bool
+
+    @property
+    def is_safe_builtin(self) -> bool:
+        """``True`` if the name is passed to a builtin function that does not change it, such as ``len()``."""
+        return not self.is_method and hasattr(builtins, self.callee) and self.callee not in _MUTATING_BUILTINS
+
+
+@dataclass(frozen=True)
+class CodeDependency:
+    """
+    Names and ``lp()`` addresses that the code of a cell reads and writes.
+
+    ``binds`` are the module level names the code (re)binds, ``mutates`` are module level names whose
+    objects may be changed in place (``x.a = 1``, ``x[0] = 1``, ``x += 1``, ``x.append(1)``).
+    ``writes`` is the union of both.
+
+    ``calls`` are the names that are called and ``call_args`` the names that are passed to a call.
+    A called function or a function that is given an object may change objects in place in ways that
+    can not be tracked from the AST.
+    """
+
+    reads: FrozenSet[str]
+    binds: FrozenSet[str]
+    mutates: FrozenSet[str]
+    deletes: FrozenSet[str]
+    lp_refs: Tuple[LpRef, ...]
+    lp_unresolved: bool
+    """``True`` if a ``lp()`` call uses a named range or an address that is not a string literal."""
+    is_opaque: bool
+    """``True`` if the code can not be analyzed, such as syntax errors or calls to ``exec()`` or ``globals()``."""
+    calls: FrozenSet[str] = frozenset()
+    call_args: FrozenSet[CallArg] = frozenset()
+    imports: FrozenSet[str] = frozenset()
+    """Module level names bound by ``import`` statements."""
+
+    @property
+    def writes(self) -> FrozenSet[str]:
+        return self.binds | self.mutates
+
+    @property
+    def uses_lp(self) -> bool:
+        return self.lp_unresolved or len(self.lp_refs) > 0
+
+
+class _DependencyVisitor(ast.NodeVisitor):
+    """Walks the AST of a cell and collects the names it reads and writes."""
+
+    def __init__(self) -> None:
+        self.reads: Set[str] = set()
+        self.binds: Set[str] = set()
+        self.mutates: Set[str] = set()
+        self.deletes: Set[str] = set()
+        self.calls: Set[str] = set()
+        self.call_args: Set[CallArg] = set()
+        self.imports: Set[str] = set()
+        self.lp_refs: List[LpRef] = []
+        self.lp_unresolved = False
+        self.is_opaque = False
+        # greater than zero when inside a function, lambda, class or comprehension scope.
+        self._depth = 0
+        # greater than zero when inside a function, lambda or class scope.
+        self._fn_depth = 0
+
+    # region Helpers
+    def _get_base_name(self, node: ast.AST) -> str:
+        while isinstance(node, (ast.Attribute, ast.Subscript, ast.Starred)):
+            node = node.value
+        if isinstance(node, ast.Name):
+            return node.id
+        return ""
+
+    def _add_mutate(self, node: ast.AST) -> None:
+        if self._depth > 0:
+            return
+        name = self._get_base_name(node)
+        if name:
+            self.mutates.add(name)
+
+    def _visit_scope(self, node: ast.AST, is_fn: bool = False) -> None:
+        self._depth += 1
+        if is_fn:
+            self._fn_depth += 1
+        try:
+            self.generic_visit(node)
+        finally:
+            self._depth -= 1
+            if is_fn:
+                self._fn_depth -= 1
+
+    def _visit_def(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef]) -> None:
+        # decorators, default values and base classes are evaluated in the enclosing scope.
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        if isinstance(node, ast.ClassDef):
+            for base in node.bases:
+                self.visit(base)
+            for keyword in node.keywords:
+                self.visit(keyword)
+        else:
+            self.visit(node.args)
+            if node.returns is not None:
+                self.visit(node.returns)
+        if self._depth == 0:
+            self.binds.add(node.name)
+        self._depth += 1
+        self._fn_depth += 1
+        try:
+            for stmt in node.body:
+                self.visit(stmt)
+        finally:
+            self._depth -= 1
+            self._fn_depth -= 1
+
+    # endregion Helpers
+
+    # region Visitors
+    def visit_Name(self, node: ast.Name) -> None:  # noqa: N802
+        if isinstance(node.ctx, ast.Load):
+            self.reads.add(node.id)
+        elif self._depth == 0:
+            self.binds.add(node.id)
+            if isinstance(node.ctx, ast.Del):
+                self.deletes.add(node.id)
+
+    def visit_NamedExpr(self, node: ast.AST) -> None:  # noqa: N802
+        # the target of a walrus expression binds in the enclosing scope, even inside of a comprehension.
+        target = getattr(node, "target", None)
+        if isinstance(target, ast.Name) and self._fn_depth == 0:
+            self.binds.add(target.id)
+        self.visit(getattr(node, "value"))
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:  # noqa: N802
+        if not isinstance(node.ctx, ast.Load):
+            self._add_mutate(node)
+        self.generic_visit(node)
+
+    def visit_Subscript(self, node: ast.Subscript) -> None:  # noqa: N802
+        if not isinstance(node.ctx, ast.Load):
+            self._add_mutate(node)
+        self.generic_visit(node)
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:  # noqa: N802
+        # x += [1] changes a list in place so the target is treated as mutated rather than bound.
+        if isinstance(node.target, ast.Name):
+            self.reads.add(node.target.id)
+            self._add_mutate(node.target)
+        else:
+            self.visit(node.target)
+        self.visit(node.value)
+
+    def visit_Expr(self, node: ast.Expr) -> None:  # noqa: N802
+        # A method call whose result is discarded is most likely called for its side effect such as lst.append(1)
+        # This includes the last expression of a cell, its value may be the result of a call such as df.drop().
+        if isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Attribute):
+            self._add_mutate(node.value.func.value)
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+        if isinstance(node.func, ast.Name):
+            if node.func.id in _OPAQUE_CALLS:
+                self.is_opaque = True
+            elif node.func.id == "lp":
+                self._add_lp_call(node)
+                self.generic_visit(node)
+                return
+            self.calls.add(node.func.id)
+        callee = self._get_base_name(node.func)
+        is_method = isinstance(node.func, ast.Attribute)
+        for arg in [*node.args, *(keyword.value for keyword in node.keywords)]:
+            name = self._get_base_name(arg)
+            if name and name not in _IGNORED_NAMES:
+                self.call_args.add(CallArg(name=name, callee=callee, is_method=is_method))
+        self.generic_visit(node)
+
+    def _add_lp_call(self, node: ast.Call) -> None:
+        addr: Any = None
+        if node.args:
+            addr = node.args[0]
+        else:
+            for keyword in node.keywords:
+                if keyword.arg == "addr":
+                    addr = keyword.value
+                    break
+        if isinstance(addr, ast.Constant) and isinstance(addr.value, str):
+            ref = LpRef.from_addr(addr.value)
+            if ref is None:
+                self.lp_unresolved = True
+            else:
+                self.lp_refs.append(ref)
+        else:
+            self.lp_unresolved = True
+
+    def visit_Import(self, node: ast.Import) -> None:  # noqa: N802
+        if self._depth > 0:
+            return
+        for alias in node.names:
+            name = alias.asname or alias.name.split(".")[0]
+            self.binds.add(name)
+            self.imports.add(name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # noqa: N802
+        if self._depth > 0:
+            return
+        for alias in node.names:
+            if alias.name == "*":
+                self.is_opaque = True
+                continue
+            self.binds.add(alias.asname or alias.name)
+            self.imports.add(alias.asname or alias.name)
+
+    def visit_Global(self, node: ast.Global) -> None:  # noqa: N802
+        self.is_opaque = True
+
+    def visit_Nonlocal(self, node: ast.Nonlocal) -> None:  # noqa: N802
+        self.is_opaque = True
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:  # noqa: N802
+        if node.name and self._depth == 0:
+            self.binds.add(node.name)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
+        self._visit_def(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:  # noqa: N802
+        self._visit_def(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
+        self._visit_def(node)
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:  # noqa: N802
+        self._visit_scope(node, is_fn=True)
+
+    def visit_ListComp(self, node: ast.ListComp) -> None:  # noqa: N802
+        self._visit_scope(node)
+
+    def visit_SetComp(self, node: ast.SetComp) -> None:  # noqa: N802
+        self._visit_scope(node)
+
+    def visit_DictComp(self, node: ast.DictComp) -> None:  # noqa: N802
+        self._visit_scope(node)
+
+    def visit_GeneratorExp(self, node: ast.GeneratorExp) -> None:  # noqa: N802
+        self._visit_scope(node)
+
+    # endregion Visitors
+
+
+def _filter_names(names: Set[str]) -> FrozenSet[str]:
+    return frozenset(name for name in names if name not in _IGNORED_NAMES)
+
+
+@lru_cache(maxsize=1024)
+def get_code_dependency(code: str) -> CodeDependency:
+    """
+    Gets the dependency information for the code of a cell.
+
+    Results are cached by source code.
+
+    Args:
+        code (str): Python source code of the cell.
+
+    Returns:
+        CodeDependency: Dependency information. If the code can not be parsed then ``is_opaque`` is ``True``.
+    """
+    try:
+        tree = ast.parse(code, mode="exec")
+    except (SyntaxError, ValueError):
+        return CodeDependency(
+            reads=frozenset(),
+            binds=frozenset(),
+            mutates=frozenset(),
+            deletes=frozenset(),
+            lp_refs=(),
+            lp_unresolved=False,
+            is_opaque=True,
+        )
+    visitor = _DependencyVisitor()
+    visitor.visit(tree)
+    return CodeDependency(
+        reads=_filter_names(visitor.reads),
+        binds=_filter_names(visitor.binds),
+        mutates=_filter_names(visitor.mutates),
+        deletes=_filter_names(visitor.deletes),
+        lp_refs=tuple(visitor.lp_refs),
+        lp_unresolved=visitor.lp_unresolved,
+        is_opaque=visitor.is_opaque,
+        calls=_filter_names(visitor.calls),
+        call_args=frozenset(visitor.call_args),
+        imports=_filter_names(visitor.imports),
+    )
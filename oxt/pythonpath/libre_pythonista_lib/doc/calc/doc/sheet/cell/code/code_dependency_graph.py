@@ -0,0 +1,205 @@
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import (
+        CodeDependency,
+        LpRef,
+        get_code_dependency,
+    )
+else:
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import (
+        CodeDependency,
+        LpRef,
+        get_code_dependency,
+    )
+
+CellKey = Tuple[int, int, int]
+"""Cell key in the format of (sheet index, row, column)."""
+
+
+class DirtyResult:
+    """Result of :py:meth:`CodeDependencyGraph.get_dirty_keys`."""
+
+    def __init__(self, keys: List[CellKey], is_safe: bool) -> None:
+        self.keys = keys
+        """Keys of the cells that must be executed again, in execution order."""
+        self.is_safe = is_safe
+        """
+        ``False`` when an incremental update can not be trusted and the whole module must be rebuilt.
+        This is the case when code mutates in place an object that was created by a cell that is not executed again,
+        or when code calls a function of another cell or passes an object of another cell to a call.
+        """
+
+    def __repr__(self) -> str:
+        return f"<DirtyResult(keys={len(self.keys)}, is_safe={self.is_safe})>"
+
+
+class CodeDependencyGraph:
+    """
+    Dependency graph of the code cells of a document.
+
+    Cells are added in execution order (sheet, row, column).
+    A cell depends on a previous cell when it reads a name the previous cell writes
+    or when one of its ``lp()`` calls references the output of the previous cell.
+    """
+
+    def __init__(self, sheet_names: Optional[Dict[str, int]] = None) -> None:
+        """
+        Constructor
+
+        Args:
+            sheet_names (Dict[str, int], optional): Sheet name to sheet index map used to resolve ``lp()`` addresses
+                that contain a sheet name. Defaults to None.
+        """
+        self._keys: List[CellKey] = []
+        self._deps: Dict[CellKey, CodeDependency] = {}
+        self._sheet_names = {} if sheet_names is None else sheet_names
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: CellKey) -> bool:
+        return key in self._deps
+
+    def __getitem__(self, key: CellKey) -> CodeDependency:
+        return self._deps[key]
+
+    def add(self, key: CellKey, code: str) -> None:
+        """
+        Adds a cell to the graph. Cells must be added in execution order.
+
+        Args:
+            key (Tuple[int, int, int]): Cell key in the format of (sheet index, row, column).
+            code (str): Source code of the cell.
+        """
+        if key not in self._deps:
+            self._keys.append(key)
+        self._deps[key] = get_code_dependency(code)
+
+    def _is_lp_dependent(self, key: CellKey, dep: CodeDependency, dirty: Iterable[CellKey]) -> bool:
+        """
+        Gets if the ``lp()`` calls of a cell may read the output of any of the dirty cells.
+
+        The output of a code cell may be an array that spills to the right and down so
+        any range that ends on or after a dirty cell on the same sheet is considered dependent.
+        """
+        if not dep.uses_lp:
+            return False
+        if dep.lp_unresolved:
+            return True
+        for ref in dep.lp_refs:
+            sheet_idx = self._get_ref_sheet_index(key, ref)
+            if sheet_idx < 0:
+                return True
+            for dirty_key in dirty:
+                if dirty_key[0] != sheet_idx:
+                    continue
+                if ref.row_end >= dirty_key[1] and ref.col_end >= dirty_key[2]:
+                    return True
+        return False
+
+    def _get_ref_sheet_index(self, key: CellKey, ref: LpRef) -> int:
+        if not ref.sheet:
+            return key[0]
+        return self._sheet_names.get(ref.sheet, -1)
+
+    def get_dirty_keys(
+        self, key: CellKey, prev_code: str = "", ignore_mutates: Optional[Iterable[str]] = None
+    ) -> DirtyResult:
+        """
+        Gets the changed cell and all the cells that transitively depend on it.
+
+        Args:
+            key (Tuple[int, int, int]): Key of the cell that changed.
+            prev_code (str, optional): Code of the cell before the change.
+                Names written by the previous code are also considered changed. Defaults to "".
+            ignore_mutates (Iterable[str], optional): Names that are safe to mutate in place, such as modules.
+                Defaults to None.
+
+        Returns:
+            DirtyResult: Dirty cell keys in execution order.
+        """
+        if key not in self._deps:
+            return DirtyResult(keys=[], is_safe=False)
+        ignored: Set[str] = set() if ignore_mutates is None else set(ignore_mutates)
+        start = self._keys.index(key)
+        dirty: List[CellKey] = []
+        dirty_writes: Set[str] = set()
+        all_dirty = False
+        is_safe = True
+        # name -> True if the current binding of the name was created by a dirty cell in this pass.
+        fresh: Dict[str, bool] = {}
+        # name -> True if a dirty cell read the name since it was last bound.
+        dirty_read: Dict[str, bool] = {}
+        # names bound by the cells before the current cell, and the names of those that are imported.
+        bound: Set[str] = set()
+        imported: Set[str] = set()
+        for i in range(start):
+            dep = self._deps[self._keys[i]]
+            bound.update(dep.binds)
+            imported.difference_update(dep.binds)
+            imported.update(dep.imports)
+
+        if prev_code:
+            prev_dep = get_code_dependency(prev_code)
+            if prev_dep.is_opaque:
+                all_dirty = True
+            dirty_writes.update(prev_dep.writes)
+
+        for i in range(start, len(self._keys)):
+            cell_key = self._keys[i]
+            dep = self._deps[cell_key]
+            if i == start or all_dirty or dep.is_opaque:
+                is_dirty = True
+            elif dep.reads & dirty_writes:
+                is_dirty = True
+            else:
+                is_dirty = self._is_lp_dependent(cell_key, dep, dirty)
+
+            for name in dep.mutates:
+                # a cell that binds and then mutates a name, such as lst = []; lst.append(1), mutates its own object.
+                if name in ignored or name in dep.binds or fresh.get(name, False):
+                    continue
+                if is_dirty or dirty_read.get(name, False):
+                    # the object would be mutated twice or a dirty cell already read it after it was mutated.
+                    is_safe = False
+
+            if is_dirty and is_safe:
+                # a function of another cell may mutate any of its globals in place, such as def add(): lst.append(1)
+                for name in dep.calls:
+                    if name in bound and name not in imported and name not in ignored and name not in dep.binds:
+                        is_safe = False
+                # a function may mutate an object it is given in place, such as random.shuffle(lst)
+                for arg in dep.call_args:
+                    name = arg.name
+                    if name not in bound or name in ignored or name in dep.binds or fresh.get(name, False):
+                        continue
+                    if arg.is_safe_builtin and arg.callee not in bound:
+                        continue
+                    is_module = arg.callee in ignored or arg.callee in imported or arg.callee in dep.imports
+                    if arg.is_method and not is_module and (arg.callee in dep.binds or fresh.get(arg.callee, False)):
+                        # a method of an object created in this pass, such as lst.append(x)
+                        continue
+                    is_safe = False
+
+            if is_dirty:
+                dirty.append(cell_key)
+                dirty_writes.update(dep.writes)
+                if dep.is_opaque:
+                    all_dirty = True
+                for name in dep.reads:
+                    dirty_read[name] = True
+            for name in dep.binds:
+                fresh[name] = is_dirty
+                dirty_read[name] = False
+            bound.update(dep.binds)
+            imported.difference_update(dep.binds)
+            imported.update(dep.imports)
+
+        return DirtyResult(keys=dirty, is_safe=is_safe)
+
+    @property
+    def keys(self) -> List[CellKey]:
+        """Cell keys in execution order."""
+        return self._keys
@@ -0,0 +1,78 @@
+from __future__ import annotations
+from typing import cast, Optional
+import ast
+import hashlib
+import types
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CompiledCode:
+    """
+    Parsed and compiled artifacts of a code snippet.
+
+    ``ast_mod`` is shared by every execution of the same source and must be treated as read only.
+    """
+
+    ast_mod: ast.Module
+    """AST of the complete code snippet. Used by ``CodeRules.get_matched_rule()``"""
+    exec_code: types.CodeType
+    """Code object for all the statements except the trailing expression or assignment."""
+    eval_code: Optional[types.CodeType]
+    """Code object for the value of the trailing expression or assignment, if any."""
+    assign_name: str
+    """Name of the trailing assignment target, if any."""
+
+    @staticmethod
+    def get_key(code_snippet: str) -> str:
+        """Gets the cache key for a code snippet."""
+        return hashlib.sha256(code_snippet.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def from_code(code_snippet: str) -> CompiledCode:
+        """
+        Parses and compiles a code snippet.
+
+        Args:
+            code_snippet (str): Python source code.
+
+        Raises:
+            SyntaxError: If the code is not valid.
+
+        Returns:
+            CompiledCode: Compiled artifacts.
+        """
+        # Parse the code as a full module
+        tree = ast.parse(code_snippet, mode="exec")
+        body = list(tree.body)
+
+        # If the last node is an expression, remove it for separate handling.
+        # The tree is not changed so it can be shared with the code rules.
+        last_value = None
+        assign_name = ""
+        last_node = body[-1] if body else None
+        if isinstance(last_node, ast.Expr):
+            last_value = body.pop().value  # type: ignore
+        elif isinstance(last_node, ast.Assign):
+            last_value = cast(ast.Assign, body.pop()).value
+            try:
+                assign_name = last_node.targets[0].id  # type: ignore
+            except Exception:
+                assign_name = ""
+        elif isinstance(last_node, ast.AnnAssign) and last_node.value is not None:
+            last_value = cast(ast.AnnAssign, body.pop()).value
+            try:
+                assign_name = last_node.target.id  # type: ignore
+            except Exception:
+                assign_name = ""
+
+        # Compile all but the last expression as 'exec'
+        module_body = ast.fix_missing_locations(ast.Module(body=body, type_ignores=[]))
+        exec_code = compile(module_body, "<string>", "exec")
+
+        eval_code = None
+        if last_value is not None:
+            expr = ast.fix_missing_locations(ast.Expression(last_value))
+            eval_code = compile(expr, "<string>", "eval")
+
+        return CompiledCode(ast_mod=tree, exec_code=exec_code, eval_code=eval_code, assign_name=assign_name)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+from typing import Any, Callable, List, Optional
+import threading
+import time
+import types
+
+_FORWARDED = frozenset(("__doc__", "__spec__", "__loader__", "__package__"))
+"""Attributes that ``ModuleType`` sets to ``None`` and are read from the real module."""
+
+
+class LazyModule(types.ModuleType):
+    """
+    Module placeholder that imports the real module the first time one of its attributes is used.
+
+    Used for the modules that are bound in every document module such as ``np``, ``pd`` and ``plt``
+    so documents that do not use them do not pay the import cost.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[], types.ModuleType],
+        on_load: Optional[Callable[[LazyModule, types.ModuleType, float], None]] = None,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            name (str): Name of the module such as ``numpy``.
+            loader (Callable[[], ModuleType]): Imports and returns the real module.
+            on_load (Callable[[LazyModule, ModuleType, float], None], optional): Called after the module is imported
+                with this placeholder, the real module and the import time in seconds.
+        """
+        super().__init__(name)
+        self._lazy_loader = loader
+        self._lazy_on_load = on_load
+        self._lazy_module: Optional[types.ModuleType] = None
+        self._lazy_lock = threading.Lock()
+
+    def _lazy_load(self) -> types.ModuleType:
+        mod = self._lazy_module
+        if mod is not None:
+            return mod
+        with self._lazy_lock:
+            if self._lazy_module is None:
+                start = time.perf_counter()
+                mod = self._lazy_loader()
+                elapsed = time.perf_counter() - start
+                self._lazy_module = mod
+                if self._lazy_on_load is not None:
+                    self._lazy_on_load(self, mod, elapsed)
+            return self._lazy_module  # type: ignore
+
+    def __getattribute__(self, name: str) -> Any:  # noqa: ANN401
+        if name in _FORWARDED:
+            return getattr(object.__getattribute__(self, "_lazy_load")(), name)
+        return super().__getattribute__(name)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        if name.startswith("_lazy_"):
+            raise AttributeError(name)
+        return getattr(self._lazy_load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        if name.startswith("_lazy_"):
+            super().__setattr__(name, value)
+        else:
+            setattr(self._lazy_load(), name, value)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._lazy_load())
+
+    def __repr__(self) -> str:
+        if self._lazy_module is None:
+            return f"<lazy module '{self.__name__}'>"
+        return repr(self._lazy_module)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Gets if the real module has been imported."""
+        return self._lazy_module is not None
@@ -31,6 +31,8 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.qry_handler_factory import QryHandlerFactory
     from oxt.pythonpath.libre_pythonista_lib.data.pandas_data_obj import PandasDataObj
     from oxt.pythonpath.libre_pythonista_lib.log.log_inst import LogInst
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_read_cache import LpReadCache
+    from oxt.pythonpath.libre_pythonista_lib.sheet.listen.code_sheet_modify_listener import CodeSheetModifyListener
 
     CURRENT_CELL_OBJ: CellObj
 else:
@@ -42,6 +44,8 @@ else:
     from libre_pythonista_lib.cq.qry.qry_handler_factory import QryHandlerFactory
     from libre_pythonista_lib.data.pandas_data_obj import PandasDataObj
     from libre_pythonista_lib.log.log_inst import LogInst
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_read_cache import LpReadCache
+    from libre_pythonista_lib.sheet.listen.code_sheet_modify_listener import CodeSheetModifyListener
 
 # endregion imports
 
@@ -61,6 +65,49 @@ def _collapse_to_used(sheet: CalcSheet, rng_obj: RangeObj) -> RangeObj:
         return rng_obj
 
 
+def _is_sheet_watched(sheet: CalcSheet) -> bool:
+    # cached reads are only removed when the sheet modify listener of the sheet is active.
+    unique_id = sheet.unique_id
+    if not CodeSheetModifyListener.has_listener(unique_id):
+        return False
+    return CodeSheetModifyListener.get_listener(unique_id).is_trigger()
+
+
+def _read_range(
+    doc: CalcDoc,
+    sheet: CalcSheet,
+    addr_rng: RangeObj,
+    log: OxtLogger,
+    collapse: bool,
+    column_types: Any,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    read_cache = LpReadCache(doc.runtime_uid)
+    key = None
+    try:
+        if _is_sheet_watched(sheet):
+            key = LpReadCache.get_key(sheet.unique_id, addr_rng, collapse, column_types)
+    except Exception:
+        log.debug("lp - Unable to get read cache key for %s", addr_rng, exc_info=True)
+        key = None
+
+    if key is not None:
+        item = read_cache.get(key)
+        if item is not None:
+            log.debug("lp - Read cache hit for: %s", addr_rng)
+            return _set_last_lp_result(item.data, headers=item.headers, range_obj=item.range_obj)
+
+    req_rng = addr_rng
+    if collapse:
+        addr_rng = _collapse_to_used(sheet, addr_rng)
+        log.debug("lp - Collapsed addr_rng: %s", addr_rng)
+    cr = sheet.get_range(range_obj=addr_rng)
+    pdo = PandasDataObj(cell_rng=cr, col_types=column_types)
+    df = pdo.get_data_frame()
+    if key is not None:
+        read_cache.put(key, df, headers=pdo.has_headers, req_range=req_rng, range_obj=addr_rng)
+    return _set_last_lp_result(df, headers=pdo.has_headers, range_obj=addr_rng)
+
+
 def _set_last_lp_result(result: Any, **kwargs) -> Any:  # noqa: ANN003, ANN401
     global LAST_LP_RESULT
     log = LogInst()
@@ -150,13 +197,7 @@ def _handle_range_only(addr: str, log: OxtLogger, **kwargs) -> Any:  # noqa: ANN
 
     doc = cast(CalcDoc, Lo.current_doc)
     sheet = doc.sheets[addr_rng.sheet_idx]
-    if collapse:
-        addr_rng = _collapse_to_used(sheet, addr_rng)
-        log.debug("lp - Collapsed addr_rng: %s", addr_rng)
-    cr = sheet.get_range(range_obj=addr_rng)
-    pdo = PandasDataObj(cell_rng=cr, col_types=column_types)
-    df = pdo.get_data_frame()
-    return _set_last_lp_result(df, headers=pdo.has_headers, range_obj=addr_rng)
+    return _read_range(doc, sheet, addr_rng, log, collapse=collapse, column_types=column_types)
 
 
 def _handle_sheet_range_only(addr: str, log: OxtLogger, **kwargs) -> Any:  # noqa: ANN003, ANN401
@@ -184,13 +225,7 @@ def _handle_sheet_range_only(addr: str, log: OxtLogger, **kwargs) -> Any:  # noq
     addr_rng.set_sheet_index(sheet.sheet_index)
     log.debug("lp - addr_rng: %s", addr_rng)
 
-    if collapse:
-        addr_rng = _collapse_to_used(sheet, addr_rng)
-        log.debug("lp - Collapsed addr_rng: %s", addr_rng)
-    cr = sheet.get_range(range_obj=addr_rng)
-    pdo = PandasDataObj(cell_rng=cr, col_types=column_types)
-    df = pdo.get_data_frame()
-    return _set_last_lp_result(df, headers=pdo.has_headers, range_obj=addr_rng)
+    return _read_range(doc, sheet, addr_rng, log, collapse=collapse, column_types=column_types)
 
 
 def _handle_named_range_only(addr: str, log: OxtLogger, **kwargs) -> Any:  # noqa: ANN003, ANN401
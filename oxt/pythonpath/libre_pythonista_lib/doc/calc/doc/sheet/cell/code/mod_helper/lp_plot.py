@@ -1,18 +1,26 @@
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
+from typing import Any, cast, Optional, Tuple, TYPE_CHECKING
 import functools
 from matplotlib import pyplot as plt
 
-from ooodev.utils.helper.dot_dict import DotDict
-from ooodev.utils.gen_util import Util as OooDevGenUtil
+from ooodev.calc import CalcDoc
 from ooodev.loader import Lo
+from ooodev.utils.helper.dot_dict import DotDict
 
 LAST_LP_RESULT = DotDict(data=None)
 
 if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.log.log_inst import LogInst
+    from oxt.pythonpath.libre_pythonista_lib.cache.fig_cache import FigCache, get_fig_cache
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.doc.qry_calc_props import QryCalcProps
+    from oxt.pythonpath.libre_pythonista_lib.cq.qry.qry_handler_factory import QryHandlerFactory
+    from oxt.pythonpath.libre_pythonista_lib.utils.result import Result
 else:
     from libre_pythonista_lib.log.log_inst import LogInst
+    from libre_pythonista_lib.cache.fig_cache import FigCache, get_fig_cache
+    from libre_pythonista_lib.cq.qry.calc.doc.qry_calc_props import QryCalcProps
+    from libre_pythonista_lib.cq.qry.qry_handler_factory import QryHandlerFactory
+    from libre_pythonista_lib.utils.result import Result
 
 # _ORIG_PLT_SHOW = plt.show
 
@@ -33,28 +41,43 @@ def _lp_plt_show_prefix_function(function: Any, pre_function: Any) -> Any:  # no
     return run
 
 
+def _get_fig_options(fmt: Optional[str], dpi: Optional[int]) -> Tuple[str, Optional[int]]:
+    """Gets the image format and dpi, the document options are used for the values that are not passed."""
+    if fmt is not None and dpi is not None:
+        return (fmt, dpi)
+    try:
+        doc = cast(CalcDoc, Lo.current_doc)
+        result = QryHandlerFactory.get_qry_handler().handle(QryCalcProps(doc))
+        if Result.is_success(result):
+            return (fmt or result.data.fig_format, dpi or result.data.fig_dpi)
+    except Exception:
+        LogInst().debug("_get_fig_options() Unable to get document options.", exc_info=True)
+    return (fmt or "auto", dpi)
+
+
 def _custom_plt_show(*args, **kwargs) -> None:  # noqa: ANN002, ANN003
     # Your own code here that will be run before
     global LAST_LP_RESULT
     log = LogInst()
     log.debug("Custom Plot Method")
-    s = "plt_" + OooDevGenUtil.generate_random_hex_string(12) + ".svg"
-    pth = Lo.tmp_dir / s
-    if log.is_debug:
-        log.debug("Saving Plot to %s", pth)
-
-    plt.savefig(str(pth), format="svg")
+    # plt.show(format="png", dpi=150) overrides the document options for the figure of a cell.
+    fmt, dpi = _get_fig_options(kwargs.get("format"), kwargs.get("dpi"))
+    fig = plt.gcf()
+    fmt = FigCache.get_format(fig, fmt)
+    # matplotlib is not thread safe, the figure is rendered on this thread before it is closed.
+    # an unchanged figure reuses the file of the last render, see FigCache.
+    pth = get_fig_cache().get_file(fig, fmt, dpi)
     try:
         # https://stackoverflow.com/questions/9622163/save-plot-to-image-file-instead-of-displaying-it
         # Is is important to call plt.close() to clear the plot after saving it.
         # This fixes the issue of the plot going for area to line still being outputted as area.
-        plt.close()
+        plt.close(fig)
         log.debug("Closed plot")
     except Exception as e:
         log.exception("Error in _custom_plt_show with plt.close: %s", e, exc_info=True)
     if log.is_debug:
         log.debug("Plot saved to %s", pth)
-    dd = DotDict(data=str(pth), data_type="file", file_kind="image", file_ext="svg", details="figure")
+    dd = DotDict(data=str(pth), data_type="file", file_kind="image", file_ext=fmt, details="figure")
     LAST_LP_RESULT = dd
 
     log.debug("_custom_plt_show Done")
@@ -0,0 +1,170 @@
+from __future__ import annotations
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+import hashlib
+import threading
+
+if TYPE_CHECKING:
+    from ooodev.calc import CalcDoc, CalcSheet
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import LpRef
+    from oxt.pythonpath.libre_pythonista_lib.doc.doc_globals import DocGlobals
+    from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
+else:
+    from libre_pythonista_lib.doc.doc_globals import DocGlobals
+    from libre_pythonista_lib.log.log_mixin import LogMixin
+
+_KEY = "libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_range_tracker.LpRangeTracker"
+
+_RangeKey = Tuple[str, int, int, int, int]
+"""Sheet unique id, col start, row start, col end and row end."""
+
+
+class LpRangeTracker(LogMixin):
+    """
+    Singleton Class per document. Tracks changes to the cell ranges that are read by ``lp()``.
+
+    Sheet modify events do not contain the changed range. Instead the content of each range a cell reads is
+    hashed, and the hash is compared with the one recorded when the cell was last executed. A cell is only dirty
+    when a range it reads has changed.
+
+    The hash is a sha256 digest of the ``repr()`` of the data. The builtin ``hash()`` is not used because it
+    collides for values such as ``-1.0`` and ``-2.0``, which would hide the change.
+
+    Hashes are cached until the sheet is modified, see :py:meth:`mark_sheet_modified`, so a range is read at most
+    once per modification. Ranges of sheets without a modify listener are read every time.
+    """
+
+    def __new__(cls, runtime_uid: str) -> LpRangeTracker:
+        gbl_cache = DocGlobals.get_current(runtime_uid)
+        if _KEY in gbl_cache.mem_cache:
+            return gbl_cache.mem_cache[_KEY]
+
+        inst = super().__new__(cls)
+        inst._is_init = False
+
+        gbl_cache.mem_cache[_KEY] = inst
+        return inst
+
+    def __init__(self, runtime_uid: str) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        LogMixin.__init__(self)
+        self._runtime_uid = runtime_uid
+        self._lock = threading.Lock()
+        self._sheet_versions: Dict[str, int] = {}
+        self._hashes: Dict[_RangeKey, Tuple[int, str]] = {}
+        self._reads = 0
+        self._hits = 0
+        self.log.debug("Init")
+        self._is_init = True
+
+    def mark_sheet_modified(self, sheet_id: str) -> None:
+        """
+        Records that a sheet has been modified, the ranges of the sheet are read again on next use.
+
+        Args:
+            sheet_id (str): Unique id of the sheet.
+        """
+        with self._lock:
+            self._sheet_versions[sheet_id] = self._sheet_versions.get(sheet_id, 0) + 1
+
+    @staticmethod
+    def get_data_hash(data: Tuple[Tuple[object, ...], ...]) -> str:
+        """
+        Gets the hash of the data of a range.
+
+        Args:
+            data (Tuple[Tuple[object, ...], ...]): Data array of the range.
+
+        Returns:
+            str: Hex digest of the data.
+        """
+        return hashlib.sha256(repr(data).encode("utf-8")).hexdigest()
+
+    def get_range_hash(self, sheet: CalcSheet, ref: LpRef) -> str:
+        """
+        Gets the hash of the content of a range.
+
+        Args:
+            sheet (CalcSheet): Sheet of the range.
+            ref (LpRef): Range.
+
+        Returns:
+            str: Hash of the values of the range.
+        """
+        if TYPE_CHECKING:
+            from oxt.pythonpath.libre_pythonista_lib.sheet.listen.code_sheet_modify_listener import (
+                CodeSheetModifyListener,
+            )
+        else:
+            from libre_pythonista_lib.sheet.listen.code_sheet_modify_listener import CodeSheetModifyListener
+
+        sheet_id = sheet.unique_id
+        key = (sheet_id, ref.col_start, ref.row_start, ref.col_end, ref.row_end)
+        # without a listener the modifications of the sheet are not known and the hash can not be cached.
+        is_watched = CodeSheetModifyListener.has_listener(sheet_id)
+        version = self._sheet_versions.get(sheet_id, 0)
+        if is_watched:
+            cached = self._hashes.get(key)
+            if cached is not None and cached[0] == version:
+                self._hits += 1
+                return cached[1]
+
+        rng = sheet.component.getCellRangeByPosition(ref.col_start, ref.row_start, ref.col_end, ref.row_end)
+        result = LpRangeTracker.get_data_hash(rng.getDataArray())
+        self._reads += 1
+        if is_watched:
+            with self._lock:
+                self._hashes[key] = (version, result)
+        return result
+
+    def get_inputs(self, doc: CalcDoc, sheet_idx: int, refs: Tuple[LpRef, ...]) -> Optional[Tuple[str, ...]]:
+        """
+        Gets the content hashes of the ranges read by the code of a cell.
+
+        Args:
+            doc (CalcDoc): Document.
+            sheet_idx (int): Index of the sheet of the cell, used for addresses without a sheet name.
+            refs (Tuple[LpRef, ...]): Ranges read by the code.
+
+        Returns:
+            Tuple[str, ...], None: Hashes in the order of ``refs`` or ``None`` if a range can not be read,
+            such as when a sheet does not exist.
+        """
+        result = []
+        sheets: Dict[str, CalcSheet] = {}
+        try:
+            for ref in refs:
+                sheet = sheets.get(ref.sheet)
+                if sheet is None:
+                    sheet = doc.get_sheet(sheet_name=ref.sheet) if ref.sheet else doc.get_sheet(sheet_idx)
+                    sheets[ref.sheet] = sheet
+                result.append(self.get_range_hash(sheet, ref))
+        except Exception:
+            self.log.debug("get_inputs() Unable to read ranges.", exc_info=True)
+            return None
+        return tuple(result)
+
+    def clear(self) -> None:
+        """Clears the cached hashes and resets the counters."""
+        with self._lock:
+            self._hashes.clear()
+            self._reads = 0
+            self._hits = 0
+
+    # region Properties
+    @property
+    def reads(self) -> int:
+        """Number of ranges that were read from the sheet."""
+        return self._reads
+
+    @property
+    def hits(self) -> int:
+        """Number of range hashes served from the cache."""
+        return self._hits
+
+    @property
+    def runtime_uid(self) -> str:
+        """Runtime unique id of the document."""
+        return self._runtime_uid
+
+    # endregion Properties
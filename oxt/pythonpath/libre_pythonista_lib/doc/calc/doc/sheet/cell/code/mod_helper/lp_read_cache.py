@@ -0,0 +1,237 @@
+from __future__ import annotations
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple, TYPE_CHECKING
+from collections import OrderedDict
+import threading
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from ooodev.utils.data_type.range_obj import RangeObj
+    from oxt.pythonpath.libre_pythonista_lib.doc.doc_globals import DocGlobals
+    from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
+else:
+    from libre_pythonista_lib.doc.doc_globals import DocGlobals
+    from libre_pythonista_lib.log.log_mixin import LogMixin
+
+_KEY = "libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_read_cache.LpReadCache"
+
+LpReadKey = Tuple[str, str, bool, Hashable]
+"""Sheet unique id, requested range, collapse and column types."""
+
+
+class LpReadItem(NamedTuple):
+    """Cached result of a ``lp()`` range read."""
+
+    data: pd.DataFrame
+    """Cached DataFrame. Never handed to user code, see :py:meth:`LpReadCache.get`."""
+    headers: bool
+    """``True`` if the first row of the range was used as column names."""
+    range_obj: RangeObj
+    """Range that was read, the used area of the requested range when collapsed."""
+    bounds: Tuple[int, int, int, int]
+    """Requested range as zero based ``(col_start, row_start, col_end, row_end)``."""
+
+
+class LpReadCache(LogMixin):
+    """
+    Singleton Class per document. In memory cache of the DataFrames read by ``lp()`` for cell ranges.
+
+    Entries are keyed by :py:meth:`get_key` and removed by the sheet modify listener when the sheet they were read from
+    is changed. Only the least recently used ``MAX_ITEMS`` entries are kept.
+
+    :py:attr:`generation` is incremented on every invalidation, even when no entry is removed, so callers can detect
+    that sheet data that ``lp()`` may read has changed.
+    """
+
+    MAX_ITEMS = 32
+    """Maximum number of cached reads per document."""
+
+    def __new__(cls, runtime_uid: str) -> LpReadCache:
+        gbl_cache = DocGlobals.get_current(runtime_uid)
+        if _KEY in gbl_cache.mem_cache:
+            return gbl_cache.mem_cache[_KEY]
+
+        inst = super().__new__(cls)
+        inst._is_init = False
+
+        gbl_cache.mem_cache[_KEY] = inst
+        return inst
+
+    def __init__(self, runtime_uid: str) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        LogMixin.__init__(self)
+        self._runtime_uid = runtime_uid
+        self._lock = threading.Lock()
+        self._data: OrderedDict[LpReadKey, LpReadItem] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._generation = 0
+        self.log.debug("Init")
+        self._is_init = True
+
+    def __contains__(self, key: LpReadKey) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @staticmethod
+    def get_key(
+        sheet_id: str, range_obj: RangeObj, collapse: bool, column_types: Optional[Dict[Any, str]]
+    ) -> Optional[LpReadKey]:
+        """
+        Gets the cache key of a read.
+
+        Args:
+            sheet_id (str): Unique id of the sheet.
+            range_obj (RangeObj): Requested range, before it is collapsed.
+            collapse (bool): ``collapse`` argument of ``lp()``.
+            column_types (Dict[Any, str], None): ``column_types`` argument of ``lp()``.
+
+        Returns:
+            LpReadKey, None: Key or ``None`` if the read can not be cached such as when ``column_types`` is not hashable.
+        """
+        col_types: Hashable = None
+        if column_types:
+            try:
+                col_types = frozenset(column_types.items())
+            except Exception:
+                return None
+        return (sheet_id, str(range_obj), collapse, col_types)
+
+    @staticmethod
+    def _get_bounds(range_obj: RangeObj) -> Tuple[int, int, int, int]:
+        return (
+            range_obj.start_col_index,
+            range_obj.start_row_index,
+            range_obj.end_col_index,
+            range_obj.end_row_index,
+        )
+
+    def get(self, key: LpReadKey) -> Optional[LpReadItem]:
+        """
+        Gets a cached read.
+
+        Args:
+            key (LpReadKey): Key from :py:meth:`get_key`.
+
+        Returns:
+            LpReadItem, None: Item with a copy of the cached DataFrame or ``None`` if the read is not cached.
+                The copy can be changed by user code without changing the cache.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._data.move_to_end(key)
+        return item._replace(data=item.data.copy(), range_obj=item.range_obj.copy())
+
+    def put(self, key: LpReadKey, data: pd.DataFrame, headers: bool, req_range: RangeObj, range_obj: RangeObj) -> None:
+        """
+        Caches a read.
+
+        A copy of ``data`` is cached so the DataFrame that is returned to user code is not shared with the cache.
+
+        Args:
+            key (LpReadKey): Key from :py:meth:`get_key`.
+            data (DataFrame): DataFrame that was read.
+            headers (bool): ``True`` if the first row of the range was used as column names.
+            req_range (RangeObj): Requested range, before it is collapsed.
+            range_obj (RangeObj): Range that was read.
+        """
+        item = LpReadItem(
+            data=data.copy(), headers=headers, range_obj=range_obj.copy(), bounds=self._get_bounds(req_range)
+        )
+        with self._lock:
+            self._data[key] = item
+            self._data.move_to_end(key)
+            while len(self._data) > LpReadCache.MAX_ITEMS:
+                self._data.popitem(last=False)
+
+    def invalidate_sheet(self, sheet_id: str) -> None:
+        """
+        Removes all the reads of a sheet.
+
+        Args:
+            sheet_id (str): Unique id of the sheet.
+        """
+        with self._lock:
+            self._generation += 1
+            keys = [key for key in self._data if key[0] == sheet_id]
+            for key in keys:
+                del self._data[key]
+        if keys and self.log.is_debug:
+            self.log.debug("invalidate_sheet() Removed %i reads for sheet %s", len(keys), sheet_id)
+
+    def invalidate_range(self, sheet_id: str, range_obj: RangeObj) -> None:
+        """
+        Removes the reads of a sheet whose requested range intersects a changed range.
+
+        Args:
+            sheet_id (str): Unique id of the sheet.
+            range_obj (RangeObj): Range that was changed.
+        """
+        col_start, row_start, col_end, row_end = self._get_bounds(range_obj)
+        with self._lock:
+            self._generation += 1
+            keys = []
+            for key, item in self._data.items():
+                if key[0] != sheet_id:
+                    continue
+                c1, r1, c2, r2 = item.bounds
+                if c1 <= col_end and col_start <= c2 and r1 <= row_end and row_start <= r2:
+                    keys.append(key)
+            for key in keys:
+                del self._data[key]
+        if keys and self.log.is_debug:
+            self.log.debug("invalidate_range() Removed %i reads for sheet %s", len(keys), sheet_id)
+
+    def clear(self) -> None:
+        """Clears the cache and resets the counters."""
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Gets cache statistics.
+
+        Returns:
+            Dict[str, Any]: Dictionary with ``size``, ``hits``, ``misses`` and ``hit_rate`` keys.
+        """
+        return {"size": len(self), "hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
+
+    # region Properties
+    @property
+    def hits(self) -> int:
+        """Number of reads served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of reads that were not in the cache."""
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of reads served from the cache, ``0.0`` when there has been no reads."""
+        total = self._hits + self._misses
+        if total == 0:
+            return 0.0
+        return self._hits / total
+
+    @property
+    def generation(self) -> int:
+        """Number of times reads have been invalidated."""
+        return self._generation
+
+    @property
+    def runtime_uid(self) -> str:
+        """Runtime unique id of the document."""
+        return self._runtime_uid
+
+    # endregion Properties
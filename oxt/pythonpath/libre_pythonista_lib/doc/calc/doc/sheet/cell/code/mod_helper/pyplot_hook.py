@@ -0,0 +1,88 @@
+from __future__ import annotations
+from typing import Any, Callable, List, Optional, Sequence
+import importlib.abc
+import importlib.machinery
+import sys
+import threading
+import types
+
+_MOD_NAME = "matplotlib.pyplot"
+_LOCK = threading.Lock()
+_FINDER: Optional[PyplotFinder] = None
+
+
+class _PyplotLoader(importlib.abc.Loader):
+    """Wraps the loader of ``matplotlib.pyplot`` to run callbacks before and after the module is executed."""
+
+    def __init__(
+        self,
+        loader: importlib.abc.Loader,
+        before: Callable[[], None],
+        after: Callable[[types.ModuleType], None],
+    ) -> None:
+        self._loader = loader
+        self._before = before
+        self._after = after
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> Optional[types.ModuleType]:
+        # the module is not in sys.modules yet, matplotlib.use() only sets the backend instead of switching it.
+        self._before()
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        self._loader.exec_module(module)
+        self._after(module)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        return getattr(self._loader, name)
+
+
+class PyplotFinder(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder that runs callbacks when ``matplotlib.pyplot`` is imported.
+
+    ``before`` runs after the ``matplotlib`` package is imported and before ``pyplot`` is created, it selects the
+    backend. ``after`` runs once ``pyplot`` is executed, it patches ``plt.show``. The callbacks run no matter which
+    code imports ``pyplot``, such as the code of a cell or ``seaborn``.
+    """
+
+    def __init__(self, before: Callable[[], None], after: Callable[[types.ModuleType], None]) -> None:
+        self._before = before
+        self._after = after
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[types.ModuleType] = None,
+    ) -> Optional[importlib.machinery.ModuleSpec]:
+        if fullname != _MOD_NAME:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        if spec is None or spec.loader is None:
+            return None
+        spec.loader = _PyplotLoader(spec.loader, self._before, self._after)
+        return spec
+
+
+def install_pyplot_hook(before: Callable[[], None], after: Callable[[types.ModuleType], None]) -> None:
+    """
+    Installs the hook that runs callbacks when ``matplotlib.pyplot`` is imported, see :py:class:`PyplotFinder`.
+
+    The hook is only installed once. When ``pyplot`` is already imported the callbacks run now.
+
+    Args:
+        before (Callable[[], None]): Called before ``pyplot`` is created.
+        after (Callable[[ModuleType], None]): Called with the ``pyplot`` module once it is executed.
+    """
+    global _FINDER
+    with _LOCK:
+        if _FINDER is not None:
+            return
+        _FINDER = PyplotFinder(before, after)
+        meta_path: List[Any] = sys.meta_path
+        meta_path.insert(0, _FINDER)
+    mod = sys.modules.get(_MOD_NAME)
+    if mod is not None:
+        before()
+        after(mod)
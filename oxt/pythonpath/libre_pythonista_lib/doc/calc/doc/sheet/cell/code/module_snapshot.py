@@ -0,0 +1,135 @@
+from __future__ import annotations
+from typing import Any, Dict, FrozenSet, Iterator, List, Mapping, Optional
+
+_MISSING = object()
+
+
+class ModuleSnapshot(Mapping[str, Any]):
+    """
+    Immutable snapshot of a module dictionary.
+
+    A snapshot only stores the names that changed since its parent snapshot and shares everything else
+    with the parent. Chains are flattened once they reach ``MAX_DEPTH`` so lookups stay cheap.
+
+    Values are not copied. Objects that are changed in place are shared by all the snapshots that reference them,
+    the same as a shallow copy of the module dictionary.
+    """
+
+    MAX_DEPTH = 32
+    """Maximum number of parent snapshots before a snapshot is flattened."""
+
+    __slots__ = ("_changes", "_deleted", "_parent", "_depth")
+
+    def __init__(
+        self,
+        changes: Dict[str, Any],
+        deleted: Optional[FrozenSet[str]] = None,
+        parent: Optional[ModuleSnapshot] = None,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            changes (Dict[str, Any]): Names that were added or rebound since ``parent``. The dictionary is owned by the snapshot.
+            deleted (FrozenSet[str], optional): Names that were removed since ``parent``. Defaults to None.
+            parent (ModuleSnapshot, optional): Previous snapshot. Defaults to None.
+        """
+        if parent is not None and parent._depth + 1 > ModuleSnapshot.MAX_DEPTH:
+            flat = parent.to_dict()
+            for name in deleted or ():
+                flat.pop(name, None)
+            flat.update(changes)
+            changes = flat
+            deleted = None
+            parent = None
+        self._changes = changes
+        self._deleted = frozenset() if parent is None or deleted is None else deleted
+        self._parent = parent
+        self._depth = 0 if parent is None else parent._depth + 1
+
+    @staticmethod
+    def from_dict(
+        mod_dict: Mapping[str, Any], parent: Optional[ModuleSnapshot] = None, prev: Optional[Mapping[str, Any]] = None
+    ) -> ModuleSnapshot:
+        """
+        Creates a snapshot of a module dictionary.
+
+        Args:
+            mod_dict (Mapping[str, Any]): Current module dictionary.
+            parent (ModuleSnapshot, optional): Snapshot to share unchanged names with. Defaults to None.
+            prev (Mapping[str, Any], optional): Flat dictionary with the same content as ``parent``.
+                Used to find the changed names without walking the parent chain. Defaults to ``parent``.
+
+        Returns:
+            ModuleSnapshot: Snapshot that only stores the names whose values are not the same objects as in ``parent``.
+        """
+        if parent is None:
+            return ModuleSnapshot(dict(mod_dict))
+        if prev is None:
+            prev = parent.to_dict()
+        changes = {name: value for name, value in mod_dict.items() if prev.get(name, _MISSING) is not value}
+        deleted = None
+        added = sum(1 for name in changes if name not in prev)
+        if len(prev) + added > len(mod_dict):
+            # only scan for deleted names when the size shows that some names were removed.
+            deleted = frozenset(name for name in prev if name not in mod_dict)
+        return ModuleSnapshot(changes, deleted, parent)
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
+        node: Optional[ModuleSnapshot] = self
+        while node is not None:
+            if key in node._changes:
+                return node._changes[key]
+            if key in node._deleted:
+                break
+            node = node._parent
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]  # type: ignore
+            return True
+        except KeyError:
+            return False
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"<ModuleSnapshot(changes={len(self._changes)}, depth={self._depth})>"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Gets a new flat dictionary with the content of the snapshot."""
+        chain: List[ModuleSnapshot] = []
+        node: Optional[ModuleSnapshot] = self
+        while node is not None:
+            chain.append(node)
+            node = node._parent
+        result: Dict[str, Any] = {}
+        for node in reversed(chain):
+            for name in node._deleted:
+                result.pop(name, None)
+            result.update(node._changes)
+        return result
+
+    def copy(self) -> Dict[str, Any]:
+        """Gets a new flat dictionary with the content of the snapshot. Same as :py:meth:`to_dict`."""
+        return self.to_dict()
+
+    @property
+    def changes(self) -> Mapping[str, Any]:
+        """Names that were added or rebound since the parent snapshot."""
+        return self._changes
+
+    @property
+    def deleted(self) -> FrozenSet[str]:
+        """Names that were removed since the parent snapshot."""
+        return self._deleted
+
+    @property
+    def depth(self) -> int:
+        """Number of parent snapshots."""
+        return self._depth
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Mapping, TYPE_CHECKING
 
 from ooodev.utils.helper.dot_dict import DotDict
 
@@ -11,7 +11,7 @@ else:
 
 
 class ModuleStateItem:
-    def __init__(self, cell_obj: CellObj, mod_dict: Dict[str, Any], owner: PyModuleState) -> None:
+    def __init__(self, cell_obj: CellObj, mod_dict: Mapping[str, Any], owner: PyModuleState) -> None:
         self.cell_obj = cell_obj.copy()
         self.mod_dict = mod_dict
         self.py_state = owner
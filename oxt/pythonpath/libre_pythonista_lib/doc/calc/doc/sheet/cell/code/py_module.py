@@ -1,35 +1,46 @@
 from __future__ import annotations
-from typing import Any, Dict, cast, TYPE_CHECKING, Optional
+from typing import Any, Dict, Mapping, cast, TYPE_CHECKING, Optional
 import ast
-import copy
 import os
 import importlib.util
+import time
 
 # import importlib
 import types
+from ooodev.utils.cache import LRUCache
 from ooodev.utils.helper.dot_dict import DotDict
 
 
 if TYPE_CHECKING:
     from oxt.___lo_pip___.debug.break_mgr import BreakMgr
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.compiled_code import CompiledCode
     from oxt.pythonpath.libre_pythonista_lib.doc.doc_globals import DocGlobals
     from oxt.pythonpath.libre_pythonista_lib.ex.general_error import GeneralError
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lazy_module import LazyModule
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.pyplot_hook import (
+        install_pyplot_hook,
+    )
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lplog import (
         LpLog as LibrePythonistaLog,
     )
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module_t import PyModuleT
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.rules.code_rules import CodeRules
+    from oxt.pythonpath.libre_pythonista_lib.log.log_inst import LogInst
     from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
     from oxt.pythonpath.libre_pythonista_lib.utils import str_util
 
     break_mgr = BreakMgr()
 else:
     from ___lo_pip___.debug.break_mgr import BreakMgr
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.compiled_code import CompiledCode
     from libre_pythonista_lib.doc.doc_globals import DocGlobals
     from libre_pythonista_lib.ex.general_error import GeneralError
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lazy_module import LazyModule
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.pyplot_hook import install_pyplot_hook
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lplog import LpLog as LibrePythonistaLog
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module_t import PyModuleT
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.rules.code_rules import CodeRules
+    from libre_pythonista_lib.log.log_inst import LogInst
     from libre_pythonista_lib.log.log_mixin import LogMixin
     from libre_pythonista_lib.utils import str_util
 
@@ -38,6 +49,8 @@ else:
     break_mgr.add_breakpoint("libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module.execute_code")
 
 _KEY = "libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module.PyModule"
+_CODE_CACHE_SIZE = 1000  # number of compiled code snippets to keep per document.
+_IMPORT_AVAILABLE: Dict[str, bool] = {}
 
 
 def is_pytest_running() -> bool:
@@ -45,20 +58,81 @@ def is_pytest_running() -> bool:
 
 
 def is_import_available(module_name: str, class_name: str = "", alias: str = "") -> bool:
-    spec = importlib.util.find_spec(module_name)
-    return spec is not None
+    # find_spec() searches sys.path, the result does not change while the extension is running.
+    result = _IMPORT_AVAILABLE.get(module_name)
+    if result is None:
+        try:
+            result = importlib.util.find_spec(module_name) is not None
+        except (ImportError, ValueError):
+            result = False
+        _IMPORT_AVAILABLE[module_name] = result
+    return result
+
+
+def _select_plt_backend() -> None:
+    # See https://matplotlib.org/stable/users/explain/figure/backends.html
+    # for more information on the matplotlib backend.
+    # An interactive backend may crash LibreOffice.
+    import matplotlib
+
+    matplotlib.use("svg")
+    # matplotlib.use('agg')
+
 
+def _on_pyplot_imported(mod: types.ModuleType) -> None:
+    # importing lp_plot patches plt.show() so figures are captured.
+    try:
+        from .mod_helper import lp_plot  # noqa: F401
+    except Exception:
+        LogInst().exception("Unable to import lp_plot, plt.show() is not captured.")
 
-try:
+
+def _install_pyplot_hook() -> None:
+    """
+    Selects the backend and patches ``plt.show()`` when ``matplotlib.pyplot`` is imported by any code.
+
+    Cells and libraries such as seaborn can import ``pyplot`` themselves, the hook makes sure it is set up
+    before it is used even when ``plt`` of the document module has not been used yet.
+    """
     if is_import_available("matplotlib"):
-        from .mod_helper import lp_plot
-    else:
-        lp_plot = None
-except ImportError:
-    lp_plot = None
+        install_pyplot_hook(_select_plt_backend, _on_pyplot_imported)
+
+
+def _load_lp_plot() -> types.ModuleType:
+    _select_plt_backend()
+    from .mod_helper import lp_plot
+
+    return lp_plot
 
 
-def get_module_init_code() -> str:
+def _load_plt() -> types.ModuleType:
+    return _load_lp_plot().plt
+
+
+def _load_pd() -> types.ModuleType:
+    import pandas as pd
+
+    pd.options.plotting.backend = "matplotlib"
+    return pd
+
+
+def _load_np() -> types.ModuleType:
+    import numpy as np
+
+    return np
+
+
+def get_module_init_code(lazy: bool = False) -> str:
+    """
+    Gets the code that is run to initialize a document module.
+
+    Args:
+        lazy (bool, optional): If ``True`` the code does not import matplotlib, pandas and numpy.
+            The caller binds them with :py:meth:`PyModule.bind_lazy_modules`. Defaults to ``False``.
+
+    Returns:
+        str: Python code.
+    """
     # See https://matplotlib.org/stable/users/explain/figure/backends.html
     # for more information on the matplotlib backend.
     pre_lines = [
@@ -66,16 +140,17 @@ def get_module_init_code() -> str:
         "from typing import Any, cast, TYPE_CHECKING",
     ]
     code_lines = []
-    if is_import_available("matplotlib"):
-        code_lines.append("import matplotlib")
-        code_lines.append("matplotlib.use('svg')")
-        # code_lines.append("matplotlib.use('agg')")
-        code_lines.append("from matplotlib import pyplot as plt")
-    if is_import_available("pandas"):
-        code_lines.append("import pandas as pd")
-        code_lines.append("pd.options.plotting.backend = 'matplotlib'")
-    if is_import_available("numpy"):
-        code_lines.append("import numpy as np")
+    if not lazy:
+        if is_import_available("matplotlib"):
+            code_lines.append("import matplotlib")
+            code_lines.append("matplotlib.use('svg')")
+            # code_lines.append("matplotlib.use('agg')")
+            code_lines.append("from matplotlib import pyplot as plt")
+        if is_import_available("pandas"):
+            code_lines.append("import pandas as pd")
+            code_lines.append("pd.options.plotting.backend = 'matplotlib'")
+        if is_import_available("numpy"):
+            code_lines.append("import numpy as np")
     post_lines = [
         "from ooodev.loader import Lo",
         "from ooodev.calc import CalcDoc",
@@ -89,12 +164,17 @@ def get_module_init_code() -> str:
         "from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper import lp_mod",
         "from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_mod import lp",
         "from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lplog import StaticLpLog as lp_log, LpLog as LibrePythonistaLog",
-        "from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper import lp_plot",
-        "PY_ARGS = None",
-        "CURRENT_CELL_OBJ = None",
-        "CURRENT_CELL_ID = ''",
-        "DUMMY_LAST_VALUE = None",
     ]
+    if not lazy:
+        post_lines.append("from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper import lp_plot")
+    post_lines.extend(
+        [
+            "PY_ARGS = None",
+            "CURRENT_CELL_OBJ = None",
+            "CURRENT_CELL_ID = ''",
+            "DUMMY_LAST_VALUE = None",
+        ]
+    )
     lines = pre_lines + code_lines + post_lines
     return "\n".join(lines)
 
@@ -132,28 +212,86 @@ class PyModule(LogMixin, PyModuleT):
 
         self._current_ast_mod = None
         self._current_match_rule = None  # used for testing
+        self._code_cache = LRUCache(capacity=_CODE_CACHE_SIZE)
+        self._import_timings: Dict[str, float] = {}
         self._init_mod()
         self._is_init = True
 
     def _init_mod(self) -> None:
         self.log.debug("_init_mod()")
-        code = get_module_init_code()
+        start = time.perf_counter()
+        code = get_module_init_code(lazy=True)
         try:
+            _install_pyplot_hook()
             self._execute_init_code(code, self.mod.__dict__)
+            self.bind_lazy_modules(self.mod.__dict__)
             self._init_dict = self.mod.__dict__.copy()
-            if lp_plot is not None:
-                self._init_dict.update(**lp_plot.__dict__.copy())
-            else:
-                self.log.warning("lp_plot module is not available.")
-            self.log.debug("_init_mod() done.")
+            self._import_timings["init"] = time.perf_counter() - start
+            self.log.debug("_init_mod() done in %.3f seconds.", self._import_timings["init"])
         except Exception:
             self.log.exception("Error initializing module")
             raise
 
+    def bind_lazy_modules(self, globals_dict: Dict[str, Any]) -> None:
+        """
+        Binds ``plt``, ``lp_plot``, ``pd`` and ``np`` to modules that are imported the first time they are used.
+
+        Args:
+            globals_dict (Dict[str, Any]): Dictionary to bind the modules in.
+        """
+        lazy_modules = (
+            ("plt", "matplotlib", "matplotlib.pyplot", _load_plt),
+            (
+                "lp_plot",
+                "matplotlib",
+                "libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_plot",
+                _load_lp_plot,
+            ),
+            ("pd", "pandas", "pandas", _load_pd),
+            ("np", "numpy", "numpy", _load_np),
+        )
+        for name, required, mod_name, loader in lazy_modules:
+            if is_import_available(required):
+                globals_dict[name] = LazyModule(mod_name, loader, on_load=self._on_lazy_module_loaded)
+            else:
+                self.log.warning("bind_lazy_modules() %s is not available. %s is not bound.", required, name)
+
+    def _on_lazy_module_loaded(self, lazy_mod: LazyModule, mod: types.ModuleType, elapsed: float) -> None:
+        self._import_timings[lazy_mod.__name__] = elapsed
+        self.log.debug("Imported %s in %.3f seconds.", lazy_mod.__name__, elapsed)
+        # replace the placeholder so later lookups do not go through it.
+        for d in (self.mod.__dict__, getattr(self, "_init_dict", {})):
+            for key in [k for k, v in d.items() if v is lazy_mod]:
+                d[key] = mod
+
+    def _get_compiled_code(self, code_snippet: str) -> CompiledCode:
+        """
+        Gets the parsed and compiled artifacts for the code from cache or compiles the code.
+
+        Raises:
+            SyntaxError: If the code is not valid.
+        """
+        key = CompiledCode.get_key(code_snippet)
+        compiled = cast(Optional[CompiledCode], self._code_cache[key])
+        if compiled is None:
+            compiled = CompiledCode.from_code(code_snippet)
+            self._code_cache[key] = compiled
+        elif self.log.is_debug:
+            self.log.debug("_get_compiled_code() Cache hit. Total hits: %i", self._code_cache.hits)
+        return compiled
+
+    def clear_code_cache(self) -> None:
+        """Clears the cache of compiled code."""
+        self._code_cache.clear()
+
     def copy_dict(self) -> Dict[str, Any]:
         """Returns a copy of the module dictionary."""
         return self.mod.__dict__.copy()
 
+    def get_dict(self) -> Mapping[str, Any]:
+        """Returns the module dictionary without copying it. The dictionary must not be modified."""
+        return self.mod.__dict__
+
     def _execute_init_code(self, code_snippet: str, globals_dict: Optional[dict] = None) -> Any:  # noqa: ANN401
         """
         Compiles and executes the given code snippet.
@@ -203,42 +341,13 @@ class PyModule(LogMixin, PyModuleT):
                 globals_dict = {}
             globals_dict["_"] = None
 
-            # Parse the code as a full module
-            tree = ast.parse(code_snippet, mode="exec")
-            # Transform AST so underscore-assignments become local assigns
-            # tree = UnderscoreLocalTransformer().visit(tree)
-            # ast.fix_missing_locations(tree)
-            # needs a copy because may pop the last node below.
-            self._current_ast_mod = copy.deepcopy(tree)
-
-            # If the last node is an expression, remove it for separate handling
-            last_expr = None
-            assign_name = ""
-            # print(str(type(tree.body[-1])))
-            last_node = tree.body[-1]
-            if tree.body and isinstance(last_node, ast.Expr):
-                last_expr = cast(ast.Expr, tree.body.pop())
-            elif tree.body and isinstance(last_node, ast.Assign):
-                last_expr = cast(ast.Assign, tree.body.pop())
-                try:
-                    assign_name = last_expr.targets[0].id  # type: ignore
-                except Exception:
-                    assign_name = ""
-            elif tree.body and isinstance(last_node, ast.AnnAssign):
-                last_expr = cast(ast.Assign, tree.body.pop())
-                try:
-                    assign_name = last_expr.target.id  # type: ignore
-                except Exception:
-                    assign_name = ""
-            last_node = None
-
-            # Compile all but the last expression as 'exec'
-            module_body = ast.fix_missing_locations(ast.Module(body=tree.body, type_ignores=[]))
-            exec_code = compile(module_body, "<string>", "exec")
+            compiled = self._get_compiled_code(code_snippet)
+            # shared with the code cache, CodeRules only reads it.
+            self._current_ast_mod = compiled.ast_mod
 
             # Execute statements
             local_dict = {}
-            exec(exec_code, globals_dict, local_dict)
+            exec(compiled.exec_code, globals_dict, local_dict)
 
             if self._private_enabled:
                 filtered_dict = {k: v for k, v in local_dict.items() if not k.startswith("_")}
@@ -247,11 +356,9 @@ class PyModule(LogMixin, PyModuleT):
 
             # If there was a final expression node, evaluate it
 
-            if last_expr:
-                expr = ast.Expression(last_expr.value)
-                expr = ast.fix_missing_locations(expr)
-                eval_code = compile(expr, "<string>", "eval")
-                result = eval(eval_code, globals_dict, local_dict)
+            if compiled.eval_code is not None:
+                result = eval(compiled.eval_code, globals_dict, local_dict)
+                assign_name = compiled.assign_name
                 if assign_name:
                     if self._private_enabled:
                         if not assign_name.startswith("_"):
@@ -355,6 +462,16 @@ class PyModule(LogMixin, PyModuleT):
         self.mod.__dict__[var_name] = value
         self.mod.__dict__["_"] = value
 
+    def del_global_var(self, var_name: str) -> None:
+        """
+        Removes a global variable from the module if it exists.
+
+        Args:
+            var_name (str): The name of the variable
+        """
+        self.log.debug("del_global_var(%s)", var_name)
+        self.mod.__dict__.pop(var_name, None)
+
     def reset_to_dict(self, mod_dict: Dict[str, Any], code: str = "") -> Any:  # noqa: ANN401
         """
         Reset the module to the given dictionary and returns the last variable in the module if code is present.
@@ -385,6 +502,16 @@ class PyModule(LogMixin, PyModuleT):
         self.log.debug("reset_to_dict() done.")
         return result
 
+    @property
+    def import_timings(self) -> Dict[str, float]:
+        """
+        Gets the import times of the document module in seconds.
+
+        ``init`` is the time taken to initialize the module. The other keys are the names of the modules,
+        such as ``pandas``, that were imported on first use and are only present after they are used.
+        """
+        return self._import_timings.copy()
+
     def reset_module(self) -> None:
         """Reset the module to its initial state."""
         self.log.debug("reset_module()")
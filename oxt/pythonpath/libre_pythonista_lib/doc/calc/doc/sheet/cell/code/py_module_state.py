@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import Any, Tuple, TYPE_CHECKING, Union
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, Tuple, TYPE_CHECKING, Union
 from collections import OrderedDict
+import types
 
 from ooodev.calc import CalcCell
 from ooodev.utils.helper.dot_dict import DotDict
@@ -12,12 +13,14 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.event.shared_event import SharedEvent
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module_t import PyModuleT
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.module_state_item import ModuleStateItem
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.module_snapshot import ModuleSnapshot
 else:
     from libre_pythonista_lib.doc.doc_globals import DocGlobals
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module_t import PyModuleT
     from libre_pythonista_lib.log.log_mixin import LogMixin
     from libre_pythonista_lib.event.shared_event import SharedEvent
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.module_state_item import ModuleStateItem
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.module_snapshot import ModuleSnapshot
 
 _KEY = "libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module_state.PyModuleState"
 
@@ -26,6 +29,9 @@ class PyModuleState(LogMixin):
     """
     Manages the state history of a Python module, implementing a singleton pattern per module.
     Tracks changes and allows rollback to previous states.
+
+    The state of each cell is a :py:class:`ModuleSnapshot` that only stores the names the cell changed
+    and shares the rest with the state of the previous cell.
     """
 
     def __new__(cls, mod: PyModuleT) -> PyModuleState:
@@ -70,6 +76,9 @@ class PyModuleState(LogMixin):
         self.runtime_uid: str
         self._state_history: OrderedDict[Tuple[int, int, int], ModuleStateItem] = OrderedDict()
         self._max_history_size = 250  # Configurable maximum history size.
+        # last snapshot and a flat dictionary with the same content, used to find what the next cell changed.
+        self._snapshot: Optional[ModuleSnapshot] = None
+        self._snapshot_dict: Dict[str, Any] = {}
         self._is_init = True
 
     def __bool__(self) -> bool:
@@ -113,6 +122,26 @@ class PyModuleState(LogMixin):
             key = keys[i]
             del self._state_history[key]
 
+    def _take_snapshot(self) -> ModuleSnapshot:
+        """Gets a snapshot of the current module dictionary that shares unchanged names with the last snapshot."""
+        snapshot = ModuleSnapshot.from_dict(self._py_mod.get_dict(), self._snapshot, self._snapshot_dict)
+        if snapshot.depth == 0:
+            # new root, the snapshot owns its dictionary.
+            self._snapshot_dict = dict(snapshot.changes)
+        else:
+            for name in snapshot.deleted:
+                self._snapshot_dict.pop(name, None)
+            self._snapshot_dict.update(snapshot.changes)
+        self._snapshot = snapshot
+        return snapshot
+
+    def _restore_snapshot(self, mod_dict: Mapping[str, Any], code: str = "") -> Any:  # noqa: ANN401
+        """Resets the module to a saved state and makes it the parent of the next snapshot."""
+        snapshot = mod_dict if isinstance(mod_dict, ModuleSnapshot) else ModuleSnapshot(dict(mod_dict))
+        self._snapshot = snapshot
+        self._snapshot_dict = snapshot.to_dict()
+        return self._py_mod.reset_to_dict(self._snapshot_dict.copy(), code)
+
     def convert_cell_obj_to_tuple(self, cell: CellObj) -> Tuple[int, int, int]:
         """
         Converts a cell object to a tuple of (sheet index, row, column).
@@ -133,12 +162,12 @@ class PyModuleState(LogMixin):
         Converts a tuple of (sheet index, row, column) to a cell object.
 
         Args:
-            cell (Tuple[int, int, int]): Tuple of (sheet index, column, row).
+            cell (Tuple[int, int, int]): Tuple of (sheet index, row, column).
 
         Returns:
             CellObj: Cell object.
         """
-        return CellObj.from_idx(col_idx=cell[1], row_idx=cell[2], sheet_idx=cell[0])
+        return CellObj.from_idx(col_idx=cell[2], row_idx=cell[1], sheet_idx=cell[0])
 
     def convert_cell_to_tuple(self, cell: CalcCell) -> Tuple[int, int, int]:
         """
@@ -168,7 +197,8 @@ class PyModuleState(LogMixin):
             return
 
         old_data = self._state_history.pop(old_key)
-        new_data = ModuleStateItem(cell_obj=new_cell.copy(), mod_dict=old_data.mod_dict.copy(), owner=self)
+        # snapshots are immutable and can be shared.
+        new_data = ModuleStateItem(cell_obj=new_cell.copy(), mod_dict=old_data.mod_dict, owner=self)
         self._state_history[new_key] = new_data
         self.log.debug("update_key() - Updated key for cell %s to %s", old_cell, new_cell)
 
@@ -184,7 +214,7 @@ class PyModuleState(LogMixin):
             DotDict containing the execution result
         """
         result = self._py_mod.update_with_result(code)
-        state_item = ModuleStateItem(cell_obj=cell.cell_obj, mod_dict=self._py_mod.copy_dict(), owner=self)
+        state_item = ModuleStateItem(cell_obj=cell.cell_obj, mod_dict=self._take_snapshot(), owner=self)
         state_item.dd_data.update(result)
         state_key = self.convert_cell_to_tuple(cell)
         self._state_history[state_key] = state_item
@@ -209,6 +239,8 @@ class PyModuleState(LogMixin):
         """Resets the module and clears all state history."""
         self._py_mod.reset_module()
         self._state_history.clear()
+        self._snapshot = None
+        self._snapshot_dict = {}
 
     def reset_to_cell(self, cell: CalcCell, code: str = "") -> Any:  # noqa: ANN401
         """
@@ -225,7 +257,7 @@ class PyModuleState(LogMixin):
             self.log.debug("Cell %s not found in state.", cell.cell_obj)
             return None
         state_item = self[cell]
-        result = self._py_mod.reset_to_dict(state_item.mod_dict.copy(), code)
+        result = self._restore_snapshot(state_item.mod_dict, code)
         self._remove_state_history_by_cell(cell)
         return result
 
@@ -245,10 +277,85 @@ class PyModuleState(LogMixin):
             return False
 
         state_item = self[cell]
-        _ = self._py_mod.reset_to_dict(state_item.mod_dict.copy())
+        _ = self._restore_snapshot(state_item.mod_dict)
         self._remove_state_history_by_cell(cell)
         return True
 
+    def get_state_item(self, key: Tuple[int, int, int]) -> Union[ModuleStateItem, None]:
+        """
+        Gets the state item for a key.
+
+        Args:
+            key (Tuple[int, int, int]): Tuple of (sheet index, row, column).
+
+        Returns:
+            ModuleStateItem, None: State item or None if not found.
+        """
+        return self._state_history.get(key)
+
+    def restore_state(
+        self, key: Optional[Tuple[int, int, int]]
+    ) -> Optional[OrderedDict[Tuple[int, int, int], ModuleStateItem]]:
+        """
+        Restores the module to the state saved after the cell of ``key`` was executed.
+
+        All state history after ``key`` is removed from history and returned.
+        If ``key`` is ``None`` then the module is reset and all of the history is returned.
+
+        Args:
+            key (Tuple[int, int, int], None): Tuple of (sheet index, row, column) or None.
+
+        Returns:
+            OrderedDict, None: Removed state history or None if ``key`` is not in history.
+        """
+        removed: OrderedDict[Tuple[int, int, int], ModuleStateItem] = OrderedDict()
+        if key is None:
+            removed.update(self._state_history)
+            self.reset_module()
+            return removed
+        if key not in self._state_history:
+            self.log.debug("restore_state() - State key '%s' not found in history", key)
+            return None
+        found = False
+        for state_key in list(self._state_history.keys()):
+            if found:
+                removed[state_key] = self._state_history.pop(state_key)
+            elif state_key == key:
+                found = True
+        _ = self._restore_snapshot(self._state_history[key].mod_dict)
+        return removed
+
+    def replay_state_item(
+        self, state_item: ModuleStateItem, names: Iterable[str], deletes: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Applies the values a cell wrote without executing the cell again and saves the resulting state.
+
+        Used when a cell does not depend on any cell that changed so its previous results are still valid.
+
+        Args:
+            state_item (ModuleStateItem): Previous state item of the cell.
+            names (Iterable[str]): Names the cell writes.
+            deletes (Iterable[str], optional): Names the cell deletes. Defaults to None.
+        """
+        mod_dict = state_item.mod_dict
+        for name in names:
+            if name in mod_dict:
+                self._py_mod.set_global_var(name, mod_dict[name])
+        if deletes:
+            for name in deletes:
+                if name not in mod_dict:
+                    self._py_mod.del_global_var(name)
+        self._py_mod.set_global_var("_", mod_dict.get("_"))
+        new_item = ModuleStateItem(cell_obj=state_item.cell_obj, mod_dict=self._take_snapshot(), owner=self)
+        new_item.dd_data.update(state_item.dd_data)
+        state_key = self.convert_cell_obj_to_tuple(state_item.cell_obj)
+        self._state_history[state_key] = new_item
+
+    def get_module_names(self) -> Set[str]:
+        """Gets the names in the module that are bound to other modules such as ``np`` or ``plt``."""
+        return {name for name, value in self._py_mod.get_dict().items() if isinstance(value, types.ModuleType)}
+
     def get_last_item(self) -> Union[ModuleStateItem, None]:
         """Returns the last item in the state history or None if empty."""
         # See: cq.qry.calc.sheet.cell.state.qry_module_state_last_item.QryModuleStateLastItem
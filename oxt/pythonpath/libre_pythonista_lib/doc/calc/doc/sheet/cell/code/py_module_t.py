@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Dict, Protocol, Optional
+from typing import Any, Dict, Mapping, Protocol, Optional
 
 from ooodev.utils.helper.dot_dict import DotDict
 
@@ -9,6 +9,10 @@ class PyModuleT(Protocol):
         """Returns a copy of the module dictionary."""
         ...
 
+    def get_dict(self) -> Mapping[str, Any]:
+        """Returns the module dictionary without copying it. The dictionary must not be modified."""
+        ...
+
     def execute_code(self, code_snippet: str, globals_dict: Optional[dict] = None) -> Any:  # noqa: ANN401
         """
         Compiles and executes the given code snippet.
@@ -46,6 +50,15 @@ class PyModuleT(Protocol):
         """
         ...
 
+    def del_global_var(self, var_name: str) -> None:
+        """
+        Removes a global variable from the module if it exists.
+
+        Args:
+            var_name (str): The name of the variable
+        """
+        ...
+
     def reset_to_dict(self, mod_dict: Dict[str, Any], code: str = "") -> Any:  # noqa: ANN401
         """
         Reset the module to the given dictionary and returns the last variable in the module if code is present.
@@ -8,8 +8,10 @@ from ooodev.utils.data_type.cell_obj import CellObj
 
 if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_source_cache import PySourceCache
 else:
     from libre_pythonista_lib.log.log_mixin import LogMixin
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_source_cache import PySourceCache
 
 
 @dataclass
@@ -126,6 +128,7 @@ class PySource(LogMixin):
         self._col = cell.col_obj.index
         self._sheet_idx = cell.sheet_idx
         self._uri_info = None
+        self._src_cache = None
 
     def __lt__(self, other: object) -> bool:
         """
@@ -148,20 +151,31 @@ class PySource(LogMixin):
         """Creates a shallow copy of this PySource instance."""
         return PySource(self._uri, self._cell_obj)
 
+    def _get_src_cache(self) -> PySourceCache:
+        if self._src_cache is None:
+            self._src_cache = PySourceCache(self.uri_info.runtime_id)
+        return self._src_cache
+
     def _get_source(self) -> str:
         """
-        Reads the source code from storage.
+        Reads the source code from the document cache or from storage.
 
         Returns:
             str: The source code content or empty string if file doesn't exist
         """
         self.log.debug("PySource._get_source() - Getting Source for cell: %s", self._cell_obj)
-        if not self.exists():
+        src_cache = self._get_src_cache()
+        code = src_cache.get(self._uri)
+        if code is not None:
+            return code
+        if not self._src_provider.exists():
             self.log.debug(
                 "PySource._get_source() - Source file does not exist: %s. Returning empty string.", self._uri
             )
             return ""
-        return self._src_provider.get_source()
+        code = self._src_provider.get_source()
+        src_cache.put(self._uri, code)
+        return code
 
     def _set_source(self, code: str) -> None:
         """
@@ -173,11 +187,13 @@ class PySource(LogMixin):
         self.log.debug("PySource._set_source() - Setting Source for cell: %s", self._cell_obj)
         self._src_provider.ensure_src()
         self._src_provider.set_source(code)
+        self._get_src_cache().put(self._uri, code)
 
     def del_source(self) -> None:
         """Deletes the source code file from storage."""
         self.log.debug("PySource.del_source() - Deleting Source for cell: %s", self._cell_obj)
-        if self.exists():
+        self._get_src_cache().remove(self._uri)
+        if self._src_provider.exists():
             self._src_provider.del_source()
         else:
             self.log.debug("PySource.del_source() - Source folder does not exist.")
@@ -189,6 +205,8 @@ class PySource(LogMixin):
         Returns:
             bool: True if file exists, False otherwise
         """
+        if self._uri in self._get_src_cache():
+            return True
         return self._src_provider.exists()
 
     def copy(self) -> PySource:
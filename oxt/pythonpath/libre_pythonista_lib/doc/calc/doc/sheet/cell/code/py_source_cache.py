@@ -0,0 +1,156 @@
+from __future__ import annotations
+from typing import Any, Dict, Optional, TYPE_CHECKING
+import threading
+
+if TYPE_CHECKING:
+    from ooodev.events.args.event_args import EventArgs
+    from oxt.pythonpath.libre_pythonista_lib.doc.doc_globals import DocGlobals
+    from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
+else:
+    from libre_pythonista_lib.doc.doc_globals import DocGlobals
+    from libre_pythonista_lib.log.log_mixin import LogMixin
+
+_KEY = "libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_source_cache.PySourceCache"
+
+
+class PySourceCache(LogMixin):
+    """
+    Singleton Class per document. In memory cache of the python source code stored in the document.
+
+    Keys are the source uri such as ``vnd.sun.star.tdoc:/<uid>/<lp_code_dir>/<sheet_name>/<cell_name>.py``.
+    Only sources that exist in the document are cached.
+    """
+
+    def __new__(cls, runtime_uid: str) -> PySourceCache:
+        gbl_cache = DocGlobals.get_current(runtime_uid)
+        if _KEY in gbl_cache.mem_cache:
+            return gbl_cache.mem_cache[_KEY]
+
+        inst = super().__new__(cls)
+        inst._is_init = False
+
+        gbl_cache.mem_cache[_KEY] = inst
+        return inst
+
+    def __init__(self, runtime_uid: str) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        LogMixin.__init__(self)
+        self._runtime_uid = runtime_uid
+        self._lock = threading.Lock()
+        self._data: Dict[str, str] = {}
+        self._hits = 0
+        self._misses = 0
+        self.log.debug("Init")
+        self._is_init = True
+
+    def __contains__(self, uri: str) -> bool:
+        return uri in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, uri: str) -> Optional[str]:
+        """
+        Gets the cached source code.
+
+        Args:
+            uri (str): Source uri.
+
+        Returns:
+            str, None: Source code or None if the source is not cached.
+        """
+        with self._lock:
+            code = self._data.get(uri)
+            if code is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return code
+
+    def put(self, uri: str, code: str) -> None:
+        """
+        Caches the source code.
+
+        Args:
+            uri (str): Source uri.
+            code (str): Source code.
+        """
+        with self._lock:
+            self._data[uri] = code
+
+    def remove(self, uri: str) -> None:
+        """
+        Removes the source code from the cache.
+
+        Args:
+            uri (str): Source uri.
+        """
+        with self._lock:
+            self._data.pop(uri, None)
+
+    def clear(self) -> None:
+        """Clears the cache and resets the counters."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def on_source_modified(self, src: Any, event: EventArgs) -> None:  # noqa: ANN401
+        """
+        Handles the ``PYTHON_SOURCE_MODIFIED`` event of the source manager.
+
+        When the event data contains the source and its code the cache is updated with the code.
+        When only the source is known it is removed from the cache.
+        Otherwise the whole cache is cleared.
+        """
+        event_data = event.event_data
+        uri = ""
+        py_src = event_data.get("py_src", None) or event_data.get("value", None)
+        if py_src is not None:
+            uri = getattr(py_src, "uri", "")
+        if not uri:
+            self.log.debug("on_source_modified() No uri in event data. Clearing cache.")
+            with self._lock:
+                self._data.clear()
+            return
+        code = event_data.get("code", None)
+        if isinstance(code, str) and uri in self._data:
+            self.put(uri, code)
+        else:
+            self.remove(uri)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Gets cache statistics.
+
+        Returns:
+            Dict[str, Any]: Dictionary with ``size``, ``hits``, ``misses`` and ``hit_rate`` keys.
+        """
+        return {"size": len(self), "hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate}
+
+    # region Properties
+    @property
+    def hits(self) -> int:
+        """Number of reads served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of reads that were not in the cache."""
+        return self._misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of reads served from the cache, ``0.0`` when there has been no reads."""
+        total = self._hits + self._misses
+        if total == 0:
+            return 0.0
+        return self._hits / total
+
+    @property
+    def runtime_uid(self) -> str:
+        """Runtime unique id of the document."""
+        return self._runtime_uid
+
+    # endregion Properties
@@ -1,6 +1,7 @@
 # region Imports
 from __future__ import annotations
-from typing import Any, Dict, List, Tuple, Iterable, TYPE_CHECKING, cast, Union, Optional
+from typing import Any, Dict, Hashable, List, Sequence, Tuple, Iterable, TYPE_CHECKING, cast, Union, Optional
+import hashlib
 import threading
 import time
 from sortedcontainers import SortedDict
@@ -17,6 +18,14 @@ from ooodev.utils.string.str_list import StrList
 if TYPE_CHECKING:
     from oxt.___lo_pip___.debug.break_mgr import BreakMgr
     from oxt.___lo_pip___.debug.py_charm_break_mgr import PyCharmBreakMgr
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import get_code_dependency
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency_graph import (
+        CodeDependencyGraph,
+    )
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_read_cache import LpReadCache
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_range_tracker import (
+        LpRangeTracker,
+    )
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.module_state_item import ModuleStateItem
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module_state import PyModuleState
     from oxt.pythonpath.libre_pythonista_lib.cq.cmd.calc.sheet.cell.code.cmd_cell_src_code import CmdCellSrcCode
@@ -36,6 +45,7 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.cq.qry.qry_handler_t import QryHandlerT
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.index_cell_props import IndexCellProps
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_source import PySource
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_source_cache import PySourceCache
     from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_source_data import PySourceData
     from oxt.pythonpath.libre_pythonista_lib.doc.doc_globals import DocGlobals
     from oxt.pythonpath.libre_pythonista_lib.event.shared_event import SharedEvent
@@ -61,6 +71,10 @@ else:
     from ___lo_pip___.debug.break_mgr import BreakMgr
     from ___lo_pip___.debug.py_charm_break_mgr import PyCharmBreakMgr
 
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import get_code_dependency
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency_graph import CodeDependencyGraph
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_read_cache import LpReadCache
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_range_tracker import LpRangeTracker
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.module_state_item import ModuleStateItem
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module_state import PyModuleState
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module_t import PyModuleT
@@ -80,6 +94,7 @@ else:
     from libre_pythonista_lib.cq.qry.qry_handler_factory import QryHandlerFactory
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.index_cell_props import IndexCellProps
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_source import PySource
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_source_cache import PySourceCache
     from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_source_data import PySourceData
     from libre_pythonista_lib.doc.doc_globals import DocGlobals
     from libre_pythonista_lib.event.shared_event import SharedEvent
@@ -103,7 +118,6 @@ else:
 # endregion Imports
 
 _TREAD_LOCK = threading.Lock()
-_THREAD_EVENT = threading.Event()
 
 break_mgr = BreakMgr()  # Initialize the breakpoint manager
 break_mgr.add_breakpoint("libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_source_manager._init_sources")
@@ -147,6 +161,10 @@ class PySourceManager(LogMixin):
         self.cache_key: str
         self._doc = doc
         self._se = SharedEvent(doc)
+        self._src_cache = PySourceCache(doc.runtime_uid)
+        # keep a reference to the callback so it is not garbage collected.
+        self._fn_on_source_modified = self._src_cache.on_source_modified
+        self._se.subscribe_event(PYTHON_SOURCE_MODIFIED, self._fn_on_source_modified)
         self._qry_handler = QryHandlerFactory.get_qry_handler()
         self._cmd_handler = CmdHandlerFactory.get_cmd_handler()
 
@@ -155,6 +173,11 @@ class PySourceManager(LogMixin):
         self._root_uri = self._qry_root_uri()
         self._src_data = cast(SortedDict, None)
         self._mod_state = PyModuleState(mod)
+        self._lp_read_cache = LpReadCache(doc.runtime_uid)
+        self._lp_range_tracker = LpRangeTracker(doc.runtime_uid)
+        # fingerprint of the code and inputs of each cell when it was last executed.
+        self._fingerprints: Dict[Tuple[int, int, int], Tuple[str, Hashable]] = {}
+        self._load_timings: Dict[str, float] = {}
         self._init_sources()
         self._se.trigger_event("PySourceManagerCreated", EventArgs(self))
         self.log.debug("Number of cells in manager: %i", len(self.src_data))
@@ -170,6 +193,7 @@ class PySourceManager(LogMixin):
         self._src_data = SortedDict()
         self._mod_state.reset_module()
         self.log.debug("_init_sources() Entered.")
+        start = time.perf_counter()
         sources: List[Tuple[PySource, CalcCell, str]] = []
         code_cells = self._qry_lp_cells()
         for sheet in self._doc.sheets:
@@ -188,14 +212,33 @@ class PySourceManager(LogMixin):
                 py_src = self._qry_py_source(uri=uri, cell=calc_cell)
                 sources.append((py_src, calc_cell, uri))
 
-            sources.sort(key=lambda x: x[0])  # Sort by PySource object only.
-            self._process_sources(sources)
+        sources.sort(key=lambda x: x[0])  # Sort by PySource object only.
+        self._load_timings = {"collect": time.perf_counter() - start}
+        self._process_sources(sources)
         self.log.debug("_init_sources() Leaving.")
 
     def _process_sources(self, sources: List[Tuple[PySource, CalcCell, str]]) -> None:
-        _THREAD_EVENT.clear()
+        start = time.perf_counter()
+        count = len(sources)
+        for py_src, calc_cell, uri in sources:
+            self.src_data[py_src.sheet_idx, py_src.row, py_src.col] = PySourceData(
+                uri=uri, cell=calc_cell.cell_obj.copy()
+            )
+        if count > 0:
+            py_src, calc_cell, _ = sources[-1]
+            self.set_global_var("CURRENT_CELL_ID", py_src.uri_info.unique_id)
+            self.set_global_var("CURRENT_CELL_OBJ", calc_cell.cell_obj)
+        self._load_timings["register"] = time.perf_counter() - start
+        self.log.debug(
+            "_process_sources() Registered %i sources. Collect: %.3fs, Register: %.3fs",
+            count,
+            self._load_timings["collect"],
+            self._load_timings["register"],
+        )
+        if count == 0:
+            return
 
-        def process_source(calc_cell: CalcCell, code: str, is_last: bool) -> None:
+        def process_sources(start_time: float) -> None:
             # This solves a strange issue on Windows.
             #
             # Version: 24.8.6.2 (X86_64) / LibreOffice Community
@@ -219,51 +262,27 @@ class PySourceManager(LogMixin):
             # thread then the crash would occur. If it is called on a separate thread then the crash does not occur.
             # When called on a separate thread there is thenot real value because the main thread continues.
             # Calling Join just causes the thread to hang.
-            # After the last source is processed the event is set and the main thread continues.
+            # After the sources are registered the event is set from this thread once the main thread has continued.
             # The event calls a method that then calls the sheet caculateAll method.
             # From this point forward all seems to work fine. on all systems.
             # In theory I could have applied this to windows only but it works fine on other os'es as well.
+            # A single thread is used for all the sources so the delay does not depend on the number of cells.
             # See: libre_pythonista_lib.doc.calc.doc.doc_event_mgr.DocEventMgr
             # see: libre_pythonista_lib.doc.calc.doc.lp_listeners.listener_py_src_mgr_mod_states_init_updated.ListenerPySrcMgrModStatesInitUpdated
 
             with _TREAD_LOCK:
                 time.sleep(0.1)
-                # _ = self._mod_state.update_with_result(cell=calc_cell, code=code)
-            if is_last:
-                # self.log.debug("Last source processed.")
-                self._se.trigger_event(PY_SRC_MGR_MOD_STATES_INIT_UPDATED, EventArgs(self))
-                _THREAD_EVENT.set()
-
-        threads = []
-        count = len(sources)
-        for i, src in enumerate(sources):
-            is_last = i + 1 == count
-            py_src = src[0]
-            calc_cell = src[1]
-            uri = src[2]
-            self.src_data[py_src.sheet_idx, py_src.row, py_src.col] = PySourceData(
-                uri=uri, cell=calc_cell.cell_obj.copy()
+            self._load_timings["ready"] = time.perf_counter() - start_time
+            self._se.trigger_event(PY_SRC_MGR_MOD_STATES_INIT_UPDATED, EventArgs(self))
+            self.log.debug(
+                "_process_sources() Load stage done for %i sources. Ready after: %.3fs, Event: %.3fs",
+                count,
+                self._load_timings["ready"],
+                time.perf_counter() - start_time,
             )
-            self.set_global_var("CURRENT_CELL_ID", py_src.uri_info.unique_id)
-            self.set_global_var("CURRENT_CELL_OBJ", calc_cell.cell_obj)
-            # _ = self._mod_state.update_with_result(cell=calc_cell, code=py_src.source_code)
-            process_thread = threading.Thread(
-                target=process_source, args=(calc_cell, py_src.source_code, is_last), daemon=True
-            )
-            threads.append(process_thread)
-            process_thread.start()
-
-        return
-
-        # wait 5 seconds to see if threads are complete
-        start_time = time.time()
-        while not _THREAD_EVENT.is_set():
-            if time.time() - start_time > 5:
-                break
-            time.sleep(0.1)
 
-        # for thread in threads:
-        #     thread.join()
+        process_thread = threading.Thread(target=process_sources, args=(start,), daemon=True)
+        process_thread.start()
 
     # endregion Init
 
@@ -325,6 +344,7 @@ class PySourceManager(LogMixin):
 
     def dispose(self) -> None:
         if self._se is not None:
+            self._se.unsubscribe_event(PYTHON_SOURCE_MODIFIED, self._fn_on_source_modified)
             self._se.trigger_event("PySourceManagerDisposed", EventArgs(self))
         self._se = cast(SharedEvent, None)
 
@@ -468,7 +488,7 @@ class PySourceManager(LogMixin):
         # get the first item in self._data
         if len(self) == 0:
             return None
-        py_data = self._getitem_py_src_data(list(self.src_data.keys())[0])
+        py_data = self._getitem_py_src_data(self.src_data.keys()[0])
         return py_data
 
     def get_first_item(self) -> Union[PySource, None]:
@@ -484,7 +504,7 @@ class PySourceManager(LogMixin):
         if len(self) == 0:
             return None
 
-        py_data = self._getitem_py_src_data(list(self.src_data.keys())[-1])
+        py_data = self._getitem_py_src_data(self.src_data.keys()[-1])
         return py_data
 
     def get_next_item_py_src_data(self, cell: CellObj, require_exist: bool = False) -> Union[PySourceData, None]:
@@ -501,27 +521,15 @@ class PySourceManager(LogMixin):
         if len(self) == 0:
             self.log.debug("get_next_item_py_src_data() - No items in source manager.")
             return None
-        index = self.get_index(cell)
-        if require_exist and index < 0:
+        code_cell = self.convert_cell_obj_to_tuple(cell)
+        if require_exist and code_cell not in self.src_data:
             self.log.debug("get_next_item_py_src_data() - Cell %s not found.", cell)
             return None
-        if index == len(self) - 1:
-            return None
-        if index > 0:
-            self.log.debug("get_next_item_py_src_data() - Cell %s is the next item.", cell)
-            py_data = cast(PySourceData, self[list(self.src_data.keys())[index + 1]])
-            return py_data
-        # negative index means the cell is not in this instance.
+        # the cell does not have to be in this instance.
+        index = self.src_data.bisect_right(code_cell)
         found = None
-        for key in self.src_data:
-            itm = cast(PySourceData, self.src_data[key])
-            if self.log.is_debug:
-                self.log.debug(
-                    "get_next_item_py_src_data() - Item cell %s > cell %s is %s", itm.cell, cell, itm.cell > cell
-                )
-            if itm.cell > cell:
-                found = itm
-                break
+        if index < len(self.src_data):
+            found = cast(PySourceData, self.src_data.peekitem(index)[1])
         if found is None:
             self.log.debug("get_next_item_py_src_data() - Cell %s not found.", cell)
         else:
@@ -558,28 +566,15 @@ class PySourceManager(LogMixin):
         if len(self) == 0:
             self.log.debug("get_prev_item_py_src_data() - No items in source manager.")
             return None
-        index = self.get_index(cell)
-        if require_exist and index < 0:
+        code_cell = self.convert_cell_obj_to_tuple(cell)
+        if require_exist and code_cell not in self.src_data:
             self.log.debug("get_prev_item_py_src_data() - Cell %s not found and require_exist is True.", cell)
             return None
-        if index == 0:
-            self.log.debug("get_prev_item_py_src_data() - Cell %s is the first item.", cell)
-            return None
-        if index > 0:
-            self.log.debug("get_prev_item_py_src_data() - Cell %s is the previous item.", cell)
-            py_data = cast(PySourceData, self[list(self.src_data.keys())[index - 1]])
-            return py_data
-        # negative index means the cell is not in this instance.
+        # the cell does not have to be in this instance.
+        index = self.src_data.bisect_left(code_cell)
         found = None
-        for key in reversed(self.src_data):
-            itm = cast(PySourceData, self.src_data[key])
-            if self.log.is_debug:
-                self.log.debug(
-                    "get_prev_item_py_src_data() - Item cell %s < cell %s is %s", itm.cell, cell, itm.cell < cell
-                )
-            if itm.cell < cell:
-                found = itm
-                break
+        if index > 0:
+            found = cast(PySourceData, self.src_data.peekitem(index - 1)[1])
         if found is None:
             self.log.debug("get_prev_item_py_src_data() - Cell %s not found.", cell)
         else:
@@ -629,12 +624,12 @@ class PySourceManager(LogMixin):
         Converts a tuple of (sheet index, row, column) to a cell object.
 
         Args:
-            cell (Tuple[int, int, int]): Tuple of (sheet index, column, row).
+            cell (Tuple[int, int, int]): Tuple of (sheet index, row, column).
 
         Returns:
             CellObj: Cell object.
         """
-        return CellObj.from_idx(col_idx=cell[1], row_idx=cell[2], sheet_idx=cell[0])
+        return CellObj.from_idx(col_idx=cell[2], row_idx=cell[1], sheet_idx=cell[0])
 
     def convert_cell_obj_to_calc_cell(self, cell: CellObj) -> CalcCell:
         """
@@ -681,6 +676,8 @@ class PySourceManager(LogMixin):
         new_data = PySourceData(uri=old_data.uri, cell=new_cell.copy())
         self.src_data[new_key] = new_data
         self._mod_state.update_key(old_cell, new_cell)
+        if old_key in self._fingerprints:
+            self._fingerprints[new_key] = self._fingerprints.pop(old_key)
         self.log.debug("update_key() - Updated key for cell %s to %s", old_cell, new_cell)
 
     # region Source Management
@@ -805,6 +802,7 @@ class PySourceManager(LogMixin):
         if index < 0:
             self.log.error("update_source() - Cell %s not found.", cell_obj)
             raise Exception(f"Cell {cell_obj} not found.")
+        prev_code = src.source_code
         src.source_code = code  # writes code to file
         # CellCache.reset_instance()
 
@@ -812,8 +810,8 @@ class PySourceManager(LogMixin):
             self.log.debug("update_source() is last index updating from index %i", index)
             self.update_from_index(index)
         else:
-            self.log.debug("update_source() not last index, Updating all")
-            self.update_all()
+            self.log.debug("update_source() not last index, Updating dependents")
+            self.update_dependents(index, prev_code)
         eargs = EventArgs.from_args(cargs)
         self._se.trigger_event(PYTHON_AFTER_UPDATE_SOURCE_CODE, eargs)
         return None
@@ -856,6 +854,7 @@ class PySourceManager(LogMixin):
             return
         self[code_cell].del_source()
         del self.src_data[code_cell]
+        self._fingerprints.pop(code_cell, None)
         sheet = self._doc.sheets[sheet_idx]
         calc_cell = sheet[cell_obj]
 
@@ -910,7 +909,7 @@ class PySourceManager(LogMixin):
         """Removes the source for the last item in the source manager."""
         if len(self) == 0:
             return
-        cell_obj = self.convert_tuple_to_cell_obj(list(self.src_data.keys())[-1])
+        cell_obj = self.convert_tuple_to_cell_obj(self.src_data.keys()[-1])
         self.remove_source(cell_obj)
 
     def set_global_var(self, name: str, value: Any) -> None:  # noqa: ANN401
@@ -935,7 +934,9 @@ class PySourceManager(LogMixin):
         """
         try:
             code_cell = self.convert_cell_obj_to_tuple(cell)
-            return list(self.src_data.keys()).index(code_cell)
+            if code_cell not in self.src_data:
+                return -1
+            return self.src_data.index(code_cell)
         except Exception:
             self.log.debug("get_index() - Cell %s not found.", cell)
             return -1
@@ -990,10 +991,14 @@ class PySourceManager(LogMixin):
         self.set_global_var("CURRENT_CELL_ID", py_src.uri_info.unique_id)
         self.set_global_var("CURRENT_CELL_OBJ", cell_obj)
 
+        key = (sheet_idx, row, col)
         try:
-            result = self._mod_state.update_with_result(calc_cell, py_src.source_code)
+            code = py_src.source_code
+            result = self._mod_state.update_with_result(calc_cell, code)
             result.py_src = py_src
+            self._fingerprints[key] = self._get_fingerprint(code, sheet_idx)
         except Exception as e:
+            self._fingerprints.pop(key, None)
             self.log.exception("_update_item() - Error updating module. %s", e)
             return False
 
@@ -1005,6 +1010,73 @@ class PySourceManager(LogMixin):
         self.log.debug("_update_item() Leaving.")
         return True
 
+    def _get_code_hash(self, code: str) -> str:
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    def _get_inputs(self, code: str, sheet_idx: int) -> Hashable:
+        """
+        Gets the state of the sheet data the code of a cell may read.
+
+        For ``lp()`` calls with cell or range addresses this is the content hash of each range,
+        so only changes to those ranges make the cell dirty. Code that calls ``lp()`` with other arguments or
+        can not be analyzed uses the ``lp()`` read generation, which changes when any sheet is modified.
+        Code that does not call ``lp()`` returns ``0``.
+        """
+        dep = get_code_dependency(code)
+        if dep.is_opaque or dep.lp_unresolved:
+            return self._lp_read_cache.generation
+        if dep.lp_refs:
+            inputs = self._lp_range_tracker.get_inputs(self._doc, sheet_idx, dep.lp_refs)
+            if inputs is None:
+                return self._lp_read_cache.generation
+            return inputs
+        return 0
+
+    def _get_fingerprint(self, code: str, sheet_idx: int) -> Tuple[str, Hashable]:
+        """Gets the fingerprint of the code of a cell and the sheet data it may read."""
+        return (self._get_code_hash(code), self._get_inputs(code, sheet_idx))
+
+    def is_source_current(self, cell_obj: CellObj, code: str) -> bool:
+        """
+        Gets if the result of the last execution of a cell is still current.
+
+        The result is current when the cell was last executed with the same code, its state is in the module
+        state history, and the ranges the code reads with ``lp()`` have not changed since.
+        Changes to the code of other cells re-execute the cells that depend on them when the code is updated.
+
+        Args:
+            cell_obj (CellObj): Cell object.
+            code (str): Current source code of the cell.
+
+        Returns:
+            bool: ``True`` if the cell does not need to be executed again.
+        """
+        key = self.convert_cell_obj_to_tuple(cell_obj)
+        fingerprint = self._fingerprints.get(key)
+        if fingerprint is None:
+            return False
+        if self._mod_state.get_state_item(key) is None:
+            return False
+        if fingerprint[0] != self._get_code_hash(code):
+            return False
+        return fingerprint[1] == self._get_inputs(code, key[0])
+
+    def get_stale_cells(self) -> List[CellObj]:
+        """
+        Gets the cells whose last result is not current, see :py:meth:`is_source_current`.
+
+        Returns:
+            List[CellObj]: Cells in module order.
+        """
+        result = []
+        for key in self.src_data:
+            py_src_data = self._getitem_py_src_data(key)
+            py_src = PySource(uri=py_src_data.uri, cell=py_src_data.cell)
+            cell_obj = CellObj.from_idx(col_idx=key[2], row_idx=key[1], sheet_idx=key[0])
+            if not self.is_source_current(cell_obj, py_src.source_code):
+                result.append(cell_obj)
+        return result
+
     def update_all(self) -> None:
         """
         Rebuilds the module for all the cells.
@@ -1017,8 +1089,78 @@ class PySourceManager(LogMixin):
             co = CellObj.from_idx(col_idx=key[2], row_idx=key[1], sheet_idx=key[0])
             py_src_data = self._getitem_py_src_data(co)
             self._update_item(py_src_data)
+        self.log.debug("update_all() Source cache stats: %s", self._src_cache.get_stats())
         self.log.debug("update_all() Leaving.")
 
+    def get_dependency_graph(self) -> CodeDependencyGraph:
+        """
+        Gets the dependency graph for the current source code of all the cells.
+
+        Returns:
+            CodeDependencyGraph: Dependency graph with cells in execution order.
+        """
+        sheet_names = {sheet.name: sheet.sheet_index for sheet in self._doc.sheets}
+        graph = CodeDependencyGraph(sheet_names=sheet_names)
+        for key in self.src_data:
+            py_src_data = cast(PySourceData, self.src_data[key])
+            py_src = PySource(uri=py_src_data.uri, cell=py_src_data.cell)
+            graph.add(key, py_src.source_code)
+        return graph
+
+    def update_dependents(self, index: int, prev_code: str = "") -> None:
+        """
+        Rebuilds the module for the cell at the specified index and the cells that depend on it.
+
+        The module is seeded from the state of the cell before ``index``.
+        Cells after ``index`` that do not read anything the changed cell writes, directly or transitively,
+        are not executed again; their saved state is applied instead.
+
+        Falls back to ``update_all()`` when the state of the previous cell is not available,
+        when a cell mutates an object in place that would not be recreated or when a cell that is executed again
+        calls a function of another cell or passes an object of another cell to a call.
+
+        Args:
+            index (int): Index of the cell in the data.
+            prev_code (str, optional): Source code of the cell before it changed. Defaults to "".
+        """
+        self.log.debug("update_dependents(%i) Entered.", index)
+        keys = cast(Sequence[Tuple[int, int, int]], self.src_data.keys())
+        if index < 0 or index >= len(keys):
+            self.log.warning("update_dependents() Index out of range.")
+            return
+        if index > 0 and self._mod_state.get_state_item(keys[index - 1]) is None:
+            self.log.debug("update_dependents() No state for previous cell. Updating all.")
+            self.update_all()
+            return
+
+        graph = self.get_dependency_graph()
+        prev_key = keys[index - 1] if index > 0 else None
+        removed = self._mod_state.restore_state(prev_key)
+        if removed is None:
+            self.log.debug("update_dependents() Unable to restore state. Updating all.")
+            self.update_all()
+            return
+
+        result = graph.get_dirty_keys(
+            keys[index], prev_code=prev_code, ignore_mutates=self._mod_state.get_module_names()
+        )
+        if not result.is_safe:
+            self.log.debug("update_dependents() Objects may be mutated in place. Updating all.")
+            self.update_all()
+            return
+
+        dirty = set(result.keys)
+        executed = 0
+        for key in keys[index:]:
+            state_item = removed.get(key)
+            if key in dirty or state_item is None:
+                self._update_item(self._getitem_py_src_data(key))
+                executed += 1
+            else:
+                dep = graph[key]
+                self._mod_state.replay_state_item(state_item, dep.writes, dep.deletes)
+        self.log.debug("update_dependents(%i) Leaving. Executed %i of %i cells.", index, executed, len(keys) - index)
+
     def get_calc_cells(self) -> List[CalcCell]:
         """
         Get all the CalcCells that have code.
@@ -1068,7 +1210,7 @@ class PySourceManager(LogMixin):
             return
 
         # reset the module dictionary to before index item changes
-        keys = list(self.src_data.keys())
+        keys = self.src_data.keys()
         key = keys[index]  # row, col format
         co = CellObj.from_idx(col_idx=key[2], row_idx=key[1], sheet_idx=key[0])
         # py_src = self[co]
@@ -1106,6 +1248,22 @@ class PySourceManager(LogMixin):
     def sfa(self) -> Sfa:
         return self._sfa
 
+    @property
+    def load_timings(self) -> Dict[str, float]:
+        """
+        Gets the durations in seconds of the document load stages.
+
+        ``collect`` is the time to find the sources of the cells, ``register`` the time to add them to the manager and
+        ``ready`` the time from registering until the module states init event is raised.
+        ``ready`` is only set once the event has been raised.
+        """
+        return dict(self._load_timings)
+
+    @property
+    def src_cache(self) -> PySourceCache:
+        """In memory cache of the source code of the document."""
+        return self._src_cache
+
     @property
     def state_history(self) -> PyModuleState:
         return self._mod_state
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from typing import Any, Dict, Set, Tuple, TYPE_CHECKING
+import time
+
+if TYPE_CHECKING:
+    from ooodev.calc import CalcDoc
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_source_manager import PySourceManager
+    from oxt.pythonpath.libre_pythonista_lib.doc.doc_globals import DocGlobals
+    from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
+else:
+    from libre_pythonista_lib.doc.doc_globals import DocGlobals
+    from libre_pythonista_lib.log.log_mixin import LogMixin
+
+    PySourceManager = Any
+
+_KEY = "libre_pythonista_lib.doc.recalc_session.RecalcSession"
+
+
+class RecalcSession(LogMixin):
+    """
+    Singleton Class per document. Groups the ``PY.C`` formula calls of one Calc recalculation into a pass.
+
+    Calc calls ``PY.C`` once per formula. A pass starts with the first call and ends when a formula is called a second
+    time or when there has been no call for ``PASS_TIMEOUT`` seconds after the previous call returned, see
+    :py:meth:`leave`. A cell that takes longer than ``PASS_TIMEOUT`` to calculate does not end the pass.
+
+    The first source cell of a pass brings all the stale cells up to date in module order with
+    :py:meth:`update_stale`, every call of the pass is then served from the module state.
+    Work that only needs to be done once per sheet in a pass is tracked with :py:meth:`enter_sheet`.
+    """
+
+    PASS_TIMEOUT = 0.5
+    """Seconds between the end of a call and the next call after which the next call starts a new pass."""
+
+    def __new__(cls, doc: CalcDoc) -> RecalcSession:
+        gbl_cache = DocGlobals.get_current(doc.runtime_uid)
+        if _KEY in gbl_cache.mem_cache:
+            return gbl_cache.mem_cache[_KEY]
+
+        inst = super().__new__(cls)
+        inst._is_init = False
+
+        gbl_cache.mem_cache[_KEY] = inst
+        return inst
+
+    def __init__(self, doc: CalcDoc) -> None:
+        if getattr(self, "_is_init", False):
+            return
+        LogMixin.__init__(self)
+        self._runtime_uid = doc.runtime_uid
+        self._cells: Set[Tuple[int, str]] = set()
+        self._sheets: Set[int] = set()
+        self._last_call = 0.0
+        self._is_updated = False
+        self._is_updating = False
+        self._passes = 0
+        self._calls = 0
+        self._updated_cells = 0
+        self.log.debug("Init")
+        self._is_init = True
+
+    def enter(self, sheet_idx: int, cell_address: str) -> bool:
+        """
+        Registers a ``PY.C`` call.
+
+        Args:
+            sheet_idx (int): Zero based sheet index.
+            cell_address (str): Address of the formula cell such as ``A1``.
+
+        Returns:
+            bool: ``True`` if the call starts a new pass.
+        """
+        now = time.perf_counter()
+        key = (sheet_idx, cell_address)
+        self._calls += 1
+        # calls made while the stale cells are being updated are part of the current pass.
+        is_new = not self._is_updating and (key in self._cells or now - self._last_call > RecalcSession.PASS_TIMEOUT)
+        self._last_call = now
+        if is_new:
+            if self._passes and self.log.is_debug:
+                self.log.debug("enter() Pass %i ended after %i cells.", self._passes, len(self._cells))
+            self._passes += 1
+            self._cells.clear()
+            self._sheets.clear()
+            self._is_updated = False
+        self._cells.add(key)
+        return is_new
+
+    def leave(self) -> None:
+        """
+        Registers the end of a ``PY.C`` call.
+
+        The time without a call that ends a pass is counted from here, so the time taken by the call is not counted.
+        """
+        self._last_call = time.perf_counter()
+
+    def enter_sheet(self, sheet_idx: int) -> bool:
+        """
+        Registers a sheet for the current pass.
+
+        Args:
+            sheet_idx (int): Zero based sheet index.
+
+        Returns:
+            bool: ``True`` if this is the first call for the sheet in the current pass.
+        """
+        if sheet_idx in self._sheets:
+            return False
+        self._sheets.add(sheet_idx)
+        return True
+
+    def update_stale(self, py_src_mgr: PySourceManager) -> int:
+        """
+        Brings the stale source cells up to date in module order, once per pass.
+
+        Each stale cell is updated as if its own formula was calculated, which also executes the cells that depend
+        on it. Cells that are current by the time they are reached are skipped, so each cell runs at most once.
+
+        Args:
+            py_src_mgr (PySourceManager): Source manager of the document.
+
+        Returns:
+            int: Number of stale cells that were found.
+        """
+        if self._is_updated or self._is_updating:
+            return 0
+        if TYPE_CHECKING:
+            from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.cell_item_facade import CellItemFacade
+        else:
+            from libre_pythonista_lib.doc.calc.doc.sheet.cell.cell_item_facade import CellItemFacade
+
+        self._is_updating = True
+        try:
+            stale = py_src_mgr.get_stale_cells()
+            for cell_obj in stale:
+                calc_cell = py_src_mgr.convert_cell_obj_to_calc_cell(cell_obj)
+                # auto_update() skips the cell if an earlier update has already executed it.
+                CellItemFacade(calc_cell).auto_update()
+            self._updated_cells += len(stale)
+            if stale and self.log.is_debug:
+                self.log.debug("update_stale() Pass %i updated %i stale cells.", self._passes, len(stale))
+            # only a sweep that completed is done for the pass, a failed sweep is tried again by the next source cell.
+            self._is_updated = True
+            return len(stale)
+        except Exception:
+            self.log.exception("update_stale() Error updating stale cells.")
+            return 0
+        finally:
+            self._is_updating = False
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Gets session statistics.
+
+        Returns:
+            Dict[str, int]: Dictionary with ``passes``, ``calls``, ``cells`` and ``updated_cells`` keys.
+                ``cells`` is the number of formulas called in the current pass.
+        """
+        return {
+            "passes": self._passes,
+            "calls": self._calls,
+            "cells": len(self._cells),
+            "updated_cells": self._updated_cells,
+        }
+
+    # region Properties
+    @property
+    def is_updating(self) -> bool:
+        """Gets if the stale cells are being updated."""
+        return self._is_updating
+
+    @property
+    def runtime_uid(self) -> str:
+        """Runtime unique id of the document."""
+        return self._runtime_uid
+
+    # endregion Properties
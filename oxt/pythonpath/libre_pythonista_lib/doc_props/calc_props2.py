@@ -26,6 +26,8 @@ class CalcProps2:
         self._include_extra_err_info = False
         self._is_modified = False
         self._doc_ext_location = "user" if self._cfg.is_user_installed else "share"
+        self._fig_format = "auto"
+        self._fig_dpi = 100
 
     def _get_config(self) -> Config:
         # for testing
@@ -45,6 +47,8 @@ class CalcProps2:
         inst._include_extra_err_info = self._include_extra_err_info
         inst._is_modified = self._is_modified
         inst._doc_ext_location = self._doc_ext_location
+        inst._fig_format = self._fig_format
+        inst._fig_dpi = self._fig_dpi
         return inst
 
     def to_dict(self) -> dict:
@@ -60,6 +64,8 @@ class CalcProps2:
             "log_to_console": self._log_to_console,
             "include_extra_err_info": self._include_extra_err_info,
             "doc_ext_location": self._doc_ext_location,
+            "fig_format": self._fig_format,
+            "fig_dpi": self._fig_dpi,
         }
 
     def copy(self) -> CalcProps2:
@@ -88,6 +94,8 @@ class CalcProps2:
         props._log_to_console = data.get("log_to_console", props._log_to_console)
         props._include_extra_err_info = data.get("include_extra_err_info", props._include_extra_err_info)
         props._doc_ext_location = data.get("doc_ext_location", props._doc_ext_location)
+        props._fig_format = data.get("fig_format", props._fig_format)
+        props._fig_dpi = data.get("fig_dpi", props._fig_dpi)
         props._is_modified = False
         return props
 
@@ -155,4 +163,30 @@ class CalcProps2:
             self._doc_ext_location = value
             self._mark_modified()
 
+    @property
+    def fig_format(self) -> str:
+        """
+        Gets/Sets the image format of Matplotlib figures, ``auto``, ``svg`` or ``png``.
+
+        ``auto`` uses ``png`` for figures with many points and ``svg`` otherwise.
+        """
+        return self._fig_format
+
+    @fig_format.setter
+    def fig_format(self, value: str) -> None:
+        if self._fig_format != value:
+            self._fig_format = value
+            self._mark_modified()
+
+    @property
+    def fig_dpi(self) -> int:
+        """Gets/Sets the resolution of Matplotlib figures that are rendered as ``png``."""
+        return self._fig_dpi
+
+    @fig_dpi.setter
+    def fig_dpi(self, value: int) -> None:
+        if self._fig_dpi != value:
+            self._fig_dpi = value
+            self._mark_modified()
+
     # endregion Properties
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
+from typing import Any, Dict, Iterator, Optional, TYPE_CHECKING
 import contextlib
 from abc import abstractmethod
 from ooodev.utils.gen_util import NULL_OBJ
@@ -26,6 +26,10 @@ class CustomPropsBase:
     Note:
         Any value that can be serialized to JSON can be stored as a custom property.
         Classes can implement the :py:class:`ooodev.io.json.json_encoder.JsonEncoder` class to provide custom serialization by overriding the ``on_json_encode()`` method.
+
+    Note:
+        The JSON file is read once, properties are read from memory after that. Use :py:meth:`reload` to read the file
+        again. Inside a :py:meth:`batch` the properties are only changed in memory and written once when the batch ends.
     """
 
     def __init__(self, doc: OfficeDocumentT, file_name: str, props_id: str) -> None:
@@ -49,6 +53,9 @@ class CustomPropsBase:
         self._name = file_name
         self._file_exist = False
         self._props = {}
+        self._batch_depth = 0
+        self._batch_snapshot: Optional[Dict[str, Any]] = None
+        self._batch_dirty = False
         with self.log.indent(True):
             self.log.debug(f"File Name: {self._name}")
             self.log.debug("End Init")
@@ -187,6 +194,10 @@ class CustomPropsBase:
         self._init_props()
         with self.log.indent(True):
             try:
+                if self._batch_depth > 0:
+                    self._props[name] = value
+                    self._batch_dirty = True
+                    return
                 props = self._props.copy()
                 props[name] = value
                 self._save_properties(props)
@@ -224,6 +235,10 @@ class CustomPropsBase:
         """
         self._init_props()
         with contextlib.suppress(Exception):
+            if self._batch_depth > 0:
+                self._props.update(properties.copy_dict())
+                self._batch_dirty = True
+                return
             props = self._props.copy()
             props.update(properties.copy_dict())
             self._save_properties(props)
@@ -245,6 +260,11 @@ class CustomPropsBase:
         self._init_props()
         with self.log.indent(True):
             try:
+                if self._batch_depth > 0:
+                    if name in self._props:
+                        del self._props[name]
+                        self._batch_dirty = True
+                    return
                 props = self._props.copy()
                 if name in props:
                     del props[name]
@@ -254,6 +274,63 @@ class CustomPropsBase:
             except Exception:
                 self.log.error(f"Error removing property '{name}'", exc_info=True)
 
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Context manager that writes all the properties set inside it to the document once.
+
+        Properties set, updated or removed inside the batch are only changed in memory and read back from memory.
+        When the outermost batch ends the properties are written to the JSON file once, if any property changed.
+        If an exception is raised inside the batch the properties are restored and nothing is written.
+
+        Example:
+            .. code-block:: python
+
+                with props.batch():
+                    props.log_level = logging.DEBUG
+                    props.log_to_console = True
+        """
+        self._init_props()
+        if self._batch_depth == 0:
+            self._batch_snapshot = self._props.copy()
+            self._batch_dirty = False
+        self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._props = self._batch_snapshot or {}
+                self._batch_snapshot = None
+                self._batch_dirty = False
+                self.log.debug("batch() Rolled back.")
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth > 0:
+            return
+        self._batch_snapshot = None
+        if not self._batch_dirty:
+            return
+        self._batch_dirty = False
+        with self.log.indent(True):
+            try:
+                self._save_properties(self._props.copy())
+                self.log.debug("batch() Properties written.")
+            except Exception:
+                self.log.error("batch() Error writing properties.", exc_info=True)
+
+    def reload(self) -> None:
+        """
+        Reads the properties from the JSON file again, discards the properties cached in memory.
+
+        Does nothing inside a :py:meth:`batch`.
+        """
+        if self._batch_depth > 0:
+            self.log.debug("reload() In a batch. Not reloading.")
+            return
+        self._is_props_init = False
+        self._init_props()
+
     def has_custom_property(self, name: str) -> bool:
         """
         Gets if a custom property exists.
@@ -284,6 +361,11 @@ class CustomPropsBase:
         """Document"""
         return self._doc
 
+    @property
+    def in_batch(self) -> bool:
+        """Gets if a :py:meth:`batch` is active."""
+        return self._batch_depth > 0
+
     @property
     def is_doc_props(self) -> bool:
         """
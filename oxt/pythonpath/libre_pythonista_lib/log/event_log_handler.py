@@ -1,25 +1,179 @@
 from __future__ import annotations
+from typing import Any, List, Optional
+from collections import deque
+import copy
+import logging
+import os
+import threading
+import time
+
+import uno
+import unohelper
+from com.sun.star.awt import XCallback
+
 from ooodev.events.partial.events_partial import EventsPartial
 from ooodev.events.args.event_args import EventArgs
 from ooodev.utils.helper.dot_dict import DotDict
 
-import logging
+
+class _FlushCallback(unohelper.Base, XCallback):
+    """Flushes a handler when LibreOffice calls back on the main thread."""
+
+    def __init__(self, handler: EventLogHandler) -> None:
+        self._handler = handler
+
+    def notify(self, aData: Any) -> None:  # noqa: ANN401, N803
+        self._handler._on_async_flush()
 
 
 class EventLogHandler(logging.Handler, EventsPartial):
-    def __init__(self, *args, uid: str, **kwargs) -> None:  # noqa: ANN002, ANN003
+    """
+    Log handler that triggers the ``log_emit`` event for the log windows.
+
+    Records are formatted when they are emitted, as ``logging.handlers.QueueHandler`` does, and are kept in a ring
+    buffer of ``max_records`` records. All pending records are sent in one ``log_emit`` event so a log window writes
+    to its control once per flush instead of once per record. When more than ``max_records`` records are logged
+    between two flushes the oldest records are dropped.
+
+    The subscribers write to UNO controls so records are never flushed on a thread of the handler. A record emitted
+    on the main thread ``FLUSH_INTERVAL`` seconds or more after the last flush is flushed right away. Otherwise a
+    flush is posted to the main thread with ``com.sun.star.awt.AsyncCallback``. When the callback is not available
+    the pending records are flushed by the next record emitted after the interval or by :py:meth:`flush`.
+    """
+
+    MAX_RECORDS = 1000
+    """Default maximum number of pending records."""
+
+    FLUSH_INTERVAL = 0.25
+    """Minimum number of seconds between two flushes."""
+
+    def __init__(self, *args, uid: str, max_records: int = MAX_RECORDS, **kwargs) -> None:  # noqa: ANN002, ANN003
         self._uid = uid
         logging.Handler.__init__(self, *args, **kwargs)
         EventsPartial.__init__(self)
-        # Initialization code for your handler (e.g., open a file, establish a network connection)
+        self._records: deque[logging.LogRecord] = deque(maxlen=max(1, max_records))
+        self._dropped = 0
+        self._buf_lock = threading.Lock()
+        self._last_flush = 0.0
+        self._is_scheduled = False
+        self._async_callback: Any = None
+        self._flush_callback: Optional[_FlushCallback] = None
+        self._closed = False
+
+    def _prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # same as QueueHandler.prepare(), the message is formatted now so mutable arguments are logged as they are
+        # when the record is emitted.
+        msg = self.format(record)
+        record = copy.copy(record)
+        record.message = msg
+        record.msg = msg
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        record.stack_info = None
+        return record
+
+    def _get_async_callback(self) -> Any:  # noqa: ANN401
+        if self._async_callback is None:
+            try:
+                ctx = uno.getComponentContext()
+                self._async_callback = ctx.ServiceManager.createInstanceWithContext(
+                    "com.sun.star.awt.AsyncCallback", ctx
+                )
+            except Exception:
+                self._async_callback = None
+            if self._async_callback is None:
+                # not available, such as when not running in LibreOffice. Do not try again.
+                self._async_callback = False
+            else:
+                self._flush_callback = _FlushCallback(self)
+        return self._async_callback
+
+    def _schedule_flush(self) -> bool:
+        """Posts a flush to the main thread. Must be called with the buffer lock held."""
+        if self._is_scheduled:
+            return True
+        async_callback = self._get_async_callback()
+        if not async_callback:
+            return False
+        try:
+            async_callback.addCallback(self._flush_callback, None)
+        except Exception:
+            return False
+        self._is_scheduled = True
+        return True
+
+    def _on_async_flush(self) -> None:
+        with self._buf_lock:
+            self._is_scheduled = False
+        self.flush()
 
     def emit(self, record: logging.LogRecord) -> None:
-        # This method will be called for every log message
-        # You can format the record as you wish using self.format(record)
-        log_message = self.format(record)
-        dd = DotDict(log_msg=log_message, record=record, log_level=self.level, uid=self._uid)
+        if record.levelno < self.level:
+            return
+        try:
+            record = self._prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self._buf_lock:
+            if self._closed:
+                return
+            if len(self._records) == self._records.maxlen:
+                self._dropped += 1
+            self._records.append(record)
+            is_due = time.monotonic() - self._last_flush >= EventLogHandler.FLUSH_INTERVAL
+            if is_due and threading.current_thread() is threading.main_thread():
+                flush_now = True
+            else:
+                flush_now = not self._schedule_flush() and is_due
+        if flush_now:
+            self.flush()
+
+    def _drain(self) -> List[logging.LogRecord]:
+        with self._buf_lock:
+            records = list(self._records)
+            self._records.clear()
+            dropped = self._dropped
+            self._dropped = 0
+            self._last_flush = time.monotonic()
+        if dropped and records:
+            first = records[0]
+            dropped_record = logging.makeLogRecord(
+                {
+                    "name": first.name,
+                    "levelno": logging.WARNING,
+                    "levelname": logging.getLevelName(logging.WARNING),
+                    "msg": "%i log records were dropped.",
+                    "args": (dropped,),
+                    "created": first.created,
+                }
+            )
+            try:
+                records.insert(0, self._prepare(dropped_record))
+            except Exception:
+                self.handleError(dropped_record)
+        return records
+
+    def flush(self) -> None:
+        """Triggers a single ``log_emit`` event for all the pending records."""
+        records = self._drain()
+        if not records:
+            return
+        dd = DotDict(
+            log_msg=os.linesep.join(str(record.msg) for record in records),
+            record=records[-1],
+            records=records,
+            log_level=self.level,
+            uid=self._uid,
+        )
         eargs = EventArgs(self)
         eargs.event_data = dd
         self.trigger_event("log_emit", eargs)
 
-        # Implement your custom handling logic here (e.g., write to a file, send over network)
+    def close(self) -> None:
+        """Flushes the pending records."""
+        self.flush()
+        with self._buf_lock:
+            self._closed = True
+        logging.Handler.close(self)
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
+from typing import Any, Dict, TYPE_CHECKING
+import threading
 
 if TYPE_CHECKING:
     from oxt.___lo_pip___.oxt_logger import OxtLogger
@@ -8,6 +9,11 @@ else:
     from ___lo_pip___.oxt_logger import OxtLogger
     from libre_pythonista_lib.doc.doc_globals import DocGlobals
 
+# Loggers are cached per class name. Qry and Cmd objects are created many times per recalculation
+# and creating a logger for each of them is costly.
+_LOGGERS: Dict[str, OxtLogger] = {}
+_LOCK = threading.Lock()
+
 
 class LogMixin:
     def __init__(self) -> None:
@@ -22,7 +28,7 @@ class LogMixin:
                 from libre_pythonista_lib.log.dummy_log import DummyLogger
             return DummyLogger()  # type: ignore
         else:
-            return OxtLogger(log_name=self.__class__.__name__)
+            return get_class_logger(self.__class__.__name__)
 
     @property
     def log(self) -> OxtLogger:
@@ -31,3 +37,24 @@ class LogMixin:
     @log.setter
     def log(self, value: OxtLogger) -> None:
         self.__log = value
+
+
+def get_class_logger(log_name: str) -> OxtLogger:
+    """
+    Gets the shared logger for a log name, creating it the first time.
+
+    Args:
+        log_name (str): Log name, usually the name of the class.
+
+    Returns:
+        OxtLogger: Logger.
+    """
+    log = _LOGGERS.get(log_name)
+    if log is not None:
+        return log
+    with _LOCK:
+        log = _LOGGERS.get(log_name)
+        if log is None:
+            log = OxtLogger(log_name=log_name)
+            _LOGGERS[log_name] = log
+        return log
@@ -16,12 +16,14 @@ if TYPE_CHECKING:
     from oxt.___lo_pip___.oxt_logger.oxt_logger import OxtLogger
     from oxt.pythonpath.libre_pythonista_lib.event.shared_event import SharedEvent
     from oxt.pythonpath.libre_pythonista_lib.log.event_log_handler import EventLogHandler
+    from oxt.pythonpath.libre_pythonista_lib.config.dialog.log_cfg import LogCfg
     from oxt.pythonpath.libre_pythonista_lib.doc.doc_globals import DocGlobals
     from oxt.pythonpath.libre_pythonista_lib.const.event_const import LOG_PY_LOGGER_RESET
 else:
     from ___lo_pip___.oxt_logger.oxt_logger import OxtLogger
     from libre_pythonista_lib.event.shared_event import SharedEvent
     from libre_pythonista_lib.log.event_log_handler import EventLogHandler
+    from libre_pythonista_lib.config.dialog.log_cfg import LogCfg
     from libre_pythonista_lib.doc.doc_globals import DocGlobals
     from libre_pythonista_lib.const.event_const import LOG_PY_LOGGER_RESET
 
@@ -98,8 +100,9 @@ class PyLogger(Logger):
         has_handler = False
         has_console_handler = False
 
-        self._event_log_handler = EventLogHandler(uid=self._uid)
+        self._event_log_handler = EventLogHandler(uid=self._uid, max_records=LogCfg().max_lines)
         self._event_log_handler.setFormatter(self._formatter)
+        self._event_log_handler.setLevel(self._log_level)
         self._otx_log.debug("Adding Event Log Handler")
         self.addHandler(self._event_log_handler)
 
@@ -321,6 +324,9 @@ class PyLogger(Logger):
 
         gbl_cache = DocGlobals.get_current(uid=doc.runtime_uid)  # type: ignore
         if _KEY in gbl_cache.mem_cache:
+            # sends the pending records to the log windows and stops the flush timer.
+            with contextlib.suppress(Exception):
+                gbl_cache.mem_cache[_KEY]._event_log_handler.close()
             del gbl_cache.mem_cache[_KEY]
             eargs = EventArgs(cls)
             eargs.event_data = DotDict(reset_all=False, runtime_id=doc.runtime_uid)
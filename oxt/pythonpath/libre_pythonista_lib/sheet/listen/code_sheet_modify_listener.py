@@ -23,6 +23,10 @@ if TYPE_CHECKING:
     from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import LogMixin
     from oxt.pythonpath.libre_pythonista_lib.mixin.listener.trigger_state_mixin import TriggerStateMixin
     from oxt.pythonpath.libre_pythonista_lib.const.event_const import SHEET_MODIFIED
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_read_cache import LpReadCache
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_range_tracker import (
+        LpRangeTracker,
+    )
 else:
     from libre_pythonista_lib.ex.exceptions import SingletonKeyError
     from libre_pythonista_lib.event.shared_event import SharedEvent
@@ -30,6 +34,8 @@ else:
     from libre_pythonista_lib.log.log_mixin import LogMixin
     from libre_pythonista_lib.mixin.listener.trigger_state_mixin import TriggerStateMixin
     from libre_pythonista_lib.const.event_const import SHEET_MODIFIED
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_read_cache import LpReadCache
+    from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_range_tracker import LpRangeTracker
 
 _KEY = "libre_pythonista_lib.sheet.listen.code_sheet_modify_listener.CodeSheetModifyListener"
 
@@ -48,7 +54,9 @@ class CodeSheetModifyListener(XModifyListener, LogMixin, TriggerStateMixin, unoh
         inst._runtime_uid = gbl_cache.runtime_uid
         inst._is_init = False
 
-        gbl_cache.mem_cache[_KEY] = {key: inst}
+        if _KEY not in gbl_cache.mem_cache:
+            gbl_cache.mem_cache[_KEY] = {}
+        gbl_cache.mem_cache[_KEY][key] = inst
         return inst
 
     @classmethod
@@ -74,6 +82,7 @@ class CodeSheetModifyListener(XModifyListener, LogMixin, TriggerStateMixin, unoh
         unohelper.Base.__init__(self)
         self._inst_name: str
         self._runtime_uid: str
+        self._sheet_unique_id = inst_name
         self._is_init = True
 
     @override
@@ -86,6 +95,13 @@ class CodeSheetModifyListener(XModifyListener, LogMixin, TriggerStateMixin, unoh
         The source of the event may be the content of the object to which the listener
         is registered.
         """
+        # lp() reads of the sheet are stale even when events are not triggered.
+        # The event does not contain the changed range so all the reads of the sheet are removed.
+        # LpRangeTracker compares the content of the ranges to find the cells that need to run again.
+        with contextlib.suppress(Exception):
+            LpReadCache(self._runtime_uid).invalidate_sheet(self._sheet_unique_id)
+        with contextlib.suppress(Exception):
+            LpRangeTracker(self._runtime_uid).mark_sheet_modified(self._sheet_unique_id)
         if not self.is_trigger():
             self.log.debug("Trigger events is False. Not raising SHEET_MODIFIED event.")
             return
@@ -1,24 +1,32 @@
 from __future__ import annotations
 import contextlib
-from typing import Any, Tuple, List, TYPE_CHECKING, Union
+from typing import Any, Dict, Sequence, Tuple, List, TYPE_CHECKING, Union
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 
 if TYPE_CHECKING:
+    from oxt.pythonpath.libre_pythonista_lib.convert.convert_util import ConvertUtil
     from oxt.pythonpath.libre_pythonista_lib.convert import array as convert_array
     from oxt.pythonpath.libre_pythonista_lib.convert import pandas as convert_pandas
     from oxt.pythonpath.libre_pythonista_lib.convert.array import rules as array_rules
     from oxt.pythonpath.libre_pythonista_lib.convert.pandas import pd_rules as pandas_rules
 else:
+    from libre_pythonista_lib.convert.convert_util import ConvertUtil
     from libre_pythonista_lib.convert import array as convert_array
     from libre_pythonista_lib.convert import pandas as convert_pandas
     from libre_pythonista_lib.convert.array import rules as array_rules
     from libre_pythonista_lib.convert.pandas import pd_rules as pandas_rules
 
+# LibreOffice Calc's default epoch
+_LO_EPOCH = datetime(1899, 12, 30)
+
 
 class PandasUtil:
     """Pandas utility class."""
 
+    _array_rules: Dict[bool, convert_array.ArrayRules] = {}
+
     @staticmethod
     def is_dataframe(data: Any) -> bool:  # noqa: ANN401
         """Determines if the data is a pandas DataFrame."""
@@ -70,6 +78,52 @@ class PandasUtil:
         """Returns the index names of a DataFrame."""
         return df.index.tolist()
 
+    @staticmethod
+    def array_to_data_frame(
+        data: Sequence[Sequence[Any]], has_headers: bool = False, float_columns: Sequence[int] = ()
+    ) -> pd.DataFrame:
+        """
+        Converts a 2D array, such as the ``DataArray`` of a cell range, into a DataFrame.
+
+        The rows are read into a single object array and the DataFrame is built column by column.
+        A column that only has ``float`` values is converted to ``float64``, other columns are inferred by pandas.
+        When every column is ``float64`` the DataFrame wraps a single ``float64`` array.
+
+        Args:
+            data (Sequence[Sequence[Any]]): Rows of the array. All rows must have the same length.
+            has_headers (bool, optional): If True, the first row is used for the column names. Defaults to False.
+            float_columns (Sequence[int], optional): Zero-based indexes of the columns that are known to only have
+                numbers, such as date columns found with ``queryContentCells()``. Their values are converted to
+                ``float64`` without checking their type. Defaults to ``()``.
+
+        Returns:
+            pd.DataFrame: The DataFrame.
+        """
+        if not data:
+            return pd.DataFrame()
+        rows = data[1:] if has_headers else data
+        columns = list(data[0]) if has_headers else None
+        if not rows:
+            return pd.DataFrame([], columns=columns)
+        arr = np.array(rows, dtype=object)
+        if arr.ndim != 2:
+            # rows of different lengths.
+            return pd.DataFrame(rows, columns=columns)
+        known = set(float_columns)
+        is_float = [
+            i in known or pd.api.types.infer_dtype(arr[:, i], skipna=False) == "floating" for i in range(arr.shape[1])
+        ]
+        if all(is_float):
+            df = pd.DataFrame(arr.astype(np.float64), copy=False)
+        else:
+            df = pd.DataFrame(
+                {i: arr[:, i].astype(np.float64) if flt else arr[:, i] for i, flt in enumerate(is_float)}, copy=False
+            )
+            df.columns = pd.RangeIndex(arr.shape[1])
+        if columns is not None:
+            df.columns = columns
+        return df
+
     @classmethod
     def pandas_to_array(
         cls, df: pd.DataFrame, *, header_opt: int = 0, index_opt: int = 0, convert: bool = True
@@ -296,7 +350,7 @@ class PandasUtil:
         """Converts date columns to Pandas Timestamp."""
         for col in df.columns:
             if df[col].dtype == "float64":
-                df[col] = df[col].apply(cls.lo_date_to_pandas)
+                df[col] = ConvertUtil.lo_date_series_to_pandas_timestamp(df[col], epoch=_LO_EPOCH)
         return df
 
     @classmethod
@@ -321,7 +375,7 @@ class PandasUtil:
                     raise ValueError("Column name must be a string if DataFrame has no headers.")
                 col_name = col
             if col_name in df.columns and not cls.pandas_is_date_col(df, col_name):
-                df[col_name] = df[col_name].apply(cls.lo_date_to_pandas)
+                df[col_name] = ConvertUtil.lo_date_series_to_pandas_timestamp(df[col_name], epoch=_LO_EPOCH)
         return df
 
     @classmethod
@@ -346,7 +400,7 @@ class PandasUtil:
                     raise ValueError("Column name must be a string if DataFrame has no headers.")
                 col_name = col
             if cls.pandas_is_date_col(df, col_name):
-                df[col_name] = df[col_name].apply(cls.pandas_to_lo_date)
+                df[col_name] = ConvertUtil.pandas_series_to_lo_date(df[col_name], epoch=_LO_EPOCH)
             # df[col] = df[col].apply(cls.pandas_to_lo_date)
         return df
 
@@ -477,6 +531,31 @@ class PandasUtil:
         Note:
             This is best for small arrays such as those from a ``DataFrame.describe()`` method or a card view.
         """
+        arr = cls._get_array_rules(date_str)
+        width = max((len(row) for row in data), default=0)
+        for i in range(width):
+            # resolve the rule once for each type of value in the column.
+            col_rules = {}
+            for row in data:
+                if i < len(row):
+                    cell = row[i]
+                    cell_type = type(cell)
+                    if cell_type not in col_rules:
+                        col_rules[cell_type] = arr.get_matched_rule(cell)
+            if not any(col_rules.values()):
+                # nothing in this column needs converting, such as a column of numbers.
+                continue
+            for row in data:
+                if i < len(row):
+                    rule = col_rules[type(row[i])]
+                    if rule:
+                        row[i] = rule.convert(row[i])
+        return None
+
+    @classmethod
+    def _get_array_rules(cls, date_str: bool) -> convert_array.ArrayRules:
+        if date_str in cls._array_rules:
+            return cls._array_rules[date_str]
         arr = convert_array.ArrayRules()
         if date_str:
             arr.add_rule(array_rules.RulePdTimeStampIso)
@@ -484,13 +563,8 @@ class PandasUtil:
             arr.add_rule(array_rules.RulePdTimeCalcNumDate)
         arr.add_rule(array_rules.RuleNone)
         arr.add_rule(array_rules.RuleNotKnown)
-
-        for row in data:
-            for i, cell in enumerate(row):
-                rule = arr.get_matched_rule(cell)
-                if rule:
-                    row[i] = rule.convert(cell)
-        return None
+        cls._array_rules[date_str] = arr
+        return arr
 
     @classmethod
     def pandas_is_date_col(cls, df: pd.DataFrame, col: Union[str, int]) -> bool:
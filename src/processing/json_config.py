@@ -122,6 +122,11 @@ class JsonConfig(metaclass=Singleton):
         except Exception:
             self._log_indent = 0
 
+        try:
+            self._log_async = cast(bool, self._cfg["tool"]["oxt"]["config"]["log_async"])
+        except Exception:
+            self._log_async = False
+
         try:
             self._require_install_name_match = cast(
                 bool, self._cfg["tool"]["oxt"]["config"]["require_install_name_match"]
@@ -178,6 +183,14 @@ class JsonConfig(metaclass=Singleton):
         except Exception:
             self._calc_props_json_name = "_calc_props.json"
 
+        try:
+            self._calc_cell_index_json_name = cast(
+                str,
+                self._cfg["tool"]["libre_pythonista"]["config"]["calc_cell_index_json_name"],
+            )
+        except Exception:
+            self._calc_cell_index_json_name = "_cell_index.json"
+
         try:
             self._lp_code_dir = cast(str, self._cfg["tool"]["libre_pythonista"]["config"]["lp_code_dir"])
         except Exception:
@@ -277,6 +290,21 @@ class JsonConfig(metaclass=Singleton):
         except Exception:
             self._pip_shared_dirs = ["bin", "lib", "include", "inc", "docs", "config"]
 
+        try:
+            self._pip_batch_install = cast(bool, self._cfg["tool"]["oxt"]["config"]["pip_batch_install"])
+        except Exception:
+            self._pip_batch_install = False
+
+        try:
+            self._pip_wheelhouse = cast(str, self._cfg["tool"]["oxt"]["config"]["pip_wheelhouse"])
+        except Exception:
+            self._pip_wheelhouse = ""
+
+        try:
+            self._zip_bytecode_cache = cast(bool, self._cfg["tool"]["oxt"]["config"]["zip_bytecode_cache"])
+        except Exception:
+            self._zip_bytecode_cache = False
+
         # region Requirements Rule
         # Access a specific table
         try:
@@ -344,6 +372,7 @@ class JsonConfig(metaclass=Singleton):
         json_config["run_imports_win"] = self._run_imports_win
         # json_config["log_pip_installs"] = self._log_pip_installs
         json_config["log_indent"] = self._log_indent
+        json_config["log_async"] = self._log_async
         # update the requirements
         json_config["requirements"] = self._requirements
 
@@ -357,6 +386,7 @@ class JsonConfig(metaclass=Singleton):
         json_config["cell_cp_codename"] = f"{self._cell_custom_prop_prefix}{self._cell_custom_prop_codename}"
         json_config["general_code_name"] = self._general_codename
         json_config["calc_props_json_name"] = self._calc_props_json_name
+        json_config["calc_cell_index_json_name"] = self._calc_cell_index_json_name
         json_config["lp_code_dir"] = self._lp_code_dir
         json_config["lp_default_log_format"] = self._lp_default_log_format
         json_config["extension_version"] = self._extension_version
@@ -368,6 +398,9 @@ class JsonConfig(metaclass=Singleton):
         json_config["py_script_sheet_on_calculate"] = self._py_script_sheet_on_calculate
         json_config["no_pip_remove"] = self._no_pip_remove
         json_config["pip_shared_dirs"] = self._pip_shared_dirs
+        json_config["pip_batch_install"] = self._pip_batch_install
+        json_config["pip_wheelhouse"] = self._pip_wheelhouse
+        json_config["zip_bytecode_cache"] = self._zip_bytecode_cache
 
         json_config["flatpak_libre_pythonista_py_editor"] = self._flatpak_libre_pythonista_py_editor
         json_config["flatpak_libre_pythonista_py_editor_cell_cmd"] = self._flatpak_libre_pythonista_py_editor_cell_cmd
@@ -440,6 +473,7 @@ class JsonConfig(metaclass=Singleton):
         assert isinstance(self._uninstall_on_update, bool), "uninstall_on_update must be a bool"
         assert isinstance(self._unload_after_install, bool), "unload_after_install must be a bool"
         assert isinstance(self._log_indent, int), "log_indent must be a int"
+        assert isinstance(self._log_async, bool), "log_async must be a bool"
         assert isinstance(self._install_on_no_uninstall_permission, bool), (
             "_install_on_no_uninstall_permission must be a bool"
         )
@@ -453,6 +487,7 @@ class JsonConfig(metaclass=Singleton):
         assert isinstance(self._cell_custom_prop_codename, str), "cell_custom_prop_codename must be a string"
         assert isinstance(self._general_codename, str), "general_codename must be a string"
         assert isinstance(self._calc_props_json_name, str), "calc_props_json_name must be a string"
+        assert isinstance(self._calc_cell_index_json_name, str), "calc_cell_index_json_name must be a string"
         assert isinstance(self._lp_code_dir, str), "lp_code_dir must be a string"
         assert isinstance(self._lp_default_log_format, str), "log format must be a string"
         assert self._lp_default_log_format, "lp_default_log_format must not be an empty string"
@@ -463,6 +498,9 @@ class JsonConfig(metaclass=Singleton):
             assert isinstance(pip_dir, str), "pip_shared_dirs must be a list of strings"
             assert len(pip_dir) > 0, "pip_shared_dirs must not be an empty string"
             assert not has_whitespace(pip_dir), "pip_shared_dirs must not contain whitespace"
+        assert isinstance(self._pip_batch_install, bool), "pip_batch_install must be a bool"
+        assert isinstance(self._pip_wheelhouse, str), "pip_wheelhouse must be a string"
+        assert isinstance(self._zip_bytecode_cache, bool), "zip_bytecode_cache must be a bool"
 
         # validate the extension version is a valid python version
         assert self._extension_version.count(".") == 2, "extension_version must contain two periods"
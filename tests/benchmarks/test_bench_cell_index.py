@@ -0,0 +1,106 @@
+"""
+Benchmarks for navigating code cells with the sorted cell index.
+
+Benchmarks are skipped unless the ``LP_BENCHMARK`` environment variable is set to ``1``.
+
+Example:
+    LP_BENCHMARK=1 pytest tests/benchmarks/test_bench_cell_index.py -s
+"""
+
+from __future__ import annotations
+from typing import List, Tuple, TYPE_CHECKING
+import os
+import random
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+pytestmark = pytest.mark.skipif(os.environ.get("LP_BENCHMARK") != "1", reason="LP_BENCHMARK is not set")
+
+
+def _get_keys(count: int) -> List[Tuple[int, int, int]]:
+    # code cells spread over 3 sheets and 4 columns.
+    return [(i % 3, i // 12, (i // 3) % 4) for i in range(count)]
+
+
+@pytest.mark.parametrize("count", [10_000])
+def test_bench_cell_index_lookup(build_setup, count: int) -> None:
+    from sortedcontainers import SortedDict
+    from ooodev.utils.data_type.cell_obj import CellObj
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.cell_index import CellIndex
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.cell_index import CellIndex
+
+    keys = _get_keys(count)
+    data = SortedDict({key: None for key in keys})
+    index = CellIndex()
+    for key in keys:
+        index.add(key, CellObj.from_idx(col_idx=key[2], row_idx=key[1], sheet_idx=key[0]))
+
+    rnd = random.Random(1)
+    lookups = [rnd.choice(keys) for _ in range(1_000)]
+
+    # previous implementation, rebuild the key list and scan it for each lookup.
+    start = time.perf_counter()
+    for key in lookups:
+        lst = list(data.keys())
+        i = lst.index(key)
+        _ = lst[i + 1] if i + 1 < len(lst) else None
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in lookups:
+        i = index.index_of(key)
+        _ = index.get_next_key(key)
+    index_time = time.perf_counter() - start
+
+    for key in lookups[:100]:
+        assert index.index_of(key) == list(data.keys()).index(key)
+    print(
+        f"\nindex-of + next count={count:,} lookups={len(lookups):,}: "
+        f"scan {scan_time * 1000:.1f} ms, index {index_time * 1000:.1f} ms"
+    )
+
+
+@pytest.mark.parametrize("count", [10_000])
+def test_bench_cell_index_insert_delete(build_setup, count: int) -> None:
+    from ooodev.utils.data_type.cell_obj import CellObj
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.cell_index import CellIndex
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.cell_index import CellIndex
+
+    keys = _get_keys(count)
+    rnd = random.Random(1)
+    changes = rnd.sample(keys, 1_000)
+    cell = CellObj.from_cell("A1")
+
+    # previous implementation, renumber every cell after each change.
+    items = {key: [i] for i, key in enumerate(keys)}
+    start = time.perf_counter()
+    for key in changes:
+        del items[key]
+        items[key] = [-1]
+        for i, props in enumerate(items.values()):
+            props[0] = i
+    renumber_time = time.perf_counter() - start
+
+    index = CellIndex()
+    for key in keys:
+        index.add(key, cell)
+    start = time.perf_counter()
+    for key in changes:
+        index.remove(key)
+        index.add(key, cell)
+    index_time = time.perf_counter() - start
+
+    assert len(index) == count
+    print(
+        f"\ndelete + insert count={count:,} changes={len(changes):,}: "
+        f"renumber {renumber_time * 1000:.1f} ms, index {index_time * 1000:.1f} ms"
+    )
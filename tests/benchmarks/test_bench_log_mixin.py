@@ -0,0 +1,91 @@
+"""
+Benchmarks for creating loggers and logging.
+
+Benchmarks are skipped unless the ``LP_BENCHMARK`` environment variable is set to ``1``.
+
+Example:
+    LP_BENCHMARK=1 pytest tests/benchmarks/test_bench_log_mixin.py -s
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import logging
+import os
+import time
+from logging.handlers import TimedRotatingFileHandler
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+pytestmark = pytest.mark.skipif(os.environ.get("LP_BENCHMARK") != "1", reason="LP_BENCHMARK is not set")
+
+
+@pytest.mark.parametrize("count", [1_000, 10_000])
+def test_bench_logger_create(loader, build_setup, count: int) -> None:
+    if TYPE_CHECKING:
+        from oxt.___lo_pip___.oxt_logger import OxtLogger
+        from oxt.pythonpath.libre_pythonista_lib.log.log_mixin import get_class_logger
+    else:
+        from ___lo_pip___.oxt_logger import OxtLogger
+        from libre_pythonista_lib.log.log_mixin import get_class_logger
+
+    start = time.perf_counter()
+    for _ in range(count):
+        OxtLogger(log_name="BenchLogger", trigger=False)
+    new_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(count):
+        log = get_class_logger("BenchLogger")
+    cached_time = time.perf_counter() - start
+
+    assert log is get_class_logger("BenchLogger")
+    print(f"\nlogger create count={count:,}: new {new_time * 1000:.1f} ms, cached {cached_time * 1000:.1f} ms")
+
+
+def _get_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    log = logging.Logger(name, level=logging.DEBUG)
+    log.addHandler(handler)
+    log.propagate = False
+    return log
+
+
+@pytest.mark.parametrize("count", [10_000, 100_000])
+def test_bench_log_call(build_setup, tmp_path, count: int) -> None:
+    if TYPE_CHECKING:
+        from oxt.___lo_pip___.oxt_logger import oxt_logger
+    else:
+        from ___lo_pip___.oxt_logger import oxt_logger
+
+    fmt = "%(asctime)s - %(levelname)s - %(name)s: %(message)s"
+
+    def get_file_handler(log_file: str) -> logging.Handler:
+        handler = TimedRotatingFileHandler(log_file, when="W0", interval=1, backupCount=3, encoding="utf8", delay=True)
+        handler.setFormatter(logging.Formatter(fmt))
+        handler.setLevel(logging.DEBUG)
+        return handler
+
+    sync_handler = get_file_handler(str(tmp_path / "sync.log"))
+    async_handler = get_file_handler(str(tmp_path / "async.log"))
+    sync_log = _get_logger("BenchSync", sync_handler)
+    async_log = _get_logger("BenchAsync", oxt_logger._get_queue_handler([async_handler]))
+
+    try:
+        start = time.perf_counter()
+        for i in range(count):
+            sync_log.debug("Message %i of %s", i, "sync")
+        sync_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(count):
+            async_log.debug("Message %i of %s", i, "async")
+        async_time = time.perf_counter() - start
+    finally:
+        oxt_logger.stop_listeners()
+        sync_handler.close()
+        async_handler.close()
+
+    with open(tmp_path / "async.log", encoding="utf8") as f:
+        assert sum(1 for _ in f) == count
+    print(f"\nlog call count={count:,}: sync {sync_time * 1000:.1f} ms, queue {async_time * 1000:.1f} ms")
@@ -0,0 +1,88 @@
+"""
+Benchmarks for reading a cell range into a DataFrame.
+
+Benchmarks are skipped unless the ``LP_BENCHMARK`` environment variable is set to ``1``.
+
+Example:
+    LP_BENCHMARK=1 pytest tests/benchmarks/test_bench_pandas_data_obj.py -s
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import os
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+pytestmark = pytest.mark.skipif(os.environ.get("LP_BENCHMARK") != "1", reason="LP_BENCHMARK is not set")
+
+_COLS = 10
+
+
+def _get_rows(cell_count: int, numeric: bool) -> list:
+    rows = []
+    for r in range(cell_count // _COLS):
+        row = [float(r * c) for c in range(_COLS)]
+        if not numeric:
+            row[-1] = f"s{r}"
+        rows.append(tuple(row))
+    return rows
+
+
+@pytest.mark.parametrize("cell_count", [10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize("numeric", [True, False])
+def test_bench_array_to_data_frame(build_setup, cell_count: int, numeric: bool) -> None:
+    import pandas as pd
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.utils.pandas_util import PandasUtil
+    else:
+        from libre_pythonista_lib.utils.pandas_util import PandasUtil
+
+    headers = tuple(f"col{c}" for c in range(_COLS))
+    data = tuple([headers] + _get_rows(cell_count, numeric))
+
+    start = time.perf_counter()
+    expected = pd.DataFrame(data[1:], columns=data[0])
+    row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    df = PandasUtil.array_to_data_frame(data, has_headers=True)
+    new_time = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(df, expected)
+    print(
+        f"\narray_to_data_frame cells={cell_count:,} numeric={numeric}: "
+        f"row wise {row_time * 1000:.1f} ms, column wise {new_time * 1000:.1f} ms"
+    )
+
+
+@pytest.mark.parametrize("cell_count", [10_000, 100_000, 1_000_000])
+def test_bench_get_data_frame(loader, build_setup, cell_count: int) -> None:
+    from ooodev.calc import CalcDoc
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.data.pandas_data_obj import PandasDataObj
+    else:
+        from libre_pythonista_lib.data.pandas_data_obj import PandasDataObj
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        headers = [f"col{c}" for c in range(_COLS)]
+        rows = _get_rows(cell_count, numeric=True)
+        sheet.set_array(values=[headers] + [list(row) for row in rows], name="A1")
+        cell_rng = sheet.get_range(range_name=f"A1:J{len(rows) + 1}")
+
+        start = time.perf_counter()
+        df = PandasDataObj(cell_rng=cell_rng).get_data_frame()
+        read_time = time.perf_counter() - start
+
+        assert df.shape == (len(rows), _COLS)
+        print(f"\nget_data_frame cells={cell_count:,}: {read_time * 1000:.1f} ms")
+    finally:
+        if doc is not None:
+            doc.close(True)
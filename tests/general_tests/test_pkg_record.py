@@ -0,0 +1,132 @@
+from __future__ import annotations
+from pathlib import Path
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.install.pkg_installers.pkg_record import PkgRecord
+
+
+def _write_dist(target: Path, name: str, version: str, entries: list) -> None:
+    dist_info = target / f"{name}-{version}.dist-info"
+    dist_info.mkdir(parents=True)
+    lines = [f"{entry},sha256=abc,10" for entry in entries]
+    lines.append(f"{dist_info.name}/RECORD,,")
+    (dist_info / "RECORD").write_text("\n".join(lines), encoding="utf-8")
+
+
+def test_get_data(tmp_path: Path) -> None:
+    _write_dist(
+        tmp_path,
+        "ooo_dev_tools",
+        "0.53.4",
+        ["ooodev/__init__.py", "ooodev/calc/__init__.py", "__pycache__/x.pyc", "../../bin/ooodev", "six.py"],
+    )
+    # scripts of a --target install are moved to the bin directory of the target.
+    (tmp_path / "bin").mkdir()
+    (tmp_path / "bin" / "ooodev").write_text("", encoding="utf-8")
+    record = PkgRecord(tmp_path, ["bin", "lib"])
+    assert record.find_dist_info("ooo-dev-tools") == tmp_path / "ooo_dev_tools-0.53.4.dist-info"
+    assert record.find_dist_info("numpy") is None
+    data = record.get_data(["OOO.Dev_Tools", "numpy"])
+    assert data == {
+        "new_dirs": ["ooo_dev_tools-0.53.4.dist-info", "ooodev"],
+        "new_files": ["six.py"],
+        "new_bin_files": ["ooodev"],
+        "new_lib_files": [],
+    }
+
+
+def test_get_data_shared_dirs(tmp_path: Path) -> None:
+    (tmp_path / "existing").mkdir()
+    (tmp_path / "bin").mkdir()
+    (tmp_path / "bin" / "old").write_text("", encoding="utf-8")
+    existing = PkgRecord.get_snapshot(tmp_path, ["bin", "share"])
+    assert existing == {"existing", "bin", "bin/old"}
+
+    _write_dist(
+        tmp_path,
+        "ns_a",
+        "1.0",
+        ["ns/a/__init__.py", "existing/a.py", "a_pkg/__init__.py", "../../share/x", "../../bin/old"],
+    )
+    _write_dist(tmp_path, "ns_b", "1.0", ["ns/b/__init__.py"])
+    (tmp_path / "share").mkdir()
+    (tmp_path / "share" / "x").write_text("", encoding="utf-8")
+    record = PkgRecord(tmp_path, ["bin", "share"], existing)
+    data = record.get_data(["ns_a"])
+    # ns is shared with ns_b and existing was there before the install, only their files are owned.
+    assert data["new_dirs"] == ["a_pkg", "ns_a-1.0.dist-info"]
+    assert data["new_files"] == ["existing/a.py", "ns/a/__init__.py"]
+    # bin/old existed before the install.
+    assert data["new_bin_files"] == []
+    assert data["new_share_files"] == ["x"]
+
+    # a path outside of the target is not moved into the target.
+    other = tmp_path / "other"
+    _write_dist(other, "ns_c", "1.0", ["../../share/y"])
+    (other / "share").mkdir()
+    (other / "share" / "z").write_text("", encoding="utf-8")
+    data = PkgRecord(other, ["share"]).get_data(["ns_c"])
+    assert data["new_dirs"] == ["ns_c-1.0.dist-info"]
+    assert data["new_share_files"] == []
+
+
+@pytest.mark.parametrize(
+    "requirement,expected",
+    [
+        pytest.param("numpy>=1.20", "numpy", id="version"),
+        pytest.param('pytz (>=2020.1) ; python_version >= "3.8"', "pytz", id="marker"),
+        pytest.param("pytest ; extra == 'test'", "", id="extra"),
+    ],
+)
+def test_get_requirement_name(requirement: str, expected: str) -> None:
+    assert PkgRecord.get_requirement_name(requirement) == expected
+
+
+def test_get_owners() -> None:
+    def item(name: str, requires: list) -> dict:
+        return {"metadata": {"name": name, "version": "1.0", "requires_dist": requires}, "requested": False}
+
+    report = {
+        "install": [
+            item("seaborn", ["numpy>=1.20", "matplotlib", "pandas"]),
+            item("matplotlib", ["numpy", "pillow", "pip"]),
+            item("pandas", ["numpy", "pytz", "pytest ; extra == 'test'"]),
+            item("numpy", []),
+            item("pillow", []),
+            item("pytz", []),
+            item("pytest", []),
+            item("sortedcontainers", []),
+            item("pip", []),
+        ]
+    }
+    owners = PkgRecord.get_owners(report, ["seaborn", "pandas", "sortedcontainers", "verr"], exclude=["pip"])
+    # numpy is needed by seaborn and pandas, it owns itself.
+    # pytest is only required by an extra, it owns itself.
+    assert owners == {
+        "seaborn": ["matplotlib", "pillow", "seaborn"],
+        "pandas": ["pandas", "pytz"],
+        "sortedcontainers": ["sortedcontainers"],
+        "verr": ["verr"],
+        "numpy": ["numpy"],
+        "pytest": ["pytest"],
+    }
+
+
+def test_get_owners_unreached() -> None:
+    def item(name: str, requires: list) -> dict:
+        return {"metadata": {"name": name, "version": "1.0", "requires_dist": requires}, "requested": False}
+
+    # kiwisolver is a dependency of matplotlib, which was already installed and is not in the report.
+    report = {"install": [item("seaborn", ["matplotlib"]), item("kiwisolver", [])]}
+    owners = PkgRecord.get_owners(report, ["seaborn"])
+    assert owners == {"seaborn": ["seaborn"], "kiwisolver": ["kiwisolver"]}
+
+
+def test_is_report_supported() -> None:
+    assert PkgRecord.is_report_supported("24.3.1")
+    assert PkgRecord.is_report_supported("22.2")
+    assert not PkgRecord.is_report_supported("22.1.2")
+    assert not PkgRecord.is_report_supported("")
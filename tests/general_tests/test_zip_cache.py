@@ -0,0 +1,65 @@
+from __future__ import annotations
+from pathlib import Path
+import os
+import sys
+import zipfile
+import pytest
+from typing import TYPE_CHECKING
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def _write_zip(pth: Path, value: int) -> None:
+    with zipfile.ZipFile(pth, "w") as zf:
+        zf.writestr("lp_zip_mod/__init__.py", f"VALUE = {value}\n")
+
+
+def test_zip_cache(tmp_path: Path, monkeypatch, mocker: MockerFixture, build_setup) -> None:
+    _ = mocker.patch("libre_pythonista.lo_util.zip_cache.OxtLogger")
+
+    if TYPE_CHECKING:
+        from ...oxt.___lo_pip___.lo_util.zip_cache import ZipCache
+    else:
+        from libre_pythonista.lo_util.zip_cache import ZipCache
+
+    zip_file = tmp_path / "pure.zip"
+    _write_zip(zip_file, 1)
+    old_version = tmp_path / "cache" / "0.9.0"
+    old_version.mkdir(parents=True)
+
+    cache = ZipCache(tmp_path / "cache", "1.0.0")
+    cache.clean()
+    assert not old_version.exists()
+
+    pth = cache.get_path(zip_file)
+    assert pth == tmp_path / "cache" / "1.0.0" / "pure"
+    assert (pth / "lp_zip_mod" / "__init__.py").is_file()
+    # modules are compiled when extracted.
+    assert list((pth / "lp_zip_mod" / "__pycache__").glob("__init__.*.pyc"))
+
+    monkeypatch.syspath_prepend(str(pth))
+    monkeypatch.delitem(sys.modules, "lp_zip_mod", raising=False)
+    import lp_zip_mod  # type: ignore
+
+    assert lp_zip_mod.VALUE == 1
+    monkeypatch.delitem(sys.modules, "lp_zip_mod")
+
+    # the extracted directory is reused while the zip file is the same.
+    marker = pth / ZipCache.MARKER
+    mtime = marker.stat().st_mtime_ns
+    assert cache.get_path(zip_file) == pth
+    assert marker.stat().st_mtime_ns == mtime
+
+    # a changed zip file is extracted again.
+    _write_zip(zip_file, 2)
+    st = zip_file.stat()
+    os.utime(zip_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert cache.get_path(zip_file) == pth
+    assert "VALUE = 2" in (pth / "lp_zip_mod" / "__init__.py").read_text()
+
+    # the zip file is used when it can not be extracted.
+    assert cache.get_path(tmp_path / "missing.zip") == tmp_path / "missing.zip"
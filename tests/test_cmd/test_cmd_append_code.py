@@ -170,3 +170,68 @@ def test_cmd_append_code_empty(loader, build_setup) -> None:
     finally:
         if doc is not None:
             doc.close(True)
+
+
+def test_cmd_update_code_refresh_coalesce(loader, build_setup) -> None:
+    from ooodev.calc import CalcDoc
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module import PyModule
+        from oxt.pythonpath.libre_pythonista_lib.cq.cmd.calc.sheet.cell.state.cmd_append_code import CmdAppendCode
+        from oxt.pythonpath.libre_pythonista_lib.cq.cmd.calc.sheet.cell.state.cmd_update_code import CmdUpdateCode
+        from oxt.pythonpath.libre_pythonista_lib.cq.cmd.calc.sheet.cell.state.cmd_refresh_control import (
+            CmdRefreshControl,
+        )
+        from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_handler import CmdHandler
+        from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_handler_factory import CmdHandlerFactory
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module import PyModule
+        from libre_pythonista_lib.cq.cmd.calc.sheet.cell.state.cmd_append_code import CmdAppendCode
+        from libre_pythonista_lib.cq.cmd.calc.sheet.cell.state.cmd_update_code import CmdUpdateCode
+        from libre_pythonista_lib.cq.cmd.calc.sheet.cell.state.cmd_refresh_control import CmdRefreshControl
+        from libre_pythonista_lib.cq.cmd.cmd_handler import CmdHandler
+        from libre_pythonista_lib.cq.cmd.cmd_handler_factory import CmdHandlerFactory
+
+    doc = None
+    # commands executed by other commands use the factory handler, so it must be the same handler.
+    cmd_handler = CmdHandler()
+    CmdHandlerFactory.set_cmd_handler(cmd_handler)
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        cell = sheet[0, 0]
+        mod = PyModule()
+
+        def edit(cmd: Any) -> None:  # noqa: ANN401
+            # same sequence as the Python cell editor, each code change is followed by a control refresh.
+            cmd_handler.handle(cmd)
+            assert cmd.success
+            refresh = CmdRefreshControl(cell=cell, mod=mod)
+            cmd_handler.handle(refresh)
+            assert refresh.success
+
+        initial_code = "x = 42"
+        append = CmdAppendCode(cell=cell, mod=mod, code=initial_code)
+        edit(append)
+        py_src_mgr = append._qry_py_src_mgr()
+
+        edit(CmdUpdateCode(cell=cell, mod=mod, code="y = 1"))
+        count = cmd_handler.undo_count
+
+        edit(CmdUpdateCode(cell=cell, mod=mod, code="y = 2"))
+        edit(CmdUpdateCode(cell=cell, mod=mod, code="y = 3"))
+        assert cmd_handler.undo_count == count
+        assert py_src_mgr[cell.cell_obj].source_code == "y = 3"
+
+        # undo the refresh and then the merged code updates.
+        cmd_handler.undo()
+        cmd_handler.undo()
+        assert py_src_mgr[cell.cell_obj].source_code == initial_code
+
+        cmd_handler.redo()
+        assert py_src_mgr[cell.cell_obj].source_code == "y = 3"
+
+    finally:
+        CmdHandlerFactory.reset()
+        if doc is not None:
+            doc.close(True)
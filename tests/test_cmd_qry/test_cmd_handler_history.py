@@ -0,0 +1,90 @@
+from __future__ import annotations
+from typing import Any, Dict, TYPE_CHECKING
+import pytest
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def _get_cmd_class() -> Any:  # noqa: ANN401
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_base import CmdBase
+    else:
+        from libre_pythonista_lib.cq.cmd.cmd_base import CmdBase
+
+    class CmdSetValue(CmdBase):
+        def __init__(self, state: Dict[str, int], key: str, value: int) -> None:
+            CmdBase.__init__(self)
+            self.state = state
+            self.key = key
+            self.value = value
+            self.prev = None
+            self.text = "x" * 1000
+
+        def execute(self) -> None:
+            if self.prev is None:
+                self.prev = self.state.get(self.key, 0)
+            self.state[self.key] = self.value
+            self.success = True
+
+        def undo(self) -> None:
+            self.state[self.key] = self.prev
+
+        def coalesce(self, cmd: Any) -> bool:  # noqa: ANN401
+            if isinstance(cmd, CmdSetValue) and cmd.key == self.key:
+                self.value = cmd.value
+                return True
+            return False
+
+    return CmdSetValue
+
+
+def test_cmd_handler_coalesce(build_setup) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_handler import CmdHandler
+    else:
+        from libre_pythonista_lib.cq.cmd.cmd_handler import CmdHandler
+
+    CmdSetValue = _get_cmd_class()  # noqa: N806
+    state = {}
+    handler = CmdHandler()
+    for value in (1, 2, 3):
+        handler.handle(CmdSetValue(state, "a", value))
+    assert handler.undo_count == 1
+    assert state["a"] == 3
+
+    handler.undo()
+    assert state["a"] == 0
+    handler.redo()
+    assert state["a"] == 3
+
+    handler.handle(CmdSetValue(state, "b", 1))
+    assert handler.undo_count == 2
+
+
+def test_cmd_handler_limits(build_setup) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_handler import CmdHandler
+    else:
+        from libre_pythonista_lib.cq.cmd.cmd_handler import CmdHandler
+
+    CmdSetValue = _get_cmd_class()  # noqa: N806
+    state = {}
+    handler = CmdHandler(max_history=3, max_history_bytes=0)
+    for i in range(5):
+        handler.handle(CmdSetValue(state, f"k{i}", i))
+    assert handler.undo_count == 3
+
+    # the oldest commands are removed.
+    handler.undo_all()
+    assert state == {"k0": 0, "k1": 1, "k2": 0, "k3": 0, "k4": 0}
+
+    handler.clear_history()
+    handler.max_history = 0
+    for i in range(5):
+        handler.handle(CmdSetValue(state, f"k{i}", i))
+    assert handler.undo_count == 5
+    handler.max_history_bytes = handler.undo_bytes // 2
+    assert 0 < handler.undo_count < 5
+    assert handler.undo_bytes <= handler.max_history_bytes
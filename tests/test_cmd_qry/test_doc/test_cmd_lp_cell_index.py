@@ -0,0 +1,80 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_cmd_lp_cell_index(loader, build_setup) -> None:
+    from ooodev.calc import CalcDoc
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.cq.cmd.calc.doc.cmd_lp_cell_index import CmdLpCellIndex
+        from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.doc.qry_lp_cell_index import QryLpCellIndex
+        from oxt.pythonpath.libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan import QryLpCellsScan
+        from oxt.pythonpath.libre_pythonista_lib.cq.qry.config.qry_cell_cp_codename import QryCellCpCodeName
+        from oxt.pythonpath.libre_pythonista_lib.cq.cmd.cmd_handler_factory import CmdHandlerFactory
+        from oxt.pythonpath.libre_pythonista_lib.cq.qry.qry_handler_factory import QryHandlerFactory
+    else:
+        from libre_pythonista_lib.cq.cmd.calc.doc.cmd_lp_cell_index import CmdLpCellIndex
+        from libre_pythonista_lib.cq.qry.calc.doc.qry_lp_cell_index import QryLpCellIndex
+        from libre_pythonista_lib.cq.qry.calc.sheet.lp_cells.qry_lp_cells_scan import QryLpCellsScan
+        from libre_pythonista_lib.cq.qry.config.qry_cell_cp_codename import QryCellCpCodeName
+        from libre_pythonista_lib.cq.cmd.cmd_handler_factory import CmdHandlerFactory
+        from libre_pythonista_lib.cq.qry.qry_handler_factory import QryHandlerFactory
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        qry_handler = QryHandlerFactory.get_qry_handler()
+        cmd_handler = CmdHandlerFactory.get_cmd_handler()
+        filter_key = qry_handler.handle(QryCellCpCodeName())
+
+        # added out of order, the scan returns the cells sorted by row and column.
+        names = {"B2": "id_b2", "A1": "id_a1", "C1": "id_c1"}
+        for addr, code_name in names.items():
+            cell = sheet[addr]
+            cell.set_custom_property(filter_key, code_name)
+            cell.set_custom_property("other", 1)
+
+        qry = QryLpCellsScan(sheet=sheet, filter_key=filter_key)
+        cells, sheet_index = qry_handler.handle(qry)
+        assert [str(co) for co in cells] == ["A1", "C1", "B2"]
+        for co, props in cells.items():
+            assert props.code_name == names[str(co)]
+            assert filter_key in props.props
+            assert "other" in props.props
+        assert [props.index for props in cells.values()] == [0, 1, 2]
+        assert qry.reads == 3
+
+        cmd = CmdLpCellIndex(doc=doc)
+        cmd_handler.handle(cmd)
+        assert cmd.success
+
+        stored = qry_handler.handle(QryLpCellIndex(doc))
+        assert stored[sheet.name] == sheet_index
+
+        # a valid index supplies the code names, the controls are not read again.
+        qry = QryLpCellsScan(sheet=sheet, filter_key=filter_key, sheet_index=stored[sheet.name])
+        cached_cells, _ = qry_handler.handle(qry)
+        assert qry.reads == 0
+        assert cached_cells == cells
+
+        # a new cell invalidates the index of the sheet.
+        sheet["A3"].set_custom_property(filter_key, "id_a3")
+        qry = QryLpCellsScan(sheet=sheet, filter_key=filter_key, sheet_index=stored[sheet.name])
+        cells, _ = qry_handler.handle(qry)
+        assert qry.reads == 4
+        code_names = {str(co): props.code_name for co, props in cells.items()}
+        assert code_names["A3"] == "id_a3"
+
+        # shapes that are unnamed, not control shapes or not anchored to a cell are skipped.
+        _ = sheet.draw_page.draw_rectangle(x=10, y=10, width=20, height=20)
+        qry = QryLpCellsScan(sheet=sheet, filter_key=filter_key)
+        cells, _ = qry_handler.handle(qry)
+        assert [str(co) for co in cells] == ["A1", "C1", "B2", "A3"]
+    finally:
+        if doc is not None:
+            doc.close(True)
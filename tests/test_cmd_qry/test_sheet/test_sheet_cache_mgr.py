@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+import pytest
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_sheet_cache_mgr(loader, build_setup) -> None:
+    from ooodev.calc import CalcDoc
+    from ooodev.events.args.event_args import EventArgs
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.cache.calc.sheet.sheet_cache_mgr import SheetCacheMgr
+        from oxt.pythonpath.libre_pythonista_lib.event.shared_event import SharedEvent
+    else:
+        from libre_pythonista_lib.cache.calc.sheet.sheet_cache_mgr import SheetCacheMgr
+        from libre_pythonista_lib.event.shared_event import SharedEvent
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        mgr = SheetCacheMgr(sheet)
+        assert mgr is SheetCacheMgr(sheet)
+        cache = mgr.sheet_cache
+        se = SharedEvent(doc)
+
+        cache["key1"] = 1
+        cache["key2"] = 2
+        cache["key3"] = 3
+        mgr.register_key("key1", "test_event_a")
+        mgr.register_key("key1", "test_event_b")
+        mgr.register_key("key2", "test_event_a")
+        mgr.register_key("key3", "test_event_b")
+        mgr.unregister_key("key3", "test_event_b")
+
+        se.trigger_event("test_event_a", EventArgs(object()))
+        assert "key1" not in cache
+        assert "key2" not in cache
+        assert "key3" in cache
+        assert mgr.evictions == 2
+
+        # key1 was removed by test_event_a and key3 was unregistered.
+        se.trigger_event("test_event_b", EventArgs(object()))
+        assert "key3" in cache
+        stats = mgr.get_stats()
+        assert stats["evictions"] == 2
+        assert stats["registered_keys"] == 0
+        assert stats["event_names"] == 0
+    finally:
+        if doc is not None:
+            doc.close(True)
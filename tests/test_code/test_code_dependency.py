@@ -0,0 +1,167 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_code_dependency_names(build_setup) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import (
+            get_code_dependency,
+        )
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import get_code_dependency
+
+    code = """
+import numpy as np
+def fn(a):
+    t = a + y
+    return t
+lst.append(3)
+df["a"] = 2
+x = fn(z)
+x
+"""
+    dep = get_code_dependency(code)
+    assert not dep.is_opaque
+    assert dep.binds == frozenset({"np", "fn", "x"})
+    assert dep.mutates == frozenset({"lst", "df"})
+    assert {"y", "z", "lst", "df"} <= dep.reads
+    # function local names are not module level bindings.
+    assert "t" not in dep.writes
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        ("exec('x = 1')"),
+        ("from math import *"),
+        ("def fn():\n    global x\n    x = 1"),
+        ("x = "),
+    ],
+)
+def test_code_dependency_opaque(build_setup, code: str) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import (
+            get_code_dependency,
+        )
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import get_code_dependency
+
+    assert get_code_dependency(code).is_opaque
+
+
+def test_code_dependency_lp(build_setup) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import (
+            get_code_dependency,
+            LpRef,
+        )
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import get_code_dependency, LpRef
+
+    dep = get_code_dependency("df = lp('Sheet1.B2:C10')\nv = lp('A1')")
+    assert not dep.lp_unresolved
+    assert dep.lp_refs == (
+        LpRef(sheet="Sheet1", col_start=1, row_start=1, col_end=2, row_end=9),
+        LpRef(sheet="", col_start=0, row_start=0, col_end=0, row_end=0),
+    )
+
+    dep = get_code_dependency("df = lp('MyNamedRange')")
+    assert dep.lp_unresolved
+
+
+def test_dependency_graph_dirty_keys(build_setup) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency_graph import (
+            CodeDependencyGraph,
+        )
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency_graph import CodeDependencyGraph
+
+    graph = CodeDependencyGraph(sheet_names={"Sheet1": 0, "Sheet2": 1})
+    graph.add((0, 0, 0), "a = 1")
+    graph.add((0, 1, 0), "b = 2")
+    graph.add((0, 2, 0), "c = a + 1")
+    graph.add((0, 3, 0), "d = b + c")
+    graph.add((0, 4, 0), "e = lp('A1')")
+    graph.add((0, 5, 0), "f = lp('Sheet2.A1:B5')")
+
+    result = graph.get_dirty_keys((0, 0, 0))
+    assert result.is_safe
+    assert result.keys == [(0, 0, 0), (0, 2, 0), (0, 3, 0), (0, 4, 0)]
+
+    result = graph.get_dirty_keys((0, 1, 0))
+    assert result.keys == [(0, 1, 0), (0, 3, 0)]
+
+    # names written by the previous code are also changed.
+    result = graph.get_dirty_keys((0, 1, 0), prev_code="b = 2\na = 3")
+    assert result.keys == [(0, 1, 0), (0, 2, 0), (0, 3, 0)]
+
+
+def test_dependency_graph_mutate(build_setup) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency_graph import (
+            CodeDependencyGraph,
+        )
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency_graph import CodeDependencyGraph
+
+    graph = CodeDependencyGraph()
+    graph.add((0, 0, 0), "lst = []")
+    graph.add((0, 1, 0), "x = 1")
+    graph.add((0, 2, 0), "lst.append(x)\ncount = len(lst)")
+    graph.add((0, 3, 0), "plt.plot([1, 2])\nplt.show()")
+
+    # lst was created by a cell that is not executed again and would be appended to twice.
+    assert not graph.get_dirty_keys((0, 1, 0)).is_safe
+    # lst is created again before it is mutated.
+    assert graph.get_dirty_keys((0, 0, 0)).is_safe
+    assert graph.get_dirty_keys((0, 3, 0), ignore_mutates=["plt"]).is_safe
+
+
+def test_dependency_graph_mutate_last_expr(build_setup) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import (
+            get_code_dependency,
+        )
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency_graph import (
+            CodeDependencyGraph,
+        )
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency import get_code_dependency
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency_graph import CodeDependencyGraph
+
+    # the last expression is the value of the cell, a method call is still a mutation.
+    assert get_code_dependency("x = 1\nlst.append(3)").mutates == frozenset({"lst"})
+    assert get_code_dependency("df.drop(columns=['a'], inplace=True)").mutates == frozenset({"df"})
+
+    graph = CodeDependencyGraph()
+    graph.add((0, 0, 0), "lst = []")
+    graph.add((0, 1, 0), "lst.append(3)")
+    assert not graph.get_dirty_keys((0, 1, 0)).is_safe
+    assert graph.get_dirty_keys((0, 0, 0)).is_safe
+
+
+def test_dependency_graph_calls(build_setup) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency_graph import (
+            CodeDependencyGraph,
+        )
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.code_dependency_graph import CodeDependencyGraph
+
+    graph = CodeDependencyGraph()
+    graph.add((0, 0, 0), "from math import sqrt\nlst = []\ndef add(v):\n    lst.append(v)")
+    graph.add((0, 1, 0), "add(1)")
+    graph.add((0, 2, 0), "import random\nrandom.shuffle(lst)")
+    graph.add((0, 3, 0), "v = sqrt(4)\nn = len([v])")
+
+    # add() of another cell mutates lst in place.
+    assert not graph.get_dirty_keys((0, 1, 0)).is_safe
+    # lst of another cell is passed to a call.
+    assert not graph.get_dirty_keys((0, 2, 0), ignore_mutates=["random"]).is_safe
+    # imported functions and builtins of another cell are safe to call.
+    assert graph.get_dirty_keys((0, 3, 0)).is_safe
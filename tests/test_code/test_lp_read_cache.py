@@ -0,0 +1,63 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_lp_read_cache(loader, build_setup) -> None:
+    import pandas as pd
+    from ooodev.calc import CalcDoc
+    from ooodev.utils.data_type.range_obj import RangeObj
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_read_cache import (
+            LpReadCache,
+        )
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_read_cache import LpReadCache
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        cache = LpReadCache(doc.runtime_uid)
+        assert cache is LpReadCache(doc.runtime_uid)
+        cache.clear()
+
+        rng = RangeObj.from_range("A1:B3")
+        key = LpReadCache.get_key("sheet1", rng, False, None)
+        assert key is not None
+        assert cache.get(key) is None
+
+        df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+        cache.put(key, df, headers=True, req_range=rng, range_obj=rng)
+        # changes to the DataFrame that was read do not change the cache.
+        df.loc[0, "a"] = 100
+        item = cache.get(key)
+        assert item is not None
+        assert item.headers
+        assert item.data.loc[0, "a"] == 1
+        # changes to the DataFrame that is returned do not change the cache.
+        item.data.loc[0, "a"] = 200
+        item = cache.get(key)
+        assert item is not None
+        assert item.data.loc[0, "a"] == 1
+        assert cache.hits == 2
+        assert cache.misses == 1
+
+        # column types are part of the key.
+        assert LpReadCache.get_key("sheet1", rng, False, {"a": "int"}) != key
+
+        cache.invalidate_range("sheet2", RangeObj.from_range("A1:Z100"))
+        cache.invalidate_range("sheet1", RangeObj.from_range("C1:D10"))
+        assert key in cache
+        cache.invalidate_range("sheet1", RangeObj.from_range("B3:D10"))
+        assert key not in cache
+
+        cache.put(key, df, headers=True, req_range=rng, range_obj=rng)
+        cache.invalidate_sheet("sheet1")
+        assert key not in cache
+    finally:
+        if doc is not None:
+            doc.close(True)
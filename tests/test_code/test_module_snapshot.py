@@ -0,0 +1,47 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_snapshot_delta(build_setup) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.module_snapshot import ModuleSnapshot
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.module_snapshot import ModuleSnapshot
+
+    big = list(range(10))
+    mod_dict = {"np": object(), "big": big, "x": 1}
+    root = ModuleSnapshot.from_dict(mod_dict)
+
+    mod_dict["x"] = 2
+    mod_dict["y"] = 3
+    del mod_dict["np"]
+    snap = ModuleSnapshot.from_dict(mod_dict, root)
+    # only the names that changed are stored.
+    assert dict(snap.changes) == {"x": 2, "y": 3}
+    assert snap.deleted == frozenset({"np"})
+    assert snap["big"] is big
+    assert "np" not in snap
+    assert snap.to_dict() == mod_dict
+    # the parent is not changed.
+    assert root["x"] == 1
+    assert "np" in root
+    assert len(root) == 3
+
+
+def test_snapshot_flatten(build_setup) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.module_snapshot import ModuleSnapshot
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.module_snapshot import ModuleSnapshot
+
+    mod_dict = {"a": 0}
+    snap = ModuleSnapshot.from_dict(mod_dict)
+    for i in range(ModuleSnapshot.MAX_DEPTH * 2 + 1):
+        mod_dict[f"v{i}"] = i
+        snap = ModuleSnapshot.from_dict(mod_dict, snap)
+        assert snap.depth <= ModuleSnapshot.MAX_DEPTH
+        assert snap.to_dict() == mod_dict
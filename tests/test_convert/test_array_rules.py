@@ -0,0 +1,43 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_array_rules_type_cache(build_setup) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.convert.array import ArrayRules
+        from oxt.pythonpath.libre_pythonista_lib.convert.array import rules as array_rules
+    else:
+        from libre_pythonista_lib.convert.array import ArrayRules
+        from libre_pythonista_lib.convert.array import rules as array_rules
+
+    arr = ArrayRules()
+    arr.add_rule(array_rules.RuleNone)
+    arr.add_rule(array_rules.RuleNotKnown)
+
+    rule = arr.get_matched_rule(None)
+    assert isinstance(rule, array_rules.RuleNone)
+    # the same instance is used for every value of the same type.
+    assert arr.get_matched_rule(None) is rule
+    assert arr.get_matched_rule(1.5) is None
+    assert isinstance(arr.get_matched_rule(object()), array_rules.RuleNotKnown)
+
+    arr.remove_rule(array_rules.RuleNone)
+    assert isinstance(arr.get_matched_rule(None), array_rules.RuleNotKnown)
+
+
+def test_convert_array_to_lo(build_setup) -> None:
+    import pandas as pd
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.utils.pandas_util import PandasUtil
+    else:
+        from libre_pythonista_lib.utils.pandas_util import PandasUtil
+
+    ts = pd.Timestamp("2024-01-01 12:00:00")
+    data = [["a", "b", "c"], [1.5, None, ts], [2.5, "x", ts]]
+    PandasUtil.convert_array_to_lo(data)
+    assert data == [["a", "b", "c"], [1.5, "", ts.isoformat()], [2.5, "x", ts.isoformat()]]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from datetime import datetime
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_pandas_series_to_lo_date(build_setup) -> None:
+    import pandas as pd
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.convert.convert_util import ConvertUtil
+    else:
+        from libre_pythonista_lib.convert.convert_util import ConvertUtil
+
+    epoch = datetime(1899, 12, 30)
+    series = pd.Series(pd.to_datetime(["2024-01-01 11:59:59", "2024-01-01 12:00:00", "1850-05-05 13:00:01"]))
+    expected = [ConvertUtil._pandas_to_lo_date(value, epoch) for value in series]
+    assert ConvertUtil.pandas_series_to_lo_date(series, epoch=epoch).tolist() == expected
+
+    # timezone is removed and NaT becomes NaN
+    series = series.dt.tz_localize("UTC")
+    series[1] = pd.NaT
+    result = ConvertUtil.pandas_series_to_lo_date(series, epoch=epoch)
+    assert result[0] == expected[0]
+    assert pd.isna(result[1])
+
+
+def test_lo_date_series_to_pandas_timestamp(build_setup) -> None:
+    import numpy as np
+    import pandas as pd
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.convert.convert_util import ConvertUtil
+    else:
+        from libre_pythonista_lib.convert.convert_util import ConvertUtil
+
+    epoch = datetime(1899, 12, 30)
+    series = pd.Series([45292.5, 1.25, -3.75, np.nan])
+    result = ConvertUtil.lo_date_series_to_pandas_timestamp(series, epoch=epoch)
+    assert result[0] == pd.Timestamp("2024-01-01 12:00:00")
+    assert result[1] == pd.Timestamp("1899-12-31 06:00:00")
+    assert result[2] == pd.Timestamp("1899-12-26 06:00:00")
+    assert pd.isna(result[3])
+
+
+def test_pandas_series_to_iso8601(build_setup) -> None:
+    import pandas as pd
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.convert.convert_util import ConvertUtil
+    else:
+        from libre_pythonista_lib.convert.convert_util import ConvertUtil
+
+    series = pd.Series(pd.to_datetime(["2024-01-01 11:59:59", "2024-01-02 00:00:00"]))
+    expected = [value.isoformat() for value in series]
+    assert ConvertUtil.pandas_series_to_iso8601(series).tolist() == expected
@@ -0,0 +1,118 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_fig_cache(build_setup, tmp_path) -> None:
+    import matplotlib
+
+    matplotlib.use("svg")
+    from matplotlib import pyplot as plt
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.cache.fig_cache import FigCache
+    else:
+        from libre_pythonista_lib.cache.fig_cache import FigCache
+
+    cache = FigCache(tmp_path / "fig")
+
+    def make_fig(values: list) -> plt.Figure:
+        fig, ax = plt.subplots()
+        ax.plot(values)
+        ax.set_title("Test")
+        return fig
+
+    fig = make_fig([1, 2, 3])
+    pth1 = cache.get_file(fig)
+    plt.close(fig)
+    assert pth1.exists()
+    mtime = pth1.stat().st_mtime_ns
+
+    # same data and properties give the same file, the file is not written again.
+    fig = make_fig([1, 2, 3])
+    pth2 = cache.get_file(fig)
+    plt.close(fig)
+    assert pth2 == pth1
+    assert pth2.stat().st_mtime_ns == mtime
+
+    fig = make_fig([3, 2, 1])
+    pth3 = cache.get_file(fig)
+    plt.close(fig)
+    assert pth3 != pth1
+
+    stats = cache.get_stats()
+    assert stats["files"] == 2
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+    # a new instance picks up the existing files.
+    cache = FigCache(tmp_path / "fig")
+    assert cache.get_stats()["files"] == 2
+
+    cache.clear()
+    assert not pth1.exists()
+    assert not pth3.exists()
+
+
+def test_fig_cache_evict(build_setup, tmp_path) -> None:
+    import matplotlib
+
+    matplotlib.use("svg")
+    from matplotlib import pyplot as plt
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.cache.fig_cache import FigCache
+    else:
+        from libre_pythonista_lib.cache.fig_cache import FigCache
+
+    cache = FigCache(tmp_path / "fig", max_size=1)
+    paths = []
+    for i in range(3):
+        fig, ax = plt.subplots()
+        ax.plot([i, i + 1])
+        paths.append(cache.get_file(fig))
+        plt.close(fig)
+
+    # the last file is kept even when it is larger than the maximum size.
+    assert not paths[0].exists()
+    assert not paths[1].exists()
+    assert paths[2].exists()
+    stats = cache.get_stats()
+    assert stats["files"] == 1
+    assert stats["evictions"] == 2
+
+
+def test_fig_cache_format(build_setup, tmp_path) -> None:
+    import matplotlib
+
+    matplotlib.use("svg")
+    from matplotlib import pyplot as plt
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.cache.fig_cache import FigCache
+    else:
+        from libre_pythonista_lib.cache.fig_cache import FigCache
+
+    cache = FigCache(tmp_path / "fig")
+
+    fig, ax = plt.subplots()
+    ax.plot([1, 2, 3])
+    assert FigCache.get_point_count(fig) == 3
+    assert FigCache.get_format(fig) == "svg"
+    assert FigCache.get_format(fig, "png") == "png"
+    pth = cache.get_file(fig, "png", dpi=50)
+    assert pth.suffix == ".png"
+    assert pth.read_bytes().startswith(b"\x89PNG")
+    # same figure and dpi give the same file.
+    assert cache.get_file(fig, "png", dpi=50) == pth
+    assert cache.get_file(fig, "png", dpi=60) != pth
+    plt.close(fig)
+
+    fig, ax = plt.subplots()
+    ax.scatter(range(FigCache.PNG_POINTS + 1), range(FigCache.PNG_POINTS + 1))
+    assert FigCache.get_format(fig) == "png"
+    assert cache.get_file(fig, "auto").suffix == ".png"
+    plt.close(fig)
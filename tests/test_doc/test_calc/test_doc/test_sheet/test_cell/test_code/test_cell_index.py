@@ -0,0 +1,48 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_cell_index(build_setup) -> None:
+    from ooodev.utils.data_type.cell_obj import CellObj
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.cell_index import CellIndex
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.cell_index import CellIndex
+
+    cells = [(1, "A1"), (0, "B2"), (0, "A1"), (0, "C1"), (1, "B1"), (0, "A3")]
+    index = CellIndex((sheet_idx, CellObj.from_cell(name)) for sheet_idx, name in cells)
+    assert len(index) == 6
+    # row first, then column
+    assert list(index) == [(0, 0, 0), (0, 0, 2), (0, 1, 1), (0, 2, 0), (1, 0, 0), (1, 0, 1)]
+
+    b2 = CellIndex.to_key(CellObj.from_cell("B2"), 0)
+    assert b2 == (0, 1, 1)
+    assert index.index_of(b2) == 2
+    assert index.get_key(2) == b2
+    assert index.get_cell(b2) == CellObj.from_cell("B2")
+    assert index.get_next_key(b2) == (0, 2, 0)
+    assert index.get_prev_key(b2) == (0, 0, 2)
+
+    # keys that are not in the index
+    a2 = CellIndex.to_key(CellObj.from_cell("A2"), 0)
+    assert index.index_of(a2) == -1
+    assert index.get_next_key(a2) == (0, 1, 1)
+    assert index.get_prev_key(a2) == (0, 0, 2)
+    assert index.get_prev_key((0, 0, 0)) is None
+    assert index.get_next_key((1, 0, 1)) is None
+
+    assert index.get_sheet_bounds(0) == (0, 4)
+    assert index.get_sheet_bounds(1) == (4, 6)
+    assert index.get_sheet_count(2) == 0
+    assert list(index.get_sheet_keys(1)) == [(1, 0, 0), (1, 0, 1)]
+
+    assert index.remove(b2)
+    assert not index.remove(b2)
+    assert index.index_of((0, 2, 0)) == 2
+    index.add(b2, CellObj.from_cell("B2"))
+    assert index.index_of((0, 2, 0)) == 3
@@ -262,3 +262,107 @@ def test_singleton_behavior(loader, build_setup) -> None:
     finally:
         if doc is not None:
             doc.close(True)
+
+
+def test_source_cache(py_source_manager: PySourceManager) -> None:
+    from ooodev.utils.data_type.cell_obj import CellObj
+
+    code = "x = 42"
+    cell_obj = CellObj.from_idx(col_idx=0, row_idx=0, sheet_idx=0)
+    py_source_manager.add_source(code, cell_obj)
+    src_cache = py_source_manager.src_cache
+    py_src = py_source_manager[cell_obj]
+    assert py_src.uri in src_cache
+
+    hits = src_cache.hits
+    misses = src_cache.misses
+    assert py_src.source_code == code
+    assert src_cache.hits == hits + 1
+    assert src_cache.misses == misses
+
+    py_source_manager.update_source("x = 100", cell_obj)
+    assert src_cache.get(py_src.uri) == "x = 100"
+
+    py_source_manager.remove_source(cell_obj)
+    assert py_src.uri not in src_cache
+
+
+def test_is_source_current(py_source_manager: PySourceManager) -> None:
+    from ooodev.utils.data_type.cell_obj import CellObj
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_read_cache import (
+            LpReadCache,
+        )
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lp_read_cache import LpReadCache
+
+    cell_obj = CellObj.from_idx(col_idx=0, row_idx=0, sheet_idx=0)
+    py_source_manager.add_source("x = 42", cell_obj)
+    assert py_source_manager.is_source_current(cell_obj, "x = 42")
+    assert not py_source_manager.is_source_current(cell_obj, "x = 43")
+
+    # code that does not read the sheet is current after the sheet is modified.
+    read_cache = LpReadCache(py_source_manager.doc.runtime_uid)
+    read_cache.invalidate_sheet("")
+    assert py_source_manager.is_source_current(cell_obj, "x = 42")
+
+    cell_obj2 = CellObj.from_idx(col_idx=0, row_idx=1, sheet_idx=0)
+    py_source_manager.add_source("y = lp('B1')", cell_obj2)
+    assert py_source_manager.is_source_current(cell_obj2, "y = lp('B1')")
+    # the range that is read has not changed.
+    read_cache.invalidate_sheet("")
+    assert py_source_manager.is_source_current(cell_obj2, "y = lp('B1')")
+
+    sheet = py_source_manager.doc.sheets[0]
+    sheet.set_val(value=10, cell_name="C1")
+    assert py_source_manager.is_source_current(cell_obj2, "y = lp('B1')")
+    sheet.set_val(value=10, cell_name="B1")
+    assert not py_source_manager.is_source_current(cell_obj2, "y = lp('B1')")
+
+    py_source_manager.update_source("y = lp('B1')", cell_obj2)
+    assert py_source_manager.is_source_current(cell_obj2, "y = lp('B1')")
+
+    # lp() with an address that is not a literal depends on any change.
+    cell_obj3 = CellObj.from_idx(col_idx=0, row_idx=2, sheet_idx=0)
+    py_source_manager.add_source("addr = 'B1'\nz = lp(addr)", cell_obj3)
+    read_cache.invalidate_sheet("")
+    assert not py_source_manager.is_source_current(cell_obj3, "addr = 'B1'\nz = lp(addr)")
+
+
+def test_is_source_current_hash_collision(py_source_manager: PySourceManager) -> None:
+    from ooodev.utils.data_type.cell_obj import CellObj
+
+    # hash(-1.0) == hash(-2.0), the change must still be detected.
+    sheet = py_source_manager.doc.sheets[0]
+    sheet.set_val(value=-1, cell_name="B1")
+    cell_obj = CellObj.from_idx(col_idx=0, row_idx=0, sheet_idx=0)
+    py_source_manager.add_source("y = lp('B1')", cell_obj)
+    assert py_source_manager.is_source_current(cell_obj, "y = lp('B1')")
+    sheet.set_val(value=-2, cell_name="B1")
+    assert not py_source_manager.is_source_current(cell_obj, "y = lp('B1')")
+
+
+def test_get_stale_cells(py_source_manager: PySourceManager) -> None:
+    from ooodev.utils.data_type.cell_obj import CellObj
+
+    cell_obj = CellObj.from_idx(col_idx=0, row_idx=0, sheet_idx=0)
+    cell_obj2 = CellObj.from_idx(col_idx=0, row_idx=1, sheet_idx=0)
+    py_source_manager.add_source("x = 42", cell_obj)
+    py_source_manager.add_source("y = lp('B1')", cell_obj2)
+    assert py_source_manager.get_stale_cells() == []
+
+    sheet = py_source_manager.doc.sheets[0]
+    sheet.set_val(value=10, cell_name="B1")
+    assert py_source_manager.get_stale_cells() == [cell_obj2]
+
+    py_source_manager.update_source("y = lp('B1')", cell_obj2)
+    assert py_source_manager.get_stale_cells() == []
+
+
+def test_load_timings(py_source_manager: PySourceManager) -> None:
+    timings = py_source_manager.load_timings
+    assert timings["collect"] >= 0.0
+    assert timings["register"] >= 0.0
+    # no sources so the load stage thread is not started.
+    assert "ready" not in timings
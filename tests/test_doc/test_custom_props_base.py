@@ -0,0 +1,64 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+from pytest_mock import MockerFixture
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_custom_props_batch(build_setup, mocker: MockerFixture) -> None:
+    if TYPE_CHECKING:
+        from oxt.___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+        from oxt.pythonpath.libre_pythonista_lib.doc_props.custom_props_base import CustomPropsBase
+    else:
+        from ___lo_pip___.oxt_logger.oxt_logger import OxtLogger
+        from libre_pythonista_lib.doc_props.custom_props_base import CustomPropsBase
+
+    class Props(CustomPropsBase):
+        def _get_log(self) -> OxtLogger:
+            return OxtLogger(log_name=self.__class__.__name__)
+
+        def _is_doc_props_ready(self) -> bool:
+            return True
+
+    mock_read = mocker.patch.object(CustomPropsBase, "_get_custom_properties", return_value={"a": 1})
+    mock_save = mocker.patch.object(CustomPropsBase, "_save_properties")
+
+    props = Props(doc=mocker.Mock(), file_name="test_props", props_id="test_props")
+    assert props.get_custom_property("a") == 1
+    assert props.get_custom_property("a") == 1
+    # the file is only read once.
+    assert mock_read.call_count == 1
+
+    props.set_custom_property("b", 2)
+    assert mock_save.call_count == 1
+
+    with props.batch():
+        props.set_custom_property("c", 3)
+        with props.batch():
+            props.set_custom_property("d", 4)
+            props.remove_custom_property("a")
+        assert props.in_batch
+        assert props.get_custom_property("d") == 4
+        assert mock_save.call_count == 1
+    assert not props.in_batch
+    assert mock_save.call_count == 2
+    mock_save.assert_called_with({"b": 2, "c": 3, "d": 4})
+
+    # nothing changed, nothing written.
+    with props.batch():
+        pass
+    assert mock_save.call_count == 2
+
+    # an exception rolls back the batch.
+    with pytest.raises(ValueError):
+        with props.batch():
+            props.set_custom_property("e", 5)
+            raise ValueError("test")
+    assert not props.has_custom_property("e")
+    assert mock_save.call_count == 2
+
+    props.reload()
+    assert mock_read.call_count == 2
+    assert props.get_custom_property("a") == 1
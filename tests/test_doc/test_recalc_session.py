@@ -0,0 +1,113 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_recalc_session(build_setup, loader) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.recalc_session import RecalcSession
+    else:
+        from libre_pythonista_lib.doc.recalc_session import RecalcSession
+
+    from ooodev.calc import CalcDoc
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+
+        session = RecalcSession(doc)
+        assert session is RecalcSession(doc)
+
+        assert session.enter(0, "A1") is True
+        assert session.enter_sheet(0) is True
+        assert session.enter(0, "A2") is False
+        assert session.enter_sheet(0) is False
+        assert session.enter(1, "A1") is False
+        assert session.enter_sheet(1) is True
+
+        # a formula that is called again starts a new pass.
+        assert session.enter(0, "A1") is True
+        assert session.enter_sheet(0) is True
+        stats = session.get_stats()
+        assert stats["passes"] == 2
+        assert stats["calls"] == 4
+        assert stats["cells"] == 1
+    finally:
+        if doc is not None:
+            doc.close(False)
+
+
+def test_recalc_session_slow_cell(build_setup, loader, monkeypatch) -> None:
+    import time
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.recalc_session import RecalcSession
+    else:
+        from libre_pythonista_lib.doc.recalc_session import RecalcSession
+
+    from ooodev.calc import CalcDoc
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        monkeypatch.setattr(RecalcSession, "PASS_TIMEOUT", 0.05)
+
+        session = RecalcSession(doc)
+        assert session.enter(0, "A1") is True
+        # a cell that takes longer than the timeout does not end the pass.
+        time.sleep(0.1)
+        session.leave()
+        assert session.enter(0, "A2") is False
+        session.leave()
+
+        # no call for longer than the timeout starts a new pass.
+        time.sleep(0.1)
+        assert session.enter(0, "A3") is True
+    finally:
+        if doc is not None:
+            doc.close(False)
+
+
+def test_recalc_session_update_stale(build_setup, loader, mocker: MockerFixture) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.recalc_session import RecalcSession
+    else:
+        from libre_pythonista_lib.doc.recalc_session import RecalcSession
+
+    from ooodev.calc import CalcDoc
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        facade = mocker.patch("libre_pythonista_lib.doc.calc.doc.sheet.cell.cell_item_facade.CellItemFacade")
+        py_src_mgr = mocker.MagicMock()
+        py_src_mgr.get_stale_cells.return_value = ["A1", "A2"]
+
+        session = RecalcSession(doc)
+        session.enter(0, "A1")
+        assert session.update_stale(py_src_mgr) == 2
+        assert facade.return_value.auto_update.call_count == 2
+        assert session.is_updating is False
+
+        # the stale cells are only updated once per pass.
+        session.enter(0, "A2")
+        assert session.update_stale(py_src_mgr) == 0
+        assert py_src_mgr.get_stale_cells.call_count == 1
+
+        # a failed sweep is tried again in the same pass.
+        session.enter(0, "A1")
+        py_src_mgr.get_stale_cells.side_effect = [RuntimeError("error"), ["A3"]]
+        assert session.update_stale(py_src_mgr) == 0
+        assert session.update_stale(py_src_mgr) == 1
+        assert session.update_stale(py_src_mgr) == 0
+        assert session.get_stats()["updated_cells"] == 3
+    finally:
+        if doc is not None:
+            doc.close(False)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+from typing import Any, List, TYPE_CHECKING
+import logging
+import os
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_event_log_handler(build_setup) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.log.event_log_handler import EventLogHandler
+    else:
+        from libre_pythonista_lib.log.event_log_handler import EventLogHandler
+
+    events: List[Any] = []
+
+    def on_log_emit(src: Any, event: Any) -> None:  # noqa: ANN401
+        events.append(event.event_data)
+
+    handler = EventLogHandler(uid="test", max_records=3)
+    handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+    handler.setLevel(logging.INFO)
+    handler.subscribe_event("log_emit", on_log_emit)
+    logger = logging.getLogger("test_event_log_handler")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    # the main thread callback is not used, records are flushed when emitted after the interval.
+    handler._async_callback = False
+    try:
+        # records below the level of the handler are not buffered.
+        logger.debug("skipped")
+        # the first record is due and is flushed on the emitting thread.
+        logger.info("line 0")
+        assert len(events) == 1
+        assert events[0].log_msg == "INFO - line 0"
+
+        # records within the interval are buffered.
+        for i in range(1, 6):
+            logger.info("line %i", i)
+        assert len(events) == 1
+        handler.flush()
+        assert len(events) == 2
+        lines = events[1].log_msg.split(os.linesep)
+        assert lines == ["WARNING - 2 log records were dropped.", "INFO - line 3", "INFO - line 4", "INFO - line 5"]
+
+        # records are formatted when emitted.
+        data = [1]
+        logger.info("data %s", data)
+        data.append(2)
+        handler.flush()
+        assert events[2].log_msg == "INFO - data [1]"
+
+        # a record emitted after the interval flushes the pending records.
+        time.sleep(EventLogHandler.FLUSH_INTERVAL)
+        logger.info("due")
+        assert len(events) == 4
+        assert events[3].log_msg == "INFO - due"
+
+        handler.flush()
+        assert len(events) == 4
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module import PyModule
+
+
+def test_code_cache(py_mod: PyModule) -> None:
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.rules.assign import Assign
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.rules.assign import Assign
+
+    py_mod.clear_code_cache()
+    code = """
+a = 2
+b = a * 3
+"""
+    result = py_mod.update_with_result(code)
+    assert isinstance(py_mod._current_match_rule, Assign)
+    assert result.data == 6
+    hits = py_mod._code_cache.hits
+
+    py_mod.reset_module()
+    result = py_mod.update_with_result(code)
+    assert py_mod._code_cache.hits == hits + 1
+    assert isinstance(py_mod._current_match_rule, Assign)
+    assert result.data == 6
+    # the cached AST still contains the trailing assignment.
+    assert py_mod._current_ast_mod is not None
+    assert len(py_mod._current_ast_mod.body) == 2
+
+
+def test_code_cache_syntax_error(py_mod: PyModule) -> None:
+    py_mod.clear_code_cache()
+    assert py_mod.execute_code("x = ", py_mod.mod.__dict__) is None
+    assert len(py_mod._code_cache) == 0
@@ -34,3 +34,79 @@ def test_import_py_module(loader, build_setup, mocker: MockerFixture) -> None:
     finally:
         if doc is not None:
             doc.close(True)
+
+
+def test_lazy_modules(loader, build_setup, mocker: MockerFixture) -> None:  # noqa: ANN001
+    from ooodev.calc import CalcDoc
+
+    _ = mocker.patch("libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module.BreakMgr")
+    _ = mocker.patch("libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module.LibrePythonistaLog")
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module import PyModule
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lazy_module import LazyModule
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module import PyModule
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lazy_module import LazyModule
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        inst = PyModule()
+        np_mod = inst.mod.__dict__["np"]
+        assert isinstance(np_mod, LazyModule)
+        assert not np_mod.is_loaded
+        assert "numpy" not in inst.import_timings
+
+        inst.execute_code("x = int(np.array([1, 2, 3]).sum())", inst.mod.__dict__)
+        assert inst.mod.__dict__["x"] == 6
+        assert np_mod.is_loaded
+        assert "numpy" in inst.import_timings
+        # the placeholder is replaced by the real module.
+        assert not isinstance(inst.mod.__dict__["np"], LazyModule)
+    finally:
+        if doc is not None:
+            doc.close(True)
+
+
+def test_pyplot_imported_by_cell(loader, build_setup, mocker: MockerFixture) -> None:  # noqa: ANN001
+    from ooodev.calc import CalcDoc
+
+    _ = mocker.patch("libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module.BreakMgr")
+    _ = mocker.patch("libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module.LibrePythonistaLog")
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module import PyModule
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.py_module import PyModule
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        inst = PyModule()
+        # pyplot imported by the cell itself, not through the plt placeholder.
+        inst.execute_code(
+            "import matplotlib\nimport matplotlib.pyplot as mpl_plt\nbackend = matplotlib.get_backend()",
+            inst.mod.__dict__,
+        )
+        assert inst.mod.__dict__["backend"].lower() == "svg"
+        # plt.show() is patched so the figure is captured.
+        assert hasattr(inst.mod.__dict__["mpl_plt"].show, "__wrapped__")
+    finally:
+        if doc is not None:
+            doc.close(True)
+
+
+def test_lazy_module_forwards_attributes(build_setup) -> None:  # noqa: ANN001
+    import json
+
+    if TYPE_CHECKING:
+        from oxt.pythonpath.libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lazy_module import LazyModule
+    else:
+        from libre_pythonista_lib.doc.calc.doc.sheet.cell.code.mod_helper.lazy_module import LazyModule
+
+    lazy = LazyModule("json", lambda: json)
+    assert not lazy.is_loaded
+    assert lazy.__doc__ == json.__doc__
+    assert lazy.__spec__ is json.__spec__
+    assert lazy.is_loaded
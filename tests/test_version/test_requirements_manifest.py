@@ -0,0 +1,63 @@
+from __future__ import annotations
+from pathlib import Path
+import os
+import sys
+import pytest
+from typing import TYPE_CHECKING
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def _write_dist(site: Path, name: str, version: str) -> Path:
+    dist_info = site / f"{name}-{version}.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n", encoding="utf-8")
+    return dist_info
+
+
+def test_requirements_manifest(tmp_path: Path, monkeypatch, mocker: MockerFixture, build_setup) -> None:
+    _ = mocker.patch("libre_pythonista.install.requirements_manifest.OxtLogger")
+
+    if TYPE_CHECKING:
+        from ...oxt.___lo_pip___.install.requirements_manifest import RequirementsManifest
+    else:
+        from libre_pythonista.install.requirements_manifest import RequirementsManifest
+
+    site = tmp_path / "site-packages"
+    dist_info = _write_dist(site, "lp_manifest_pkg", "1.2.3")
+    monkeypatch.syspath_prepend(str(site))
+
+    entry = RequirementsManifest.get_entry("lp_manifest_pkg")
+    assert entry is not None
+    assert entry["version"] == "1.2.3"
+    assert entry["site"] == str(site)
+    assert RequirementsManifest.get_entry("lp_manifest_pkg_missing") is None
+
+    key = RequirementsManifest.get_key({"requirements": {"lp_manifest_pkg": ">=1.0"}})
+    assert key == RequirementsManifest.get_key({"requirements": {"lp_manifest_pkg": ">=1.0"}})
+    assert key != RequirementsManifest.get_key({"requirements": {"lp_manifest_pkg": ">=2.0"}})
+
+    manifest = RequirementsManifest(tmp_path / "manifest.json")
+    assert manifest.is_valid(key) is False
+    assert manifest.save(key, ["lp_manifest_pkg"]) is True
+    assert manifest.is_valid(key) is True
+    assert manifest.is_valid("other") is False
+
+    # a package that is not installed is never saved.
+    assert manifest.save(key, ["lp_manifest_pkg", "lp_manifest_pkg_missing"]) is False
+    assert not manifest.manifest_file.exists()
+
+    # reinstalling the package changes the dist-info directory.
+    assert manifest.save(key, ["lp_manifest_pkg"]) is True
+    mtime = dist_info.stat().st_mtime_ns
+    os.utime(dist_info, ns=(mtime + 1_000_000_000, mtime + 1_000_000_000))
+    assert manifest.is_valid(key) is False
+
+    # site-packages that is no longer in sys.path.
+    assert manifest.save(key, ["lp_manifest_pkg"]) is True
+    monkeypatch.setattr(sys, "path", [p for p in sys.path if p != str(site)])
+    assert manifest.is_valid(key) is False